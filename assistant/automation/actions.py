@@ -1,20 +1,19 @@
 from __future__ import annotations
 
 import logging
-import os
-import platform
-import subprocess
 import webbrowser
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Protocol
 
+from assistant.automation import launcher
+
 
 class Action(Protocol):
     def execute(self) -> None: ...
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class OpenBrowserAction:
     url: str = "https://www.google.com"
 
@@ -22,7 +21,7 @@ class OpenBrowserAction:
         webbrowser.open(self.url)
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class OpenFileAction:
     file_path: str
 
@@ -30,26 +29,22 @@ class OpenFileAction:
         path = Path(self.file_path).expanduser()
         if not path.exists():
             raise FileNotFoundError(f"File not found: {path}")
-        if platform.system() == "Windows":
-            os.startfile(path)  # type: ignore[attr-defined]
-        elif platform.system() == "Darwin":
-            subprocess.run(["open", str(path)], check=False)
-        else:
-            subprocess.run(["xdg-open", str(path)], check=False)
+        launcher.open_path(path)
 
 
+@dataclass(slots=True, frozen=True)
 class ShutdownPCAction:
     def execute(self) -> None:
-        system = platform.system()
+        system = launcher.system()
         if system == "Windows":
-            subprocess.run(["shutdown", "/s", "/t", "5"], check=False)
+            launcher.spawn(["shutdown", "/s", "/t", "5"])
         elif system == "Darwin":
-            subprocess.run(["osascript", "-e", 'tell app "System Events" to shut down'], check=False)
+            launcher.spawn(["osascript", "-e", 'tell app "System Events" to shut down'])
         else:
-            subprocess.run(["shutdown", "-h", "+1"], check=False)
+            launcher.spawn(["shutdown", "-h", "+1"])
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class PlayMusicAction:
     path: str = "~/Music"
 
@@ -57,7 +52,7 @@ class PlayMusicAction:
         OpenFileAction(self.path).execute()
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class SwitchWindowAction:
     logger: logging.Logger
 
@@ -65,7 +60,7 @@ class SwitchWindowAction:
         try:
             import pyautogui
 
-            if platform.system() == "Darwin":
+            if launcher.system() == "Darwin":
                 pyautogui.hotkey("command", "tab")
             else:
                 pyautogui.hotkey("alt", "tab")
@@ -73,7 +68,7 @@ class SwitchWindowAction:
             self.logger.warning("Unable to switch window: %s", exc)
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class TypeTextAction:
     text: str
     logger: logging.Logger
@@ -1,36 +1,73 @@
 from __future__ import annotations
 
-import importlib.util
 import logging
+from concurrent.futures import Future
 from pathlib import Path
-from typing import Callable, Dict, List
+from typing import Any, Callable, Dict, List, Optional
 
 from assistant.automation.actions import Action
+from assistant.automation.executor import ActionExecutor
+from assistant.automation.pipeline import Pipeline, PipelineResult, PipelineRun
+from assistant.automation.plugins import PluginCatalog, import_plugin
 
 
 class AutomationEngine:
-    """Executes single actions and chained action pipelines."""
+    """Executes single actions and dependency-ordered action pipelines.
 
-    def __init__(self) -> None:
+    Actions run on the executor's thread pool; ``execute`` returns a future
+    immediately so callers never block on an action. Pipeline steps whose
+    dependencies are satisfied run concurrently on the same pool.
+    """
+
+    def __init__(self, executor: ActionExecutor | None = None) -> None:
         self._logger = logging.getLogger(self.__class__.__name__)
-        self._pipelines: Dict[str, List[Action]] = {}
+        self._executor = executor or ActionExecutor()
+        self._pipelines: Dict[str, Pipeline] = {}
+        self.plugin_phrases: Dict[str, str] = {}
+        self.plugins: PluginCatalog | None = None
+
+    def execute(self, action: Action, timeout: float | None = None) -> "Future[Any]":
+        name = action.__class__.__name__
+        self._logger.info("Executing action %s", name)
+        return self._executor.submit(name, action.execute, timeout=timeout)
+
+    def submit(self, name: str, fn: Callable[[], Any], timeout: float | None = None) -> "Future[Any]":
+        """Run an arbitrary callable (e.g. a plugin hook) on the action pool."""
+        return self._executor.submit(name, fn, timeout=timeout)
+
+    def shutdown(self) -> None:
+        self._executor.shutdown()
+
+    def register_pipeline(self, name: str, pipeline: Pipeline | List[Action]) -> None:
+        """Register a DAG, or a plain list of actions that run one after another."""
+        self._pipelines[name] = pipeline if isinstance(pipeline, Pipeline) else Pipeline.chain(name, pipeline)
 
-    def execute(self, action: Action) -> None:
-        self._logger.info("Executing action %s", action.__class__.__name__)
-        action.execute()
+    def remove_pipeline(self, name: str) -> None:
+        self._pipelines.pop(name, None)
 
-    def register_pipeline(self, name: str, actions: List[Action]) -> None:
-        self._pipelines[name] = actions
+    def start_pipeline(self, name: str) -> Optional["Future[PipelineResult]"]:
+        pipeline = self._pipelines.get(name)
+        if not pipeline or not pipeline.steps:
+            return None
+        return PipelineRun(pipeline, self.submit).start()
 
     def run_pipeline(self, name: str) -> bool:
-        actions = self._pipelines.get(name)
-        if not actions:
-            return False
-        for action in actions:
-            self.execute(action)
-        return True
-
-    def load_plugins(self, plugin_dir: str) -> Dict[str, Callable[[], None]]:
+        return self.start_pipeline(name) is not None
+
+    def load_plugins(
+        self, plugin_dir: str, lazy: bool = True, manifest_path: str | None = None
+    ) -> Dict[str, Callable[[], None]]:
+        """Collect ``PLUGIN_HOOKS`` and ``PLUGIN_PHRASES`` from every plugin in ``plugin_dir``.
+
+        By default plugins are indexed through a cached manifest and hooks are
+        ``LazyHook`` stubs, so no plugin is imported until one of its hooks runs.
+        """
+        if lazy:
+            self.plugins = PluginCatalog(plugin_dir, manifest_path)
+            self.plugins.refresh()
+            self.plugin_phrases.update(self.plugins.phrases())
+            return self.plugins.hooks()
+
         hooks: Dict[str, Callable[[], None]] = {}
         root = Path(plugin_dir)
         if not root.exists():
@@ -39,12 +76,24 @@ class AutomationEngine:
         for file in root.glob("*.py"):
             if file.name.startswith("__"):
                 continue
-            spec = importlib.util.spec_from_file_location(file.stem, file)
-            if not spec or not spec.loader:
+            module = import_plugin(file)
+            if module is None:
                 continue
-            module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)
             plugin_hooks = getattr(module, "PLUGIN_HOOKS", {})
             if isinstance(plugin_hooks, dict):
                 hooks.update(plugin_hooks)
+            plugin_phrases = getattr(module, "PLUGIN_PHRASES", {})
+            if isinstance(plugin_phrases, dict):
+                self.plugin_phrases.update(plugin_phrases)
         return hooks
+
+    def reload_plugins(self) -> Optional[Dict[str, Callable[[], None]]]:
+        """Re-index lazily loaded plugins; returns the full hook table if anything changed, else ``None``.
+
+        Only modules of changed plugin files are dropped, so they alone are
+        re-imported on their next call.
+        """
+        if self.plugins is None or not self.plugins.refresh():
+            return None
+        self.plugin_phrases = self.plugins.phrases()
+        return self.plugins.hooks()
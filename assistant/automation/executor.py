@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import heapq
+import itertools
+import logging
+from concurrent.futures import Future, InvalidStateError, ThreadPoolExecutor
+from threading import Condition, Lock, Thread
+from time import monotonic
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+
+class ActionTimeoutError(TimeoutError):
+    pass
+
+
+def _settle(future: Future, result: Any = None, exc: BaseException | None = None) -> None:
+    """Complete ``future`` unless the watchdog (or the action) got there first."""
+    try:
+        if exc is not None:
+            future.set_exception(exc)
+        else:
+            future.set_result(result)
+    except InvalidStateError:
+        pass
+
+
+class _Watchdog:
+    """Single thread that fails futures whose deadline passed."""
+
+    def __init__(self) -> None:
+        self._cond = Condition()
+        self._heap: List[Tuple[float, int, Future, str]] = []
+        self._counter = itertools.count()
+        self._thread: Thread | None = None
+        self._logger = logging.getLogger("ActionExecutor")
+
+    def watch(self, future: Future, timeout: float, name: str) -> None:
+        with self._cond:
+            heapq.heappush(self._heap, (monotonic() + timeout, next(self._counter), future, name))
+            if self._thread is None:
+                self._thread = Thread(target=self._run, name="automation-watchdog", daemon=True)
+                self._thread.start()
+            self._cond.notify()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while self._heap and self._heap[0][2].done():
+                    heapq.heappop(self._heap)
+                if not self._heap:
+                    self._cond.wait()
+                    continue
+                deadline, _, future, name = self._heap[0]
+                delay = deadline - monotonic()
+                if delay > 0:
+                    self._cond.wait(delay)
+                    continue
+                heapq.heappop(self._heap)
+            if not future.done():
+                self._logger.warning("%s timed out", name)
+                _settle(future, exc=ActionTimeoutError(f"{name} timed out"))
+
+
+class ActionExecutor:
+    """Bounded thread pool that runs blocking actions off the dispatching thread.
+
+    Every submission returns a ``Future``. Cancelling it before the action
+    starts removes it from the queue. A timeout (per call, per action name, or
+    the default) fails the future with ``ActionTimeoutError``; the worker
+    itself cannot be interrupted, so actions should still not wait on child
+    processes. ``shutdown`` cancels every action that has not started, and
+    later submissions return an already-cancelled future.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 4,
+        default_timeout: float | None = 30.0,
+        timeouts: Optional[Dict[str, float]] = None,
+    ) -> None:
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="automation")
+        self._default_timeout = default_timeout
+        self._timeouts: Dict[str, float] = dict(timeouts or {})
+        self._watchdog = _Watchdog()
+        self._lock = Lock()
+        self._pending: Set["Future[Any]"] = set()
+        self._closed = False
+
+    def set_timeout(self, name: str, timeout: float) -> None:
+        self._timeouts[name] = timeout
+
+    def submit(self, name: str, fn: Callable[[], Any], timeout: float | None = None) -> "Future[Any]":
+        future: "Future[Any]" = Future()
+
+        def run() -> None:
+            try:
+                if not future.set_running_or_notify_cancel():
+                    return
+            except RuntimeError:  # timed out while still queued
+                return
+            try:
+                result = fn()
+            except BaseException as exc:  # noqa: BLE001
+                _settle(future, exc=exc)
+            else:
+                _settle(future, result=result)
+
+        with self._lock:
+            if self._closed:
+                future.cancel()
+                return future
+            self._pending.add(future)
+            self._pool.submit(run)
+        future.add_done_callback(self._forget)
+        limit = timeout if timeout is not None else self._timeouts.get(name, self._default_timeout)
+        if limit:
+            self._watchdog.watch(future, limit, name)
+        return future
+
+    def shutdown(self, wait: bool = False) -> None:
+        with self._lock:
+            self._closed = True
+            pending = list(self._pending)
+        # Cancelling only succeeds for actions that have not started; running ones still settle.
+        for future in pending:
+            future.cancel()
+        self._pool.shutdown(wait=wait, cancel_futures=True)
+
+    def _forget(self, future: "Future[Any]") -> None:
+        with self._lock:
+            self._pending.discard(future)
@@ -0,0 +1,120 @@
+"""Fire-and-forget process spawning for desktop launchers."""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import os
+import shutil
+import subprocess
+from functools import lru_cache
+from multiprocessing.connection import Connection
+from threading import Lock
+from typing import Optional, Protocol, Sequence
+
+from assistant.core.host import system
+
+
+@lru_cache(maxsize=1)
+def opener() -> Optional[str]:
+    """Command that opens a file or folder with its default application (``None`` on Windows)."""
+    if system() == "Windows":
+        return None
+    if system() == "Darwin":
+        return "open"
+    return shutil.which("xdg-open") or "xdg-open"
+
+
+class Launcher(Protocol):
+    def spawn(self, argv: Sequence[str]) -> None: ...
+
+    def close(self) -> None: ...
+
+
+class PopenLauncher:
+    """Starts each command detached and never waits for it."""
+
+    def spawn(self, argv: Sequence[str]) -> None:
+        subprocess.Popen(
+            list(argv),
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=system() != "Windows",
+        )
+
+    def close(self) -> None:
+        pass
+
+
+def _helper_main(conn: Connection) -> None:
+    # Popen reaps previously started children that have exited each time it is called.
+    launcher = PopenLauncher()
+    while True:
+        try:
+            argv = conn.recv()
+        except EOFError:
+            return
+        if argv is None:
+            return
+        try:
+            launcher.spawn(argv)
+        except OSError as exc:
+            conn.send(str(exc))
+        else:
+            conn.send(None)
+
+
+class HelperProcessLauncher:
+    """Spawns commands from a small helper process started before the assistant grows.
+
+    Forking a large, multi-threaded parent (MediaPipe graph, TTS engine) for
+    every launcher is slow; the helper is forked once, early, and only ever
+    forks itself.
+    """
+
+    def __init__(self) -> None:
+        context = multiprocessing.get_context("spawn" if system() == "Windows" else "fork")
+        self._conn, child = context.Pipe()
+        self._process = context.Process(target=_helper_main, args=(child,), name="launcher-helper", daemon=True)
+        self._process.start()
+        child.close()
+        self._lock = Lock()
+        self._logger = logging.getLogger(self.__class__.__name__)
+
+    def spawn(self, argv: Sequence[str]) -> None:
+        with self._lock:
+            self._conn.send(list(argv))
+            error = self._conn.recv()
+        if error:
+            raise OSError(error)
+
+    def close(self) -> None:
+        with self._lock:
+            try:
+                self._conn.send(None)
+            except (BrokenPipeError, OSError):
+                pass
+        self._process.join(timeout=1.0)
+
+
+_launcher: Launcher = PopenLauncher()
+
+
+def use_launcher(launcher: Launcher) -> Launcher:
+    """Install ``launcher`` for all actions; returns the previous one."""
+    global _launcher
+    previous, _launcher = _launcher, launcher
+    return previous
+
+
+def spawn(argv: Sequence[str]) -> None:
+    _launcher.spawn(argv)
+
+
+def open_path(path: os.PathLike[str] | str) -> None:
+    command = opener()
+    if command is None:
+        os.startfile(path)  # type: ignore[attr-defined]
+    else:
+        spawn([command, str(path)])
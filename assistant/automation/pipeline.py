@@ -0,0 +1,244 @@
+from __future__ import annotations
+
+import logging
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from enum import Enum
+from threading import Lock
+from time import perf_counter
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+Submit = Callable[[str, Callable[[], Any], Optional[float]], "Future[Any]"]
+ActionFactory = Callable[..., Any]
+
+
+class StepStatus(str, Enum):
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    SKIPPED = "skipped"
+
+
+@dataclass(slots=True, frozen=True)
+class PipelineStep:
+    """One node of a pipeline.
+
+    ``run`` is either an action (anything with ``execute()``) or a callable
+    receiving ``{dependency name: output}``; its return value becomes this
+    step's output. Failed attempts are retried ``retries`` times. A failure in
+    an optional (``required=False``) step skips its dependents but does not
+    fail the pipeline.
+    """
+
+    name: str
+    run: Any
+    depends_on: Tuple[str, ...] = ()
+    retries: int = 0
+    timeout: float | None = None
+    required: bool = True
+
+    def invoke(self, inputs: Dict[str, Any]) -> Any:
+        execute = getattr(self.run, "execute", None)
+        if callable(execute):
+            return execute()
+        return self.run(inputs)
+
+
+@dataclass(slots=True)
+class StepResult:
+    name: str
+    status: StepStatus
+    output: Any = None
+    error: BaseException | None = None
+    attempts: int = 0
+    started: float = 0.0
+    duration: float = 0.0
+
+
+@dataclass(slots=True)
+class PipelineResult:
+    name: str
+    steps: Dict[str, StepResult] = field(default_factory=dict)
+    duration: float = 0.0
+    required: Tuple[str, ...] = ()
+
+    @property
+    def succeeded(self) -> bool:
+        return all(self.steps[name].status is StepStatus.SUCCEEDED for name in self.required)
+
+    def __bool__(self) -> bool:
+        return self.succeeded
+
+
+class PipelineError(ValueError):
+    pass
+
+
+class Pipeline:
+    """Validated DAG of steps."""
+
+    def __init__(self, name: str, steps: Iterable[PipelineStep]) -> None:
+        self.name = name
+        self.steps: Dict[str, PipelineStep] = {}
+        for step in steps:
+            if step.name in self.steps:
+                raise PipelineError(f"{name}: duplicate step {step.name!r}")
+            self.steps[step.name] = step
+        self.order = self._topological_order()
+
+    @classmethod
+    def chain(cls, name: str, actions: Sequence[Any]) -> "Pipeline":
+        """Linear pipeline where every action depends on the previous one."""
+        steps = []
+        for index, action in enumerate(actions):
+            depends = (f"{index - 1}:{actions[index - 1].__class__.__name__}",) if index else ()
+            steps.append(PipelineStep(f"{index}:{action.__class__.__name__}", action, depends))
+        return cls(name, steps)
+
+    @classmethod
+    def from_config(cls, name: str, spec: Sequence[Mapping[str, Any]], factories: Mapping[str, ActionFactory]) -> "Pipeline":
+        """Build from config entries such as::
+
+            {"name": "open", "action": "open_file", "args": {"file_path": "~/notes.txt"},
+             "depends_on": [], "retries": 1, "timeout": 5}
+
+        A string argument ``"$step"`` is replaced by that step's output at run time.
+        """
+        steps = []
+        for entry in spec:
+            action = entry["action"]
+            if action not in factories:
+                raise PipelineError(f"{name}: unknown action {action!r}")
+            steps.append(
+                PipelineStep(
+                    name=entry["name"],
+                    run=_ConfiguredAction(factories[action], dict(entry.get("args", {}))),
+                    depends_on=tuple(entry.get("depends_on", ())),
+                    retries=int(entry.get("retries", 0)),
+                    timeout=entry.get("timeout"),
+                    required=bool(entry.get("required", True)),
+                )
+            )
+        return cls(name, steps)
+
+    def _topological_order(self) -> List[str]:
+        indegree = {name: 0 for name in self.steps}
+        for step in self.steps.values():
+            for dependency in step.depends_on:
+                if dependency not in self.steps:
+                    raise PipelineError(f"{self.name}: {step.name!r} depends on unknown step {dependency!r}")
+                indegree[step.name] += 1
+        ready = [name for name, degree in indegree.items() if degree == 0]
+        order: List[str] = []
+        while ready:
+            current = ready.pop(0)
+            order.append(current)
+            for step in self.steps.values():
+                if current in step.depends_on:
+                    indegree[step.name] -= 1
+                    if indegree[step.name] == 0:
+                        ready.append(step.name)
+        if len(order) != len(self.steps):
+            raise PipelineError(f"{self.name}: dependency cycle")
+        return order
+
+
+class _ConfiguredAction:
+    __slots__ = ("factory", "args")
+
+    def __init__(self, factory: ActionFactory, args: Dict[str, Any]) -> None:
+        self.factory = factory
+        self.args = args
+
+    def __call__(self, inputs: Dict[str, Any]) -> Any:
+        args = {
+            key: inputs.get(value[1:]) if isinstance(value, str) and value.startswith("$") else value
+            for key, value in self.args.items()
+        }
+        action = self.factory(**args)
+        execute = getattr(action, "execute", None)
+        return execute() if callable(execute) else action
+
+
+class PipelineRun:
+    """Drives one execution: ready steps are submitted as soon as their dependencies succeed."""
+
+    def __init__(self, pipeline: Pipeline, submit: Submit) -> None:
+        self._pipeline = pipeline
+        self._submit = submit
+        self._lock = Lock()
+        self._started = 0.0
+        self._waiting = {name: set(step.depends_on) for name, step in pipeline.steps.items()}
+        self._dependents: Dict[str, List[str]] = {name: [] for name in pipeline.steps}
+        for step in pipeline.steps.values():
+            for dependency in step.depends_on:
+                self._dependents[dependency].append(step.name)
+        self._result = PipelineResult(
+            pipeline.name, required=tuple(name for name, step in pipeline.steps.items() if step.required)
+        )
+        self.future: "Future[PipelineResult]" = Future()
+        self._logger = logging.getLogger(self.__class__.__name__)
+
+    def start(self) -> "Future[PipelineResult]":
+        self._started = perf_counter()
+        ready = [name for name in self._pipeline.order if not self._waiting[name]]
+        if not ready:
+            self._finish()
+        for name in ready:
+            self._launch(name, attempt=1)
+        return self.future
+
+    def _launch(self, name: str, attempt: int) -> None:
+        step = self._pipeline.steps[name]
+        inputs = {dependency: self._result.steps[dependency].output for dependency in step.depends_on}
+        started = perf_counter()
+        future = self._submit(f"{self._pipeline.name}.{name}", lambda: step.invoke(inputs), step.timeout)
+        future.add_done_callback(lambda done: self._completed(name, attempt, started, done))
+
+    def _completed(self, name: str, attempt: int, started: float, future: "Future[Any]") -> None:
+        step = self._pipeline.steps[name]
+        error = future.exception() if not future.cancelled() else RuntimeError("cancelled")
+        if error is not None and attempt <= step.retries:
+            self._logger.info("%s.%s failed (%s), retrying", self._pipeline.name, name, error)
+            self._launch(name, attempt + 1)
+            return
+
+        finished = perf_counter()
+        result = StepResult(
+            name=name,
+            status=StepStatus.FAILED if error is not None else StepStatus.SUCCEEDED,
+            output=None if error is not None else future.result(),
+            error=error,
+            attempts=attempt,
+            started=started - self._started,
+            duration=finished - started,
+        )
+        ready: List[str] = []
+        with self._lock:
+            self._result.steps[name] = result
+            if error is not None:
+                self._logger.warning("%s.%s failed: %s", self._pipeline.name, name, error)
+                self._skip_dependents(name)
+            else:
+                for dependent in self._dependents[name]:
+                    self._waiting[dependent].discard(name)
+                    if not self._waiting[dependent] and dependent not in self._result.steps:
+                        ready.append(dependent)
+            done = len(self._result.steps) == len(self._pipeline.steps)
+        for dependent in ready:
+            self._launch(dependent, attempt=1)
+        if done:
+            self._finish()
+
+    def _skip_dependents(self, name: str) -> None:
+        for dependent in self._dependents[name]:
+            if dependent not in self._result.steps:
+                self._result.steps[dependent] = StepResult(dependent, StepStatus.SKIPPED)
+                self._skip_dependents(dependent)
+
+    def _finish(self) -> None:
+        self._result.duration = perf_counter() - self._started
+        timings = ", ".join(
+            f"{name}={step.status.value}:{step.duration * 1000:.0f}ms" for name, step in self._result.steps.items()
+        )
+        self._logger.info("pipeline %s finished in %.0f ms (%s)", self._pipeline.name, self._result.duration * 1000, timings)
+        self.future.set_result(self._result)
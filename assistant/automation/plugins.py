@@ -0,0 +1,229 @@
+"""Plugin discovery without importing plugins.
+
+Each plugin file is parsed once with ``ast`` to find the keys of its
+``PLUGIN_HOOKS`` dict literal and its ``PLUGIN_PHRASES`` literal. The result
+is cached in a JSON manifest keyed by path and validated by mtime, size and
+content hash, so an unchanged plugin directory is indexed with a ``stat`` per
+file. Hooks are handed out as ``LazyHook`` stubs that import their module on
+first call.
+"""
+
+from __future__ import annotations
+
+import ast
+import hashlib
+import importlib.util
+import json
+import logging
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from threading import Lock
+from types import ModuleType
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+MANIFEST_VERSION = 1
+
+
+@dataclass(slots=True, frozen=True)
+class PluginManifestEntry:
+    path: str
+    mtime_ns: int
+    size: int
+    digest: str
+    hooks: Tuple[str, ...] = ()
+    phrases: Dict[str, str] = field(default_factory=dict)
+    # False when PLUGIN_HOOKS/PLUGIN_PHRASES are not plain literals; such plugins are imported eagerly.
+    static: bool = True
+
+
+def _literal_assignments(tree: ast.Module) -> Dict[str, ast.expr]:
+    found: Dict[str, ast.expr] = {}
+    for node in tree.body:
+        if isinstance(node, ast.Assign):
+            for target in node.targets:
+                if isinstance(target, ast.Name):
+                    found[target.id] = node.value
+        elif isinstance(node, ast.AnnAssign) and isinstance(node.target, ast.Name) and node.value is not None:
+            found[node.target.id] = node.value
+    return found
+
+
+def scan_plugin(path: Path, source: bytes | None = None) -> PluginManifestEntry:
+    """Build a manifest entry for ``path`` by parsing (not executing) it."""
+    stat = path.stat()
+    source = path.read_bytes() if source is None else source
+    digest = hashlib.blake2b(source, digest_size=16).hexdigest()
+    static = True
+    hooks: Tuple[str, ...] = ()
+    phrases: Dict[str, str] = {}
+    try:
+        assignments = _literal_assignments(ast.parse(source, filename=str(path)))
+    except SyntaxError:
+        assignments, static = {}, False
+
+    hooks_node = assignments.get("PLUGIN_HOOKS")
+    if isinstance(hooks_node, ast.Dict) and all(
+        isinstance(key, ast.Constant) and isinstance(key.value, str) for key in hooks_node.keys
+    ):
+        hooks = tuple(key.value for key in hooks_node.keys)  # type: ignore[union-attr]
+    elif hooks_node is not None:
+        static = False
+
+    phrases_node = assignments.get("PLUGIN_PHRASES")
+    if phrases_node is not None:
+        try:
+            value = ast.literal_eval(phrases_node)
+        except ValueError:
+            static = False
+        else:
+            if isinstance(value, dict):
+                phrases = {str(phrase): str(intent) for phrase, intent in value.items()}
+            else:
+                static = False
+
+    return PluginManifestEntry(str(path), stat.st_mtime_ns, stat.st_size, digest, hooks, phrases, static)
+
+
+class LazyHook:
+    """Stand-in for a plugin hook that imports the plugin on first call."""
+
+    __slots__ = ("catalog", "path", "name")
+
+    def __init__(self, catalog: "PluginCatalog", path: str, name: str) -> None:
+        self.catalog = catalog
+        self.path = path
+        self.name = name
+
+    def resolve(self) -> Callable[..., Any]:
+        module = self.catalog.module(self.path)
+        hooks = getattr(module, "PLUGIN_HOOKS", {})
+        if not isinstance(hooks, dict) or self.name not in hooks:
+            raise LookupError(f"{self.path} no longer defines hook {self.name!r}")
+        return hooks[self.name]
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self.resolve()(*args, **kwargs)
+
+    def __repr__(self) -> str:
+        return f"LazyHook({self.name!r}, {Path(self.path).name})"
+
+
+def import_plugin(path: Path) -> Optional[ModuleType]:
+    spec = importlib.util.spec_from_file_location(path.stem, path)
+    if not spec or not spec.loader:
+        return None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class PluginCatalog:
+    """Manifest-backed index of a plugin directory with on-demand imports."""
+
+    def __init__(self, plugin_dir: str | Path, manifest_path: str | Path | None = None) -> None:
+        self.plugin_dir = Path(plugin_dir)
+        self.manifest_path = Path(manifest_path) if manifest_path else self.plugin_dir / ".plugin_manifest.json"
+        self.entries: Dict[str, PluginManifestEntry] = {}
+        self.scanned = 0
+        self._modules: Dict[str, ModuleType] = {}
+        self._lock = Lock()
+        self._logger = logging.getLogger(self.__class__.__name__)
+        self._load_manifest()
+
+    def _load_manifest(self) -> None:
+        try:
+            data = json.loads(self.manifest_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if data.get("version") != MANIFEST_VERSION:
+            return
+        for raw in data.get("plugins", []):
+            raw["hooks"] = tuple(raw.get("hooks", ()))
+            entry = PluginManifestEntry(**raw)
+            self.entries[entry.path] = entry
+
+    def _save_manifest(self) -> None:
+        payload = {"version": MANIFEST_VERSION, "plugins": [asdict(entry) for entry in self.entries.values()]}
+        try:
+            self.manifest_path.write_text(json.dumps(payload), encoding="utf-8")
+        except OSError as exc:
+            self._logger.debug("plugin manifest not written: %s", exc)
+
+    def refresh(self) -> List[str]:
+        """Re-index the directory; returns the paths whose entries changed (added, edited or removed)."""
+        changed: List[str] = []
+        dirty = False
+        seen = set()
+        files = sorted(self.plugin_dir.glob("*.py")) if self.plugin_dir.exists() else []
+        for file in files:
+            if file.name.startswith("__"):
+                continue
+            key = str(file)
+            seen.add(key)
+            cached = self.entries.get(key)
+            stat = file.stat()
+            if cached and cached.mtime_ns == stat.st_mtime_ns and cached.size == stat.st_size:
+                continue
+            source = file.read_bytes()
+            if cached and cached.digest == hashlib.blake2b(source, digest_size=16).hexdigest():
+                # Touched but identical: keep the hooks, remember the new mtime.
+                self.entries[key] = PluginManifestEntry(
+                    key, stat.st_mtime_ns, stat.st_size, cached.digest, cached.hooks, cached.phrases, cached.static
+                )
+                dirty = True
+                continue
+            self.entries[key] = scan_plugin(file, source)
+            self.scanned += 1
+            changed.append(key)
+        for key in [key for key in self.entries if key not in seen]:
+            del self.entries[key]
+            changed.append(key)
+        for key in changed:
+            self.invalidate(key)
+        if changed or dirty or (files and not self.manifest_path.exists()):
+            self._save_manifest()
+        return changed
+
+    def invalidate(self, path: str) -> None:
+        """Drop the imported module so the next hook call re-imports it."""
+        with self._lock:
+            self._modules.pop(path, None)
+
+    def module(self, path: str) -> ModuleType:
+        with self._lock:
+            module = self._modules.get(path)
+            if module is None:
+                module = import_plugin(Path(path))
+                if module is None:
+                    raise ImportError(f"cannot load plugin {path}")
+                self._modules[path] = module
+            return module
+
+    def hooks(self) -> Dict[str, Callable[..., Any]]:
+        hooks: Dict[str, Callable[..., Any]] = {}
+        for entry in self.entries.values():
+            if entry.static:
+                hooks.update({name: LazyHook(self, entry.path, name) for name in entry.hooks})
+                continue
+            try:
+                plugin_hooks = getattr(self.module(entry.path), "PLUGIN_HOOKS", {})
+            except Exception as exc:  # noqa: BLE001
+                self._logger.warning("plugin %s failed to load: %s", entry.path, exc)
+                continue
+            if isinstance(plugin_hooks, dict):
+                hooks.update(plugin_hooks)
+        return hooks
+
+    def phrases(self) -> Dict[str, str]:
+        phrases: Dict[str, str] = {}
+        for entry in self.entries.values():
+            if entry.static:
+                phrases.update(entry.phrases)
+                continue
+            try:
+                module_phrases = getattr(self.module(entry.path), "PLUGIN_PHRASES", {})
+            except Exception:  # noqa: BLE001
+                continue  # already reported by hooks()
+            if isinstance(module_phrases, dict):
+                phrases.update(module_phrases)
+        return phrases
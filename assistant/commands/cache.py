@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from threading import Lock
+from time import monotonic, perf_counter
+from typing import Callable, Optional, Tuple
+
+from assistant.commands.parser import normalize
+from assistant.commands.router import ResolvedCommand
+from assistant.core import tracing
+
+
+@dataclass(slots=True)
+class IntentCacheStats:
+    hits: int = 0
+    misses: int = 0
+    invalidations: int = 0
+    saved_seconds: float = 0.0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class IntentCache:
+    """LRU + TTL cache from normalized utterance to its resolved command.
+
+    Unrecognized utterances are cached too (as ``None``), which matters for
+    streaming partials such as "open" or "open bro". ``invalidate`` must be
+    called whenever the phrase table or the router registrations change; it
+    bumps a generation so lookups racing with the change cannot re-insert a
+    stale entry. All methods are safe to call from several bus workers.
+    """
+
+    def __init__(self, maxsize: int = 256, ttl: float = 600.0, clock: Callable[[], float] = monotonic) -> None:
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._clock = clock
+        self._entries: "OrderedDict[str, Tuple[float, Optional[ResolvedCommand]]]" = OrderedDict()
+        self._generation = 0
+        self._lock = Lock()
+        self._miss_cost = 0.0
+        self.stats = IntentCacheStats()
+
+    def resolve(self, text: str, compute: Callable[[str], Optional[ResolvedCommand]]) -> Optional[ResolvedCommand]:
+        """Return the cached command for ``text``, or ``compute(normalized)`` it and cache the result."""
+        started = perf_counter()
+        key = normalize(text)
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            hit = entry is not None and entry[0] > now
+            if hit:
+                self._entries.move_to_end(key)
+                saved = max(self._miss_cost - (perf_counter() - started), 0.0)
+                self.stats.hits += 1
+                self.stats.saved_seconds += saved
+            generation = self._generation
+        if hit:
+            metrics = tracing.tracer()
+            metrics.increment("intent_cache.hits")
+            metrics.increment("intent_cache.saved_seconds", saved)
+            return entry[1]  # type: ignore[index]
+
+        resolved = compute(key)
+        elapsed = perf_counter() - started
+        with self._lock:
+            self.stats.misses += 1
+            # Running average of what a lookup costs without the cache.
+            self._miss_cost += (elapsed - self._miss_cost) / min(self.stats.misses, 100)
+            if generation == self._generation and self._maxsize > 0:
+                self._entries[key] = (now + self._ttl, resolved)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self._maxsize:
+                    self._entries.popitem(last=False)
+        tracing.tracer().increment("intent_cache.misses")
+        return resolved
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+            self.stats.invalidations += 1
+        tracing.tracer().increment("intent_cache.invalidations")
+
+    def __len__(self) -> int:
+        return len(self._entries)
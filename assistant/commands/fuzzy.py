@@ -0,0 +1,251 @@
+"""Approximate phrase matching for noisy ASR output.
+
+The exact ``PhraseMatcher`` misses "play musik" or "swich window". This
+module indexes the words of the phrase table twice: by character bigrams for
+Levenshtein lookups, and by Metaphone key. An utterance word is scored
+against the vocabulary words it is close to (by spelling or by sound), and
+a phrase scores the mean of its words' best scores over a window of
+consecutive utterance words. Everything is precomputed when the table is
+compiled, so a lookup only touches the few vocabulary words near each token.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Set, Tuple
+
+from assistant.commands.matcher import PhraseRule
+
+PHONETIC_SCORE = 0.9
+MAX_EDITS = 2
+
+_VOWELS = frozenset("aeiou")
+_FRONT = frozenset("eiy")
+_WORD = re.compile(r"\S+")
+
+
+def levenshtein(a: str, b: str, limit: int | None = None) -> int:
+    """Edit distance, or any value above ``limit`` as soon as it is known to exceed it."""
+    if a == b:
+        return 0
+    if len(a) < len(b):
+        a, b = b, a
+    if limit is not None and len(a) - len(b) > limit:
+        return limit + 1
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        left = i
+        for j, cb in enumerate(b):
+            left = min(previous[j + 1] + 1, left + 1, previous[j] + (ca != cb))
+            current.append(left)
+        if limit is not None and min(current) > limit:
+            return limit + 1
+        previous = current
+    return previous[-1]
+
+
+def metaphone(word: str) -> str:
+    """Original Metaphone key (Philips, 1990) of an English word, e.g. ``music`` and ``musik`` -> ``MSK``."""
+    w = "".join(c for c in word.lower() if c.isalpha())
+    if not w:
+        return ""
+    if w[:2] in ("kn", "gn", "pn", "ae", "wr"):
+        w = w[1:]
+    elif w[0] == "x":
+        w = "s" + w[1:]
+    elif w[:2] == "wh":
+        w = "w" + w[2:]
+
+    key: List[str] = []
+    n = len(w)
+    for i, c in enumerate(w):
+        prev = w[i - 1] if i else ""
+        nxt = w[i + 1] if i + 1 < n else ""
+        after = w[i + 2] if i + 2 < n else ""
+        if c == prev and c != "c":
+            continue
+        if c in _VOWELS:
+            if i == 0:
+                key.append(c.upper())
+        elif c == "b":
+            if not (prev == "m" and i == n - 1):
+                key.append("B")
+        elif c == "c":
+            if nxt == "i" and after == "a" or nxt == "h":
+                key.append("K" if prev == "s" and nxt == "h" else "X")
+            elif nxt in _FRONT:
+                if prev != "s":
+                    key.append("S")
+            else:
+                key.append("K")
+        elif c == "d":
+            key.append("J" if nxt == "g" and after in _FRONT else "T")
+        elif c == "g":
+            if nxt == "h" and not (i + 2 >= n or after in _VOWELS):
+                continue
+            if nxt == "n" and (i + 2 == n or w[i + 2 :] == "ed"):
+                continue
+            if prev == "d" and nxt in _FRONT:
+                continue
+            key.append("J" if nxt in _FRONT and prev != "g" else "K")
+        elif c == "h":
+            if prev in "csptg" and prev:
+                continue
+            if prev in _VOWELS and nxt not in _VOWELS:
+                continue
+            key.append("H")
+        elif c == "k":
+            if prev != "c":
+                key.append("K")
+        elif c == "p":
+            key.append("F" if nxt == "h" else "P")
+        elif c == "q":
+            key.append("K")
+        elif c == "s":
+            key.append("X" if nxt == "h" or nxt == "i" and after in ("o", "a") else "S")
+        elif c == "t":
+            if nxt == "i" and after in ("o", "a"):
+                key.append("X")
+            elif nxt == "h":
+                key.append("0")
+            elif not (nxt == "c" and after == "h"):
+                key.append("T")
+        elif c == "v":
+            key.append("F")
+        elif c in "wy":
+            if nxt in _VOWELS:
+                key.append(c.upper())
+        elif c == "x":
+            key.append("KS")
+        elif c == "z":
+            key.append("S")
+        else:
+            key.append(c.upper())
+    return "".join(key)
+
+
+class NGramIndex:
+    """Words indexed by their padded character bigrams, for edit-distance lookups.
+
+    A word within ``d`` edits of the query shares all but at most ``2 * d`` of
+    its bigrams with it, so only words passing that count filter are checked
+    with ``levenshtein``.
+    """
+
+    def __init__(self, words: Iterable[str] = ()) -> None:
+        self._words: List[str] = []
+        self._sizes: List[int] = []
+        self._postings: Dict[str, List[Tuple[int, int]]] = {}
+        for word in words:
+            self.add(word)
+
+    def __len__(self) -> int:
+        return len(self._words)
+
+    def add(self, word: str) -> None:
+        index = len(self._words)
+        self._words.append(word)
+        grams = _bigrams(word)
+        self._sizes.append(sum(grams.values()))
+        for gram, count in grams.items():
+            self._postings.setdefault(gram, []).append((index, count))
+
+    def search(self, word: str, max_distance: int) -> List[Tuple[str, int]]:
+        """Every indexed word within ``max_distance`` edits of ``word``."""
+        grams = _bigrams(word)
+        size = sum(grams.values())
+        shared: Dict[int, int] = {}
+        for gram, count in grams.items():
+            for index, indexed in self._postings.get(gram, ()):
+                shared[index] = shared.get(index, 0) + min(count, indexed)
+        found: List[Tuple[str, int]] = []
+        for index, common in shared.items():
+            if common < max(size, self._sizes[index]) - 2 * max_distance:
+                continue
+            candidate = self._words[index]
+            distance = levenshtein(word, candidate, max_distance)
+            if distance <= max_distance:
+                found.append((candidate, distance))
+        return found
+
+
+def _bigrams(word: str) -> Dict[str, int]:
+    padded = f"^{word}$"
+    grams: Dict[str, int] = {}
+    for i in range(len(padded) - 1):
+        gram = padded[i : i + 2]
+        grams[gram] = grams.get(gram, 0) + 1
+    return grams
+
+
+@dataclass(slots=True, frozen=True)
+class FuzzyMatch:
+    rule: PhraseRule
+    score: float
+    # Character offset in the utterance where the matched phrase ends.
+    end: int
+
+
+class FuzzyMatcher:
+    """Top-k approximate matches of a phrase table against an utterance.
+
+    An utterance word scores ``1 - distance / length`` against each vocabulary
+    word within ``max(1, len(word) // 3)`` edits of it (at most ``MAX_EDITS``),
+    and at least ``PHONETIC_SCORE`` when the two share a Metaphone key. Prefix rules must align with the start of the
+    utterance, like in the exact matcher; every word of a phrase must match.
+    """
+
+    def __init__(self, rules: Iterable[PhraseRule]) -> None:
+        self._rules: List[Tuple[PhraseRule, Tuple[str, ...]]] = []
+        # Rules by the first word of their phrase; a window is only scored where that word matched.
+        self._by_first: Dict[str, List[int]] = {}
+        self._by_key: Dict[str, Set[str]] = {}
+        vocabulary: Dict[str, None] = {}
+        for rule in rules:
+            words = tuple(rule.phrase.split())
+            if not words:
+                continue
+            self._by_first.setdefault(words[0], []).append(len(self._rules))
+            self._rules.append((rule, words))
+            vocabulary.update(dict.fromkeys(words))
+        for word in vocabulary:
+            key = metaphone(word)
+            # One-letter keys ("see", "zz") are too coarse to mean the words sound alike.
+            if len(key) > 1:
+                self._by_key.setdefault(key, set()).add(word)
+        self._index = NGramIndex(vocabulary)
+
+    def _neighbours(self, token: str) -> Dict[str, float]:
+        scores: Dict[str, float] = {}
+        for word, distance in self._index.search(token, min(max(1, len(token) // 3), MAX_EDITS)):
+            scores[word] = 1.0 - distance / max(len(word), len(token))
+        for word in self._by_key.get(metaphone(token), ()):
+            scores[word] = max(scores.get(word, 0.0), PHONETIC_SCORE)
+        return scores
+
+    def top(self, text: str, k: int = 3, threshold: float = 0.0) -> List[FuzzyMatch]:
+        """Best match per intent scoring at least ``threshold``, best first (table order breaks ties)."""
+        spans = [(m.group(), m.end()) for m in _WORD.finditer(text)]
+        neighbours = [self._neighbours(token) for token, _ in spans]
+        best: Dict[str, Tuple[float, int, int]] = {}
+        for start, first in enumerate(neighbours):
+            for first_word in first:
+                for index in self._by_first.get(first_word, ()):
+                    rule, words = self._rules[index]
+                    if rule.prefix and start or start + len(words) > len(spans):
+                        continue
+                    total = 0.0
+                    for offset, word in enumerate(words):
+                        score = neighbours[start + offset].get(word)
+                        if score is None:
+                            break
+                        total += score
+                    else:
+                        score = total / len(words)
+                        current = best.get(rule.intent)
+                        if score >= threshold and (current is None or (-score, index) < (-current[0], current[1])):
+                            best[rule.intent] = (score, index, spans[start + len(words) - 1][1])
+        ranked = sorted(best.values(), key=lambda item: (-item[0], item[1]))[:k]
+        return [FuzzyMatch(self._rules[index][0], score, end) for score, index, end in ranked]
@@ -0,0 +1,106 @@
+"""Gesture-to-intent mapping compiled from config."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from itertools import product
+from typing import Any, Dict, Iterable, Mapping, Optional, Sequence, Tuple
+
+from assistant.commands.parser import CommandIntent
+
+DEFAULT_MODE = "default"
+
+
+@dataclass(slots=True, frozen=True)
+class GestureRule:
+    """Maps a gesture to an intent, optionally only in one mode and/or foreground app.
+
+    ``app`` is the focused window's class, lower-case (``"firefox"``,
+    ``"code"``). An empty ``intent`` unmaps the gesture where the rule applies.
+    """
+
+    gesture: str
+    intent: str
+    argument: str | None = None
+    mode: str | None = None
+    app: str | None = None
+
+    @property
+    def specificity(self) -> int:
+        return (2 if self.app else 0) + (1 if self.mode else 0)
+
+    @classmethod
+    def from_entry(cls, entry: Mapping[str, Any]) -> "GestureRule":
+        """Build a rule from a config entry such as ``{"gesture": "fist", "intent": "play_music", "app": "vlc"}``."""
+        unknown = set(entry) - {"gesture", "intent", "argument", "mode", "app"}
+        if unknown:
+            raise ValueError(f"unknown gesture_map keys: {', '.join(sorted(unknown))}")
+        if not entry.get("gesture"):
+            raise ValueError(f"gesture_map entry without a gesture: {dict(entry)}")
+        app = entry.get("app")
+        return cls(
+            gesture=str(entry["gesture"]),
+            intent=str(entry.get("intent") or ""),
+            argument=entry.get("argument"),
+            mode=entry.get("mode"),
+            app=str(app).lower() if app else None,
+        )
+
+
+DEFAULT_GESTURE_RULES = (
+    GestureRule("swipe_left", "switch_window"),
+    GestureRule("swipe_right", "switch_window"),
+    GestureRule("open_palm", "open_browser"),
+    GestureRule("fist", "play_music"),
+    GestureRule("point", "type_text", argument="gesture triggered text"),
+)
+
+Context = Tuple[Optional[str], Optional[str]]
+
+
+class GestureMap:
+    """Gesture lookup tables for every mode and foreground app named in the rules.
+
+    A rule for the app and mode beats one for the app, which beats one for the
+    mode, which beats a rule for neither; among equally specific rules the
+    later one wins, so config entries override the defaults. All tables are
+    built up front: ``table`` picks one with a single dict lookup, and the
+    caller keeps it while the context stays the same. Modes and apps no rule
+    mentions share the generic table.
+    """
+
+    def __init__(self, rules: Iterable[GestureRule] = DEFAULT_GESTURE_RULES) -> None:
+        self.rules = tuple(rules)
+        self._modes = frozenset(rule.mode for rule in self.rules if rule.mode)
+        self._apps = frozenset(rule.app for rule in self.rules if rule.app)
+        self._tables: Dict[Context, Dict[str, CommandIntent]] = {
+            (mode, app): self._compile(mode, app)
+            for mode, app in product([None, *self._modes], [None, *self._apps])
+        }
+
+    @classmethod
+    def from_config(cls, entries: Sequence[Mapping[str, Any]]) -> "GestureMap":
+        """The built-in mapping extended (and overridden) by ``gesture_map`` config entries."""
+        return cls([*DEFAULT_GESTURE_RULES, *(GestureRule.from_entry(entry) for entry in entries)])
+
+    @property
+    def uses_apps(self) -> bool:
+        """Whether any rule depends on the foreground app (if not, it need not be looked up)."""
+        return bool(self._apps)
+
+    def table(self, mode: str = DEFAULT_MODE, app: str | None = None) -> Mapping[str, CommandIntent]:
+        return self._tables[(mode if mode in self._modes else None, app if app in self._apps else None)]
+
+    def _compile(self, mode: str | None, app: str | None) -> Dict[str, CommandIntent]:
+        applicable = [
+            (rule.specificity, index, rule)
+            for index, rule in enumerate(self.rules)
+            if rule.mode in (None, mode) and rule.app in (None, app)
+        ]
+        table: Dict[str, CommandIntent] = {}
+        for _, _, rule in sorted(applicable, key=lambda item: item[:2]):
+            if rule.intent:
+                table[rule.gesture] = CommandIntent(rule.intent, rule.argument)
+            else:
+                table.pop(rule.gesture, None)
+        return table
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+@dataclass(slots=True, frozen=True)
+class PhraseRule:
+    """Maps a phrase to an intent.
+
+    ``prefix`` rules only match at the start of the utterance and capture the
+    remaining text as the intent argument (``"open file <path>"``); other rules
+    match anywhere in the utterance.
+    """
+
+    phrase: str
+    intent: str
+    prefix: bool = False
+
+    @classmethod
+    def from_entry(cls, phrase: str, intent: str) -> "PhraseRule":
+        """Build a rule from a config/plugin entry; a trailing ``*`` marks an argument-capturing prefix."""
+        phrase = phrase.strip().lower()
+        if phrase.endswith("*"):
+            return cls(phrase.rstrip("*").strip(), intent, prefix=True)
+        return cls(phrase, intent)
+
+
+@dataclass(slots=True, frozen=True)
+class PhraseMatch:
+    rule: PhraseRule
+    start: int
+    end: int
+
+
+class PhraseMatcher:
+    """Aho-Corasick automaton over a phrase table.
+
+    Every rule is found in a single left-to-right pass regardless of how many
+    phrases are registered. When several rules match, the one listed first in
+    the table wins, which mirrors an ordered chain of ``if`` checks.
+    """
+
+    def __init__(self, rules: Iterable[PhraseRule]) -> None:
+        self._rules: List[PhraseRule] = [rule for rule in rules if rule.phrase]
+        self._goto: List[Dict[str, int]] = [{}]
+        self._depth: List[int] = [0]
+        # Lowest rule index among substring rules ending at a node (including its fail chain).
+        self._best: List[Optional[int]] = [None]
+        # Lowest prefix rule index whose phrase is exactly the path to a node.
+        self._prefix: List[Optional[int]] = [None]
+        self._build()
+
+    def __len__(self) -> int:
+        return len(self._rules)
+
+    def _build(self) -> None:
+        goto, depth, best, prefix = self._goto, self._depth, self._best, self._prefix
+        for index, rule in enumerate(self._rules):
+            node = 0
+            for char in rule.phrase:
+                nxt = goto[node].get(char)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[node][char] = nxt
+                    goto.append({})
+                    depth.append(depth[node] + 1)
+                    best.append(None)
+                    prefix.append(None)
+                node = nxt
+            slot = prefix if rule.prefix else best
+            if slot[node] is None:
+                slot[node] = index
+
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in goto[node].items():
+                queue.append(child)
+                state = fail[node]
+                while state and char not in goto[state]:
+                    state = fail[state]
+                target = goto[state].get(char, 0)
+                fail[child] = target if target != child else 0
+                inherited = best[fail[child]]
+                if inherited is not None and (best[child] is None or inherited < best[child]):
+                    best[child] = inherited
+
+        self._fail = fail
+
+    def match(self, text: str) -> Optional[PhraseMatch]:
+        """Return the highest-precedence rule matching ``text`` (already normalized)."""
+        goto, fail, depth, best, prefix = self._goto, self._fail, self._depth, self._best, self._prefix
+        found: Optional[int] = None
+        found_end = 0
+        state = 0
+        for position, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if not state:
+                continue
+            candidate = best[state]
+            if candidate is not None and (found is None or candidate < found):
+                found, found_end = candidate, position + 1
+            if depth[state] == position + 1:
+                candidate = prefix[state]
+                if candidate is not None and (found is None or candidate < found):
+                    found, found_end = candidate, position + 1
+            if found == 0:
+                break
+
+        if found is None:
+            return None
+        rule = self._rules[found]
+        return PhraseMatch(rule=rule, start=found_end - len(rule.phrase), end=found_end)
+
+    def rules(self) -> Tuple[PhraseRule, ...]:
+        return tuple(self._rules)
@@ -1,32 +1,139 @@
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
-from typing import Optional
+from typing import Iterable, List, Mapping, Optional
 
+from assistant.commands.fuzzy import FuzzyMatch, FuzzyMatcher
+from assistant.commands.matcher import PhraseMatcher, PhraseRule
 
-@dataclass(slots=True)
+
+@dataclass(slots=True, frozen=True)
 class CommandIntent:
     name: str
     argument: str | None = None
+    # 1.0 for an exact phrase match, the fuzzy score otherwise.
+    confidence: float = 1.0
+
+
+@dataclass(slots=True, frozen=True)
+class IntentStep:
+    """One command of a compound utterance; ``after_previous`` means it must wait for the one before."""
+
+    intent: CommandIntent
+    after_previous: bool = False
+
+
+# Joins between the commands of a compound utterance. Order is kept unless the
+# speaker says "also", in which case the command may run alongside the previous one.
+SEPARATORS = re.compile(r"\s*(,|\band then\b|\bthen\b|\bafter that\b|\bafterwards\b|\band also\b|\balso\b|\band\b)\s*")
+CONCURRENT_SEPARATORS = frozenset({"and also", "also"})
+
+
+def normalize(text: str) -> str:
+    """The form of an utterance the parser matches against (and the intent cache keys on)."""
+    return text.strip().lower()
+
+
+def is_compound(text: str) -> bool:
+    """Whether ``text`` may hold several commands (a cheap check before ``parse_all``)."""
+    return SEPARATORS.search(normalize(text)) is not None
+
+
+BUILTIN_PHRASES = (
+    PhraseRule("open browser", "open_browser"),
+    PhraseRule("launch browser", "open_browser"),
+    PhraseRule("open file", "open_file", prefix=True),
+    PhraseRule("shutdown pc", "shutdown_pc"),
+    PhraseRule("shutdown computer", "shutdown_pc"),
+    PhraseRule("power off", "shutdown_pc"),
+    PhraseRule("play music", "play_music"),
+    PhraseRule("start music", "play_music"),
+    PhraseRule("switch window", "switch_window"),
+    PhraseRule("next window", "switch_window"),
+    PhraseRule("type text", "type_text", prefix=True),
+)
 
 
 class RuleBasedCommandParser:
-    """Initial deterministic parser; can be replaced by NLP later."""
+    """Deterministic phrase-table parser; can be replaced by NLP later.
+
+    The table (built-ins first, then config and plugin phrases in the order they
+    are added) is compiled into a single automaton on first use, so parse cost
+    does not grow with the vocabulary. When no phrase matches exactly, the best
+    fuzzy match scoring at least ``fuzzy_threshold`` is used (``None`` disables
+    the fallback).
+    """
+
+    def __init__(
+        self, phrases: Iterable[PhraseRule] = BUILTIN_PHRASES, fuzzy_threshold: float | None = None
+    ) -> None:
+        self._rules: List[PhraseRule] = list(phrases)
+        self._matcher: PhraseMatcher | None = None
+        self._fuzzy: FuzzyMatcher | None = None
+        self.fuzzy_threshold = fuzzy_threshold
+
+    def add_phrases(self, phrases: Mapping[str, str] | Iterable[PhraseRule]) -> None:
+        """Extend the table with ``{phrase: intent}`` entries or ready-made rules."""
+        if isinstance(phrases, Mapping):
+            phrases = [PhraseRule.from_entry(phrase, intent) for phrase, intent in phrases.items()]
+        self._rules.extend(phrases)
+        self._matcher = None
+        self._fuzzy = None
+
+    def compile(self) -> PhraseMatcher:
+        if self._matcher is None:
+            self._matcher = PhraseMatcher(self._rules)
+        if self._fuzzy is None and self.fuzzy_threshold is not None:
+            self._fuzzy = FuzzyMatcher(self._rules)
+        return self._matcher
 
     def parse(self, text: str) -> Optional[CommandIntent]:
-        normalized = text.strip().lower()
-
-        if any(p in normalized for p in ["open browser", "launch browser"]):
-            return CommandIntent(name="open_browser")
-        if normalized.startswith("open file"):
-            return CommandIntent(name="open_file", argument=normalized.removeprefix("open file").strip())
-        if any(p in normalized for p in ["shutdown pc", "shutdown computer", "power off"]):
-            return CommandIntent(name="shutdown_pc")
-        if any(p in normalized for p in ["play music", "start music"]):
-            return CommandIntent(name="play_music")
-        if any(p in normalized for p in ["switch window", "next window"]):
-            return CommandIntent(name="switch_window")
-        if normalized.startswith("type text"):
-            return CommandIntent(name="type_text", argument=normalized.removeprefix("type text").strip())
-
-        return None
+        normalized = normalize(text)
+        match = (self._matcher or self.compile()).match(normalized)
+        if match:
+            return self._intent(match.rule, normalized, match.end)
+        if self.fuzzy_threshold is None:
+            return None
+        candidates = self.suggest(normalized, k=1)
+        if not candidates or candidates[0].score < self.fuzzy_threshold:
+            return None
+        return self._intent(candidates[0].rule, normalized, candidates[0].end, candidates[0].score)
+
+    def parse_all(self, text: str) -> List[IntentStep]:
+        """Every command in a compound utterance such as "open browser and then type text hello", in order.
+
+        A segment that is not a command on its own continues the argument of
+        the command before it ("type text salt and pepper"), or is dropped.
+        """
+        normalized = normalize(text)
+        steps: List[IntentStep] = []
+        step_start = 0
+        separator, start = "", 0
+        for match in [*SEPARATORS.finditer(normalized), None]:
+            end = match.start() if match else len(normalized)
+            segment = normalized[start:end]
+            if segment:
+                intent = self.parse(segment)
+                if intent is not None:
+                    sequential = bool(steps) and separator not in CONCURRENT_SEPARATORS
+                    steps.append(IntentStep(intent, after_previous=sequential))
+                    step_start = start
+                elif steps and steps[-1].intent.argument is not None:
+                    extended = self.parse(normalized[step_start:end])
+                    if extended is not None and extended.name == steps[-1].intent.name:
+                        steps[-1] = IntentStep(extended, steps[-1].after_previous)
+            if match:
+                separator, start = match.group(1), match.end()
+        return steps
+
+    def suggest(self, text: str, k: int = 3) -> List[FuzzyMatch]:
+        """Top ``k`` approximate matches for ``text`` with their scores, whatever the threshold."""
+        if self._fuzzy is None:
+            self._fuzzy = FuzzyMatcher(self._rules)
+        return self._fuzzy.top(normalize(text), k)
+
+    @staticmethod
+    def _intent(rule: PhraseRule, normalized: str, end: int, confidence: float = 1.0) -> CommandIntent:
+        argument = normalized[end:].strip() if rule.prefix else None
+        return CommandIntent(name=rule.intent, argument=argument, confidence=confidence)
@@ -1,30 +1,115 @@
 from __future__ import annotations
 
 import logging
-from typing import Callable, Dict, Iterable
+from concurrent.futures import Future
+from dataclasses import dataclass
+from threading import Lock
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional
 
 from assistant.commands.parser import CommandIntent
 
 
-CommandHandler = Callable[[CommandIntent], None]
+# Handlers may return a Future for work they hand off (e.g. to the automation pool).
+CommandHandler = Callable[[CommandIntent], Any]
+
+
+class ActionRoute:
+    """Handler that builds an immutable action for an intent and hands it to ``run``.
+
+    Splitting the two lets a resolved command keep its prebuilt action and
+    skip ``build`` when the same utterance comes back.
+    """
+
+    __slots__ = ("build", "run")
+
+    def __init__(self, build: Callable[[CommandIntent], Any], run: Callable[[Any], Any]) -> None:
+        self.build = build
+        self.run = run
+
+    @classmethod
+    def constant(cls, action: Any, run: Callable[[Any], Any]) -> "ActionRoute":
+        """Route for an argument-free intent that always runs the same action instance."""
+        return cls(lambda _: action, run)
+
+    def __call__(self, intent: CommandIntent) -> Any:
+        return self.run(self.build(intent))
+
+
+@dataclass(slots=True, frozen=True)
+class ResolvedCommand:
+    """An intent bound to its handler (``None`` if unhandled) and, for action routes, its prebuilt action."""
+
+    intent: CommandIntent
+    handler: Optional[CommandHandler]
+    action: Any = None
+
+    def run(self) -> Any:
+        if self.handler is None:
+            raise LookupError(f"No handler registered for intent={self.intent.name}")
+        if self.action is not None:
+            return self.handler.run(self.action)  # type: ignore[attr-defined]
+        return self.handler(self.intent)
 
 
 class CommandRouter:
     def __init__(self) -> None:
         self._handlers: Dict[str, CommandHandler] = {}
+        self._write_lock = Lock()
+        self._listeners: List[Callable[[], None]] = []
         self._logger = logging.getLogger(self.__class__.__name__)
 
     def register(self, name: str, handler: CommandHandler) -> None:
-        self._handlers[name] = handler
+        self.swap((), {name: handler})
 
     def bulk_register(self, items: Iterable[tuple[str, CommandHandler]]) -> None:
         for name, handler in items:
             self.register(name, handler)
 
-    def dispatch(self, intent: CommandIntent) -> bool:
+    def on_change(self, listener: Callable[[], None]) -> None:
+        """Call ``listener`` after every change to the registrations (e.g. to drop cached resolutions)."""
+        self._listeners.append(listener)
+
+    def swap(self, remove: Iterable[str], add: Mapping[str, CommandHandler]) -> None:
+        """Replace a group of registrations at once.
+
+        Dispatchers see either the old or the new handler table, never a mix.
+        """
+        with self._write_lock:
+            handlers = dict(self._handlers)
+            for name in remove:
+                handlers.pop(name, None)
+            handlers.update(add)
+            self._handlers = handlers
+        for listener in self._listeners:
+            listener()
+
+    def names(self) -> List[str]:
+        return list(self._handlers)
+
+    def resolve(self, intent: CommandIntent) -> ResolvedCommand:
+        """Look up the handler for ``intent`` and, for action routes, prebuild its action."""
         handler = self._handlers.get(intent.name)
-        if not handler:
-            self._logger.warning("No handler registered for intent=%s", intent.name)
-            return False
-        handler(intent)
-        return True
+        action = handler.build(intent) if isinstance(handler, ActionRoute) else None
+        return ResolvedCommand(intent, handler, action)
+
+    def submit(self, intent: CommandIntent) -> Optional["Future[Any]"]:
+        """Run the handler for ``intent`` and return a future for its outcome (``None`` if unhandled).
+
+        Synchronous handlers are wrapped in an already-completed future.
+        """
+        return self.run(self.resolve(intent))
+
+    def run(self, resolved: ResolvedCommand) -> Optional["Future[Any]"]:
+        """Run an already resolved command; ``None`` if it has no handler."""
+        if resolved.handler is None:
+            self._logger.warning("No handler registered for intent=%s", resolved.intent.name)
+            return None
+        result = resolved.run()
+        if isinstance(result, Future):
+            return result
+        future: "Future[Any]" = Future()
+        future.set_result(result)
+        return future
+
+    def dispatch(self, intent: CommandIntent) -> bool:
+        return self.submit(intent) is not None
@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import asyncio
+import inspect
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional, Union
+
+from assistant.core.events import DEFAULT_LANES, AssistantEvent, EventBus, EventHandler, Lane, _LaneState
+
+AsyncEventHandler = Callable[[AssistantEvent], Awaitable[None]]
+AnyEventHandler = Union[EventHandler, AsyncEventHandler]
+
+
+class AsyncEventBus(EventBus):
+    """``EventBus`` whose lane workers are tasks on an asyncio event loop.
+
+    Lanes, routing, serialization keys, overflow policies and stats behave as
+    in the threaded bus, and ``publish`` can still be called from any thread.
+    Coroutine handlers are awaited on the loop; plain synchronous handlers
+    (the service manager's, plugins') run on a small executor so they cannot
+    stall it. Idle workers wait on an ``asyncio.Event`` and cost nothing until
+    an event arrives. ``aclose`` cancels the workers and waits for handlers
+    already running, so shutdown does not depend on join timeouts.
+    """
+
+    def __init__(
+        self,
+        lanes: Iterable[Lane] = DEFAULT_LANES,
+        routes: Optional[Dict[str, str]] = None,
+        shared_workers: int = 0,
+        default_lane: str = "default",
+        loop: asyncio.AbstractEventLoop | None = None,
+        handler_threads: int | None = None,
+    ) -> None:
+        super().__init__(lanes, routes, shared_workers, default_lane)
+        self._loop = loop
+        self._loop_thread: int | None = None
+        self._ready: asyncio.Event | None = None
+        # Set (under ``_cond``) when a worker found nothing to do and is about to wait on ``_ready``.
+        self._sleeping = False
+        self._tasks: List[asyncio.Task[None]] = []
+        self._handler_threads = handler_threads or max(
+            1, sum(state.spec.workers for state in self._lanes.values()) + shared_workers
+        )
+        self._executor: ThreadPoolExecutor | None = None
+
+    def subscribe(self, event_type: str, handler: AnyEventHandler) -> None:  # type: ignore[override]
+        self._handlers[event_type].append(handler)  # type: ignore[arg-type]
+
+    def start(self) -> None:
+        """Start the lane workers on the bus's loop (by default the one running in the calling thread)."""
+        with self._cond:
+            if self._running:
+                return
+            self._running = True
+        try:
+            running: asyncio.AbstractEventLoop | None = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        self._loop = self._loop or running
+        if self._loop is None:
+            raise RuntimeError("AsyncEventBus.start needs a running loop or one passed to the constructor")
+        self._executor = ThreadPoolExecutor(self._handler_threads, thread_name_prefix="event-handler")
+        if running is self._loop:
+            self._spawn_workers()
+        else:
+            self._loop.call_soon_threadsafe(self._spawn_workers)
+
+    def stop(self) -> None:
+        """Stop from any thread; off the loop this blocks until ``aclose`` has finished."""
+        loop = self._loop
+        if loop is None or not loop.is_running():
+            self._halt()
+            executor, self._executor = self._executor, None
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+            return
+        if self._on_loop():
+            loop.create_task(self.aclose())
+            return
+        asyncio.run_coroutine_threadsafe(self.aclose(), loop).result()
+
+    async def aclose(self) -> None:
+        """Cancel the lane workers and wait for the handlers they were running."""
+        tasks = self._halt()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            await asyncio.to_thread(executor.shutdown, True, cancel_futures=True)
+
+    def _halt(self) -> List[asyncio.Task[None]]:
+        with self._cond:
+            self._running = False
+            # Release publishers blocked on a full lane.
+            self._cond.notify_all()
+        tasks, self._tasks = self._tasks, []
+        return tasks
+
+    def _on_loop(self) -> bool:
+        return self._loop_thread is not None and self._loop_thread == threading.get_ident()
+
+    def _may_block(self) -> bool:
+        # Blocking the loop thread would also block the workers that make room.
+        return not self._on_loop()
+
+    def _wake(self) -> None:
+        self._cond.notify_all()
+        if not self._sleeping or self._ready is None or self._loop is None:
+            return
+        self._sleeping = False
+        if self._on_loop():
+            self._ready.set()
+        else:
+            self._loop.call_soon_threadsafe(self._ready.set)
+
+    def _spawn_workers(self) -> None:
+        assert self._loop is not None
+        self._loop_thread = threading.get_ident()
+        self._ready = asyncio.Event()
+        for state in self._lanes.values():
+            for index in range(max(state.spec.workers, 0)):
+                self._spawn_task(f"event-bus-{state.spec.name}-{index}", [state])
+        for index in range(self._shared_workers):
+            self._spawn_task(f"event-bus-shared-{index}", self._by_priority)
+        # Events published before the workers existed.
+        self._ready.set()
+
+    def _spawn_task(self, name: str, lanes: List[_LaneState]) -> None:
+        assert self._loop is not None
+        self._tasks.append(self._loop.create_task(self._work(lanes), name=name))
+
+    async def _work(self, lanes: List[_LaneState]) -> None:
+        assert self._ready is not None
+        while True:
+            with self._cond:
+                if not self._running:
+                    return
+                lane, pending = self._next(lanes)
+                if pending is None or lane is None:
+                    self._ready.clear()
+                    self._sleeping = True
+                else:
+                    # Wake publishers blocked on a full lane.
+                    self._cond.notify_all()
+            if pending is None or lane is None:
+                await self._ready.wait()
+                continue
+
+            started = self._begin(pending)
+            try:
+                await self._deliver_async(pending.event)
+            finally:
+                self._finish(lane, pending, started)
+
+    async def _deliver_async(self, event: AssistantEvent) -> None:
+        assert self._loop is not None
+        handlers = self._handlers.get(event.event_type, []) + self._handlers.get("*", [])
+        for handler in handlers:
+            try:
+                if inspect.iscoroutinefunction(handler):
+                    await handler(event)
+                else:
+                    await self._loop.run_in_executor(self._executor, handler, event)
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:  # noqa: BLE001
+                self._logger.exception("event handler failure: %s", exc)
@@ -1,22 +1,76 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional
 import json
 
 
 @dataclass(slots=True)
 class AssistantConfig:
     wake_word: str = "assistant"
+    wake_word_follow_up: float = 8.0
     language: str = "en-US"
     speech_rate: int = 180
     listen_timeout: int = 3
     phrase_time_limit: int = 5
+    voice_backend: str = "google"
+    vosk_model_path: str | None = None
+    voice_vad: str = "energy"
     gesture_camera_index: int = 0
+    # Camera indices and/or video file paths; empty means just ``gesture_camera_index``.
+    gesture_cameras: List[int | str] = field(default_factory=list)
+    gesture_max_hands: int = 2
+    # Combined inference frames per second across all cameras; null for no limit.
+    gesture_fps_budget: Optional[float] = 30.0
     gesture_confidence: float = 0.6
+    gesture_downscale: float = 1.0
+    gesture_roi_crop: bool = False
+    gesture_calibration: str | None = None
+    gesture_min_dwell: float = 0.15
+    gesture_cooldown: float = 0.75
+    gesture_hold_interval: float | None = None
+    # Extra {"gesture", "intent", "argument", "mode", "app"} rules on top of the built-in gesture mapping.
+    gesture_map: List[Dict[str, Any]] = field(default_factory=list)
+    # Active mode for mode-specific gesture rules.
+    mode: str = "default"
+    # Seconds the foreground app class is cached; it is only looked up when a gesture rule names an app.
+    foreground_ttl: float = 1.0
+    # Seconds without a hand, motion or speech before input drops to the idle tier; null keeps it active.
+    power_idle_after: Optional[float] = 30.0
+    power_sleep_after: float = 300.0
+    # Restart failed input services after restart_backoff seconds, doubling up to restart_backoff_max.
+    # After restart_circuit_threshold failures in a row a service is left alone for restart_circuit_cooldown.
+    supervise: bool = True
+    restart_backoff: float = 1.0
+    restart_backoff_max: float = 60.0
+    restart_circuit_threshold: int = 5
+    restart_circuit_cooldown: float = 300.0
     plugin_dir: str = "assistant/plugins"
+    plugin_manifest: str | None = None
+    automation_workers: int = 4
+    action_timeout: float = 30.0
+    launcher_helper: bool = False
+    hot_reload: bool = True
+    tracing: bool = True
+    trace_jsonl: str | None = None
+    metrics_port: int | None = None
+    record_path: str | None = None
+    # Directory for the command history log; null disables it. At most history_max_segments segments
+    # of history_segment_records commands each are kept.
+    history_dir: str | None = None
+    history_segment_records: int = 16384
+    history_max_segments: int = 8
+    # Always-on-top status window (needs Tk); redrawn at most overlay_fps times per second.
+    overlay: bool = False
+    overlay_fps: float = 10.0
+    reload_interval: float = 1.0
+    intent_cache_size: int = 256
+    intent_cache_ttl: float = 600.0
+    # Minimum fuzzy score for a misheard phrase to count; null disables fuzzy matching.
+    fuzzy_threshold: Optional[float] = 0.8
     command_map: Dict[str, str] = field(default_factory=dict)
+    pipelines: Dict[str, List[Dict[str, Any]]] = field(default_factory=dict)
 
     @classmethod
     def load(cls, path: str | Path) -> "AssistantConfig":
@@ -25,3 +79,11 @@ class AssistantConfig:
             return cls()
         data: Dict[str, Any] = json.loads(file_path.read_text(encoding="utf-8"))
         return cls(**data)
+
+    def diff(self, other: "AssistantConfig") -> Dict[str, Any]:
+        """Fields whose value in ``other`` differs from this config, with the new values."""
+        return {
+            item.name: getattr(other, item.name)
+            for item in fields(self)
+            if getattr(self, item.name) != getattr(other, item.name)
+        }
@@ -1,65 +1,286 @@
 from __future__ import annotations
 
 import logging
-from collections import defaultdict
-from dataclasses import dataclass, field
-from queue import Empty, Queue
-from threading import Event, Thread
+from collections import defaultdict, deque
+from dataclasses import dataclass, field, replace
+from enum import Enum
+from threading import Condition, Thread
 from time import perf_counter
-from typing import Any, Callable, Dict, List
+from typing import Any, Callable, Deque, Dict, Hashable, Iterable, List, Optional, Set
+
+from assistant.core import tracing
+from assistant.core.tracing import new_trace_id
 
 
 @dataclass(slots=True)
 class AssistantEvent:
-    """A typed event moving through the assistant system."""
+    """A typed event moving through the assistant system.
+
+    ``trace_id`` correlates the latency spans recorded for this event and the
+    work it triggers; ``origin`` is when the underlying input began (speech
+    start, frame capture), if known.
+    """
 
     event_type: str
     payload: Dict[str, Any] = field(default_factory=dict)
     source: str = "unknown"
     ts: float = field(default_factory=perf_counter)
+    trace_id: int = field(default_factory=new_trace_id)
+    origin: float | None = None
 
 
 EventHandler = Callable[[AssistantEvent], None]
+SerializationKey = Callable[[AssistantEvent], Hashable]
+
+
+class OverflowPolicy(str, Enum):
+    DROP_OLDEST = "drop_oldest"
+    COALESCE = "coalesce"
+    BLOCK = "block"
+
+
+@dataclass(slots=True, frozen=True)
+class Lane:
+    """Bounded queue with dedicated workers; lower priority value is served first by shared workers."""
+
+    name: str
+    priority: int = 10
+    workers: int = 1
+    maxsize: int = 256
+    overflow: OverflowPolicy = OverflowPolicy.DROP_OLDEST
+
+
+@dataclass(slots=True)
+class LaneStats:
+    depth: int = 0
+    published: int = 0
+    handled: int = 0
+    dropped: int = 0
+    coalesced: int = 0
+    latency_total: float = 0.0
+    latency_max: float = 0.0
+
+    @property
+    def latency_avg(self) -> float:
+        return self.latency_total / self.handled if self.handled else 0.0
+
+
+DEFAULT_LANES = (
+    Lane("gesture", priority=0, workers=1, maxsize=64, overflow=OverflowPolicy.COALESCE),
+    Lane("voice", priority=1, workers=1, maxsize=32, overflow=OverflowPolicy.BLOCK),
+    Lane("default", priority=5, workers=2, maxsize=256, overflow=OverflowPolicy.DROP_OLDEST),
+)
+
+DEFAULT_ROUTES = {
+    "gesture": "gesture",
+    "voice": "voice",
+}
+
+
+@dataclass(slots=True)
+class _Pending:
+    event: AssistantEvent
+    key: Optional[Hashable]
+
+
+class _LaneState:
+    __slots__ = ("spec", "queue", "in_flight", "stats")
+
+    def __init__(self, spec: Lane) -> None:
+        self.spec = spec
+        self.queue: Deque[_Pending] = deque()
+        self.in_flight: Set[Hashable] = set()
+        self.stats = LaneStats()
+
+    def take(self) -> Optional[_Pending]:
+        """Pop the oldest event whose serialization key is not already being handled."""
+        for index, pending in enumerate(self.queue):
+            if pending.key is None or pending.key not in self.in_flight:
+                del self.queue[index]
+                if pending.key is not None:
+                    self.in_flight.add(pending.key)
+                return pending
+        return None
 
 
 class EventBus:
-    """Thread-safe event bus with async dispatch."""
+    """Thread-safe event bus dispatching through bounded priority lanes.
+
+    Events are routed to a lane by exact event type or by namespace (the part
+    before the first dot). Each lane owns its workers, so a slow handler on one
+    lane never delays another. Event types registered with ``serialize`` are
+    handled strictly in publish order per key; everything else runs concurrently.
+    """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        lanes: Iterable[Lane] = DEFAULT_LANES,
+        routes: Optional[Dict[str, str]] = None,
+        shared_workers: int = 0,
+        default_lane: str = "default",
+    ) -> None:
         self._handlers: Dict[str, List[EventHandler]] = defaultdict(list)
-        self._queue: Queue[AssistantEvent] = Queue()
-        self._stop = Event()
-        self._worker: Thread | None = None
+        self._lanes: Dict[str, _LaneState] = {lane.name: _LaneState(lane) for lane in lanes}
+        if default_lane not in self._lanes:
+            self._lanes[default_lane] = _LaneState(Lane(default_lane))
+        self._by_priority = sorted(self._lanes.values(), key=lambda state: state.spec.priority)
+        self._default_lane = default_lane
+        self._routes: Dict[str, str] = dict(DEFAULT_ROUTES if routes is None else routes)
+        self._route_cache: Dict[str, _LaneState] = {}
+        self._serializers: Dict[str, SerializationKey] = {}
+        self._shared_workers = shared_workers
+        self._cond = Condition()
+        self._running = False
+        self._workers: List[Thread] = []
         self._logger = logging.getLogger(self.__class__.__name__)
 
     def subscribe(self, event_type: str, handler: EventHandler) -> None:
         self._handlers[event_type].append(handler)
 
+    def route(self, event_type: str, lane: str) -> None:
+        """Send an event type (or a whole namespace such as ``"voice"``) to ``lane``."""
+        if lane not in self._lanes:
+            raise KeyError(f"Unknown lane: {lane}")
+        with self._cond:
+            self._routes[event_type] = lane
+            self._route_cache.clear()
+
+    def serialize(self, event_type: str, key: Optional[SerializationKey] = None) -> None:
+        """Handle events of ``event_type`` one at a time per key (default: the event type itself)."""
+        self._serializers[event_type] = key or (lambda event: event.event_type)
+
     def publish(self, event: AssistantEvent) -> None:
-        self._queue.put(event)
+        lane = self._lane_for(event.event_type)
+        serializer = self._serializers.get(event.event_type)
+        key = serializer(event) if serializer else None
+        pending = _Pending(event, key)
+        spec = lane.spec
+
+        with self._cond:
+            lane.stats.published += 1
+            if len(lane.queue) >= spec.maxsize:
+                if spec.overflow is OverflowPolicy.BLOCK and self._may_block():
+                    while self._running and len(lane.queue) >= spec.maxsize:
+                        self._cond.wait()
+                elif spec.overflow is OverflowPolicy.COALESCE and self._coalesce(lane, pending):
+                    return
+                if len(lane.queue) >= spec.maxsize:
+                    lane.queue.popleft()
+                    lane.stats.dropped += 1
+            lane.queue.append(pending)
+            self._wake()
+
+    def stats(self) -> Dict[str, LaneStats]:
+        """Snapshot of per-lane queue depth, drop counts and handler latency."""
+        with self._cond:
+            return {name: replace(state.stats, depth=len(state.queue)) for name, state in self._lanes.items()}
+
+    def queue_depth(self, lane: Optional[str] = None) -> int:
+        with self._cond:
+            if lane is not None:
+                return len(self._lanes[lane].queue)
+            return sum(len(state.queue) for state in self._lanes.values())
 
     def start(self) -> None:
-        if self._worker and self._worker.is_alive():
-            return
-        self._stop.clear()
-        self._worker = Thread(target=self._run, name="event-bus", daemon=True)
-        self._worker.start()
+        with self._cond:
+            if self._running:
+                return
+            self._running = True
+        for state in self._lanes.values():
+            for index in range(max(state.spec.workers, 0)):
+                self._spawn(f"event-bus-{state.spec.name}-{index}", [state])
+        for index in range(self._shared_workers):
+            self._spawn(f"event-bus-shared-{index}", self._by_priority)
 
     def stop(self) -> None:
-        self._stop.set()
-        if self._worker:
-            self._worker.join(timeout=1.0)
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+        for worker in self._workers:
+            worker.join(timeout=1.0)
+        self._workers.clear()
+
+    def _spawn(self, name: str, lanes: List[_LaneState]) -> None:
+        worker = Thread(target=self._run, args=(lanes,), name=name, daemon=True)
+        self._workers.append(worker)
+        worker.start()
+
+    def _may_block(self) -> bool:
+        """Whether ``publish`` may wait for room in a full ``BLOCK`` lane on the calling thread."""
+        return True
+
+    def _wake(self) -> None:
+        """Tell idle workers there is work; called with ``_cond`` held."""
+        self._cond.notify_all()
+
+    def _lane_for(self, event_type: str) -> _LaneState:
+        lane = self._route_cache.get(event_type)
+        if lane is None:
+            name = self._routes.get(event_type) or self._routes.get(event_type.split(".", 1)[0], self._default_lane)
+            lane = self._lanes[name]
+            self._route_cache[event_type] = lane
+        return lane
+
+    def _coalesce(self, lane: _LaneState, pending: _Pending) -> bool:
+        event_type = pending.event.event_type
+        for index in range(len(lane.queue) - 1, -1, -1):
+            queued = lane.queue[index]
+            if queued.event.event_type == event_type and queued.key == pending.key:
+                lane.queue[index] = pending
+                lane.stats.coalesced += 1
+                return True
+        return False
+
+    def _run(self, lanes: List[_LaneState]) -> None:
+        while True:
+            with self._cond:
+                while True:
+                    if not self._running:
+                        return
+                    lane, pending = self._next(lanes)
+                    if pending is not None:
+                        break
+                    self._cond.wait()
+                # Wake publishers blocked on a full lane.
+                self._cond.notify_all()
+
+            started = self._begin(pending)
+            try:
+                self._deliver(pending.event)
+            finally:
+                self._finish(lane, pending, started)
+
+    @staticmethod
+    def _begin(pending: _Pending) -> float:
+        started = perf_counter()
+        tracing.tracer().record(pending.event.trace_id, "queue", started - pending.event.ts)
+        return started
+
+    def _finish(self, lane: _LaneState, pending: _Pending, started: float) -> None:
+        elapsed = perf_counter() - started
+        with self._cond:
+            if pending.key is not None:
+                lane.in_flight.discard(pending.key)
+            lane.stats.handled += 1
+            lane.stats.latency_total += elapsed
+            lane.stats.latency_max = max(lane.stats.latency_max, elapsed)
+            if pending.key is not None:
+                # Events held back behind this key can go now.
+                self._wake()
+
+    @staticmethod
+    def _next(lanes: List[_LaneState]) -> tuple[Optional[_LaneState], Optional[_Pending]]:
+        for lane in lanes:
+            if lane.queue:
+                pending = lane.take()
+                if pending is not None:
+                    return lane, pending
+        return None, None
 
-    def _run(self) -> None:
-        while not self._stop.is_set():
+    def _deliver(self, event: AssistantEvent) -> None:
+        handlers = self._handlers.get(event.event_type, []) + self._handlers.get("*", [])
+        for handler in handlers:
             try:
-                event = self._queue.get(timeout=0.1)
-            except Empty:
-                continue
-
-            handlers = self._handlers.get(event.event_type, []) + self._handlers.get("*", [])
-            for handler in handlers:
-                try:
-                    handler(event)
-                except Exception as exc:  # noqa: BLE001
-                    self._logger.exception("event handler failure: %s", exc)
+                handler(event)
+            except Exception as exc:  # noqa: BLE001
+                self._logger.exception("event handler failure: %s", exc)
@@ -0,0 +1,349 @@
+"""Persistent command history in append-only, memory-mapped segments.
+
+Each segment is a pair of files in the history directory::
+
+    NNNNNN.log  b"MDHL" version:u16 record_size:u16 count:u32, then ``capacity``
+                preallocated 32-byte records, written through mmap
+    NNNNNN.str  string arena: u16 length + UTF-8 bytes per string
+
+A record is::
+
+    ts:f64 intent:u32 argument:u32 source:u8 outcome:u8 pad:u16
+    dispatch:f32 execute:f32 total:f32
+
+``intent`` and ``argument`` are arena offsets (each intent name is stored
+once per segment, so its offset doubles as the intent id; ``argument`` is
+``NO_ARGUMENT`` when there is none). Latencies are seconds, NaN when a stage
+did not run. ``count`` is only advanced after the arena is flushed, so a
+crash loses at most the last unflushed batch and never leaves a record
+pointing past the arena. A full segment starts the next one and only the
+newest ``max_segments`` are kept, which bounds disk use.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import mmap
+import struct
+import time
+from collections import deque
+from dataclasses import dataclass
+from enum import IntEnum
+from pathlib import Path
+from threading import Event, Lock, Thread
+from typing import BinaryIO, Deque, Dict, Iterable, Iterator, List, Optional, Tuple
+
+MAGIC = b"MDHL"
+VERSION = 1
+NO_ARGUMENT = 0xFFFFFFFF
+# Longer arguments (dictated text) are truncated; the u16 length prefix allows up to 64 KiB.
+MAX_STRING_BYTES = 1024
+SOURCES = ("other", "voice", "gesture", "core")
+
+_HEADER = struct.Struct("<4sHHI")
+_RECORD = struct.Struct("<dIIBBxxfff")
+_LENGTH = struct.Struct("<H")
+_COUNT_OFFSET = 8
+
+
+class Outcome(IntEnum):
+    OK = 0
+    FAILED = 1
+    UNHANDLED = 2
+    CANCELLED = 3
+
+
+@dataclass(slots=True, frozen=True)
+class HistoryEntry:
+    ts: float
+    source: str
+    intent: str
+    argument: str | None = None
+    outcome: Outcome = Outcome.OK
+    dispatch: float = math.nan
+    execute: float = math.nan
+    total: float = math.nan
+
+
+@dataclass(slots=True)
+class IntentUsage:
+    count: int = 0
+    failures: int = 0
+    # Sum and number of known end-to-end latencies.
+    total_seconds: float = 0.0
+    timed: int = 0
+    last_ts: float = 0.0
+
+    @property
+    def mean_seconds(self) -> float:
+        return self.total_seconds / self.timed if self.timed else math.nan
+
+
+def _encode(text: str) -> bytes:
+    data = text.encode("utf-8")[:MAX_STRING_BYTES]
+    return data.decode("utf-8", "ignore").encode("utf-8")
+
+
+class _Segment:
+    """Writer for the newest segment."""
+
+    def __init__(self, log_path: Path, capacity: int) -> None:
+        self.log_path = log_path
+        self.arena_path = log_path.with_suffix(".str")
+        fresh = not log_path.exists()
+        with open(log_path, "ab") as file:
+            if fresh:
+                file.write(_HEADER.pack(MAGIC, VERSION, _RECORD.size, 0))
+                file.truncate(_HEADER.size + capacity * _RECORD.size)
+        self._file = open(log_path, "r+b")
+        self._map = mmap.mmap(self._file.fileno(), 0)
+        magic, version, record_size, self.count = _HEADER.unpack_from(self._map)
+        if magic != MAGIC or version != VERSION or record_size != _RECORD.size:
+            self.close()
+            raise ValueError(f"{log_path} is not a version {VERSION} history segment")
+        self.capacity = (len(self._map) - _HEADER.size) // _RECORD.size
+        self._arena: BinaryIO = open(self.arena_path, "ab")
+        self.arena_size = self._arena.tell()
+        # Intent name -> arena offset; rebuilt lazily when an existing segment is resumed.
+        self._interned: Dict[str, int] = {}
+
+    @property
+    def full(self) -> bool:
+        return self.count >= self.capacity
+
+    def append(self, entry: HistoryEntry) -> None:
+        intent = self._interned.get(entry.intent)
+        if intent is None:
+            intent = self._interned[entry.intent] = self._store(entry.intent)
+        argument = NO_ARGUMENT if entry.argument is None else self._store(entry.argument)
+        source = SOURCES.index(entry.source) if entry.source in SOURCES else 0
+        offset = _HEADER.size + self.count * _RECORD.size
+        latencies = (entry.dispatch, entry.execute, entry.total)
+        _RECORD.pack_into(self._map, offset, entry.ts, intent, argument, source, entry.outcome, *latencies)
+        self.count += 1
+
+    def commit(self) -> None:
+        """Make the records appended so far visible to readers."""
+        self._arena.flush()
+        struct.pack_into("<I", self._map, _COUNT_OFFSET, self.count)
+
+    def close(self) -> None:
+        if hasattr(self, "_arena"):
+            self._arena.close()
+        self._map.flush()
+        self._map.close()
+        self._file.close()
+
+    def _store(self, text: str) -> int:
+        data = _encode(text)
+        offset = self.arena_size
+        self._arena.write(_LENGTH.pack(len(data)) + data)
+        self.arena_size += _LENGTH.size + len(data)
+        return offset
+
+
+def read_segment(log_path: Path) -> List[HistoryEntry]:
+    """The committed records of one segment, oldest first."""
+    with open(log_path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as records:
+        magic, version, record_size, count = _HEADER.unpack_from(records)
+        if magic != MAGIC or version != VERSION or record_size != _RECORD.size:
+            raise ValueError(f"{log_path} is not a version {VERSION} history segment")
+        arena = log_path.with_suffix(".str").read_bytes()
+        strings: Dict[int, str] = {}
+
+        def string(offset: int) -> str:
+            text = strings.get(offset)
+            if text is None:
+                (length,) = _LENGTH.unpack_from(arena, offset)
+                start = offset + _LENGTH.size
+                text = strings[offset] = arena[start:start + length].decode("utf-8")
+            return text
+
+        entries = []
+        for ts, intent, argument, source, outcome, dispatch, execute, total in _RECORD.iter_unpack(
+            records[_HEADER.size:_HEADER.size + count * _RECORD.size]
+        ):
+            entries.append(
+                HistoryEntry(
+                    ts,
+                    SOURCES[source] if source < len(SOURCES) else "other",
+                    string(intent),
+                    None if argument == NO_ARGUMENT else string(argument),
+                    Outcome(outcome),
+                    dispatch,
+                    execute,
+                    total,
+                )
+            )
+        return entries
+
+
+class HistoryLog:
+    """Records which commands ran, how long they took and how they ended.
+
+    ``record`` only appends to an in-memory deque, so dispatch never waits on
+    disk: a writer thread moves pending entries into the segment every
+    ``flush_interval`` seconds. If more than ``max_pending`` entries pile up,
+    the oldest are dropped and counted in ``dropped``. Queries flush first and
+    then read the segments back through mmap.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        segment_records: int = 16384,
+        max_segments: int = 8,
+        arena_bytes: int = 1 << 20,
+        flush_interval: float = 0.5,
+        max_pending: int = 4096,
+    ) -> None:
+        if segment_records < 1 or max_segments < 1:
+            raise ValueError("segment_records and max_segments must be positive")
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._segment_records = segment_records
+        self._max_segments = max_segments
+        self._arena_bytes = arena_bytes
+        self._flush_interval = flush_interval
+        self._max_pending = max_pending
+        self._pending: Deque[HistoryEntry] = deque()
+        self._lock = Lock()
+        self._stop = Event()
+        self._thread: Thread | None = None
+        self.dropped = 0
+        self._logger = logging.getLogger(self.__class__.__name__)
+        segments = self.segments()
+        self._segment: _Segment | None = None
+        self._next_index = int(segments[-1].stem) + 1 if segments else 1
+        if segments:
+            try:
+                self._segment = _Segment(segments[-1], self._segment_records)
+            except (OSError, ValueError) as exc:
+                self._logger.warning("not resuming history segment %s: %s", segments[-1].name, exc)
+
+    def segments(self) -> List[Path]:
+        """Segment files, oldest first."""
+        return sorted(path for path in self.directory.glob("*.log") if path.stem.isdigit())
+
+    def record(self, entry: HistoryEntry) -> None:
+        """Queue ``entry`` for the writer thread; never blocks."""
+        self._pending.append(entry)
+        if len(self._pending) > self._max_pending:
+            try:
+                self._pending.popleft()
+                self.dropped += 1
+            except IndexError:
+                pass
+
+    def flush(self) -> int:
+        """Write all pending entries now; returns how many were written."""
+        with self._lock:
+            written = 0
+            while self._pending:
+                entry = self._pending.popleft()
+                segment = self._writable()
+                segment.append(entry)
+                written += 1
+            if written and self._segment is not None:
+                self._segment.commit()
+            return written
+
+    def entries(self, newest_first: bool = True) -> Iterator[HistoryEntry]:
+        """Every committed entry, across all segments."""
+        self.flush()
+        segments = self.segments()
+        for path in reversed(segments) if newest_first else segments:
+            try:
+                entries = read_segment(path)
+            except (OSError, ValueError, struct.error) as exc:
+                self._logger.warning("skipping history segment %s: %s", path.name, exc)
+                continue
+            yield from reversed(entries) if newest_first else entries
+
+    def last(
+        self, source: str | None = None, outcome: Outcome | None = Outcome.OK, exclude: Iterable[str] = ()
+    ) -> Optional[HistoryEntry]:
+        """The most recent entry matching the filters, e.g. for "repeat last command"."""
+        excluded = frozenset(exclude)
+        for entry in self.entries():
+            if source is not None and entry.source != source:
+                continue
+            if outcome is not None and entry.outcome is not outcome:
+                continue
+            if entry.intent not in excluded:
+                return entry
+        return None
+
+    def usage(self, since: float | None = None) -> Dict[str, IntentUsage]:
+        """Per-intent run counts, failures and mean end-to-end latency."""
+        stats: Dict[str, IntentUsage] = {}
+        for entry in self.entries(newest_first=False):
+            if since is not None and entry.ts < since:
+                continue
+            usage = stats.get(entry.intent)
+            if usage is None:
+                usage = stats[entry.intent] = IntentUsage()
+            usage.count += 1
+            usage.failures += entry.outcome is not Outcome.OK
+            if not math.isnan(entry.total):
+                usage.total_seconds += entry.total
+                usage.timed += 1
+            usage.last_ts = entry.ts
+        return stats
+
+    def ranking(self, half_life: float | None = 7 * 86400.0, now: float | None = None) -> List[Tuple[str, float]]:
+        """Intents by how often they ran successfully, most frequent first.
+
+        With ``half_life`` (seconds) each run counts less the older it is, so
+        habits that changed fade out; ``None`` ranks by plain counts.
+        """
+        now = time.time() if now is None else now
+        scores: Dict[str, float] = {}
+        for entry in self.entries(newest_first=False):
+            if entry.outcome is not Outcome.OK:
+                continue
+            weight = 1.0 if half_life is None else 0.5 ** (max(0.0, now - entry.ts) / half_life)
+            scores[entry.intent] = scores.get(entry.intent, 0.0) + weight
+        return sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+
+    def start(self) -> None:
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = Thread(target=self._run, name="history-writer", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=1)
+        self.flush()
+
+    def close(self) -> None:
+        self.stop()
+        with self._lock:
+            if self._segment is not None:
+                self._segment.close()
+                self._segment = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._flush_interval):
+            try:
+                self.flush()
+            except Exception as exc:  # noqa: BLE001
+                self._logger.warning("history flush failed: %s", exc)
+
+    def _writable(self) -> _Segment:
+        segment = self._segment
+        if segment is not None and not segment.full and segment.arena_size < self._arena_bytes:
+            return segment
+        if segment is not None:
+            segment.commit()
+            segment.close()
+        self._segment = _Segment(self.directory / f"{self._next_index:06d}.log", self._segment_records)
+        self._next_index += 1
+        for old in self.segments()[:-self._max_segments]:
+            old.unlink(missing_ok=True)
+            old.with_suffix(".str").unlink(missing_ok=True)
+        return self._segment
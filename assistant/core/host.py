@@ -0,0 +1,12 @@
+"""Facts about the host, resolved once per process and shared by the input and automation layers."""
+
+from __future__ import annotations
+
+import platform
+from functools import lru_cache
+
+
+@lru_cache(maxsize=1)
+def system() -> str:
+    """``platform.system()``, resolved once per process."""
+    return platform.system()
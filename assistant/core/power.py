@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import logging
+import time
+from dataclasses import dataclass
+from enum import Enum
+from threading import Event, Lock, Thread
+from typing import Callable, Dict, List, Mapping, Protocol
+
+from assistant.core import tracing
+from assistant.core.events import AssistantEvent, EventBus
+
+
+class PowerTier(str, Enum):
+    ACTIVE = "active"
+    IDLE = "idle"
+    SLEEP = "sleep"
+
+
+@dataclass(slots=True, frozen=True)
+class TierProfile:
+    """How hard the input services work in one tier; ``None`` rates leave the configured value alone."""
+
+    # Cap on the combined gesture inference rate.
+    gesture_fps: float | None = None
+    # Cap on each camera's capture rate.
+    capture_fps: float | None = None
+    # Extra factor applied on top of ``gesture_downscale``.
+    downscale: float = 1.0
+    # Replace hand inference with frame differencing; motion wakes the governor.
+    motion_only: bool = False
+    # Run the voice activity detector on every n-th chunk while waiting for speech.
+    vad_stride: int = 1
+    # Seconds the whole-phrase (google) voice backend waits after a listen that heard no command.
+    listen_pause: float = 0.0
+
+
+DEFAULT_PROFILES: Dict[PowerTier, TierProfile] = {
+    PowerTier.ACTIVE: TierProfile(),
+    PowerTier.IDLE: TierProfile(gesture_fps=10.0, capture_fps=15.0, downscale=0.5, vad_stride=2, listen_pause=0.5),
+    PowerTier.SLEEP: TierProfile(gesture_fps=4.0, capture_fps=4.0, motion_only=True, vad_stride=4, listen_pause=2.0),
+}
+
+
+class PowerAware(Protocol):
+    def set_tier(self, tier: PowerTier, profile: TierProfile) -> None: ...
+
+
+@dataclass(slots=True)
+class TierUsage:
+    wall_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+
+    @property
+    def cpu_percent(self) -> float:
+        """Process CPU time over wall time spent in the tier (100 = one core busy)."""
+        return 100.0 * self.cpu_seconds / self.wall_seconds if self.wall_seconds else 0.0
+
+
+class ActivityGovernor:
+    """Moves the input services between power tiers as the user comes and goes.
+
+    ``activity`` (a hand in view, speech, motion in a sleeping camera) returns
+    every registered service to ``ACTIVE`` at once. Without activity for
+    ``idle_after`` seconds they drop to ``IDLE``, and after ``sleep_after`` to
+    ``SLEEP``. Each change is published as a ``power.tier`` event, and process
+    CPU time is accounted to the tier it was spent in.
+    """
+
+    def __init__(
+        self,
+        bus: EventBus | None = None,
+        idle_after: float = 30.0,
+        sleep_after: float = 300.0,
+        profiles: Mapping[PowerTier, TierProfile] = DEFAULT_PROFILES,
+        clock: Callable[[], float] = time.monotonic,
+        cpu_clock: Callable[[], float] = time.process_time,
+    ) -> None:
+        if sleep_after < idle_after:
+            raise ValueError("sleep_after must not be shorter than idle_after")
+        self._bus = bus
+        self._idle_after = idle_after
+        self._sleep_after = sleep_after
+        self._profiles = dict(profiles)
+        self._clock = clock
+        self._cpu_clock = cpu_clock
+        self._services: List[PowerAware] = []
+        self._lock = Lock()
+        self._tier = PowerTier.ACTIVE
+        self._last_activity = clock()
+        self._entered = (self._last_activity, cpu_clock())
+        self._usage: Dict[PowerTier, TierUsage] = {tier: TierUsage() for tier in PowerTier}
+        self._stop = Event()
+        # Set on every tier change so the timer thread recomputes its next deadline.
+        self._changed = Event()
+        self._thread: Thread | None = None
+        self._logger = logging.getLogger(self.__class__.__name__)
+
+    @property
+    def tier(self) -> PowerTier:
+        return self._tier
+
+    def register(self, service: PowerAware) -> None:
+        """Add a service and put it in the current tier."""
+        with self._lock:
+            self._services.append(service)
+            service.set_tier(self._tier, self._profiles[self._tier])
+
+    def activity(self, source: str) -> None:
+        """Note that the user is present; safe to call on every frame from any thread."""
+        self._last_activity = self._clock()
+        if self._tier is not PowerTier.ACTIVE:
+            self._enter(PowerTier.ACTIVE, source)
+
+    def tick(self) -> PowerTier:
+        """Drop to a lower tier if the user has been away long enough; returns the current tier."""
+        away = self._clock() - self._last_activity
+        if away >= self._sleep_after:
+            target = PowerTier.SLEEP
+        elif away >= self._idle_after:
+            target = PowerTier.IDLE
+        else:
+            target = PowerTier.ACTIVE
+        # Only activity wakes the services up; a tick never raises the tier.
+        if target is not self._tier and target is not PowerTier.ACTIVE:
+            self._enter(target, "inactivity")
+        return self._tier
+
+    def usage(self) -> Dict[PowerTier, TierUsage]:
+        """Wall and CPU time per tier so far, including the current one."""
+        with self._lock:
+            self._account()
+            return {tier: TierUsage(usage.wall_seconds, usage.cpu_seconds) for tier, usage in self._usage.items()}
+
+    def start(self) -> None:
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = Thread(target=self._run, name="power-governor", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._changed.set()
+        if self._thread:
+            self._thread.join(timeout=1)
+
+    def _next_deadline(self) -> float | None:
+        """Seconds until the next tier could drop, or ``None`` while asleep."""
+        if self._tier is PowerTier.SLEEP:
+            return None
+        limit = self._idle_after if self._tier is PowerTier.ACTIVE else self._sleep_after
+        return max(0.0, limit - (self._clock() - self._last_activity))
+
+    def _run(self) -> None:
+        # Sleeps until the earliest moment the tier could change instead of polling;
+        # activity only moves the deadline later, which is checked when it expires.
+        while not self._stop.is_set():
+            self._changed.clear()
+            self._changed.wait(self._next_deadline())
+            if not self._stop.is_set():
+                self.tick()
+
+    def _account(self) -> None:
+        now, cpu = self._clock(), self._cpu_clock()
+        usage = self._usage[self._tier]
+        usage.wall_seconds += now - self._entered[0]
+        usage.cpu_seconds += cpu - self._entered[1]
+        self._entered = (now, cpu)
+
+    def _enter(self, tier: PowerTier, reason: str) -> None:
+        with self._lock:
+            previous = self._tier
+            if tier is previous:
+                return
+            self._account()
+            self._tier = tier
+            self._changed.set()
+            profile = self._profiles[tier]
+            for service in self._services:
+                try:
+                    service.set_tier(tier, profile)
+                except Exception as exc:  # noqa: BLE001
+                    self._logger.warning("%s could not enter %s: %s", type(service).__name__, tier.value, exc)
+            spent = self._usage[previous]
+        self._logger.info("power %s -> %s (%s)", previous.value, tier.value, reason)
+        tracing.tracer().increment(f"power.{tier.value}")
+        if self._bus is not None:
+            self._bus.publish(
+                AssistantEvent(
+                    event_type="power.tier",
+                    payload={
+                        "tier": tier.value,
+                        "previous": previous.value,
+                        "reason": reason,
+                        "previous_cpu_percent": round(spent.cpu_percent, 1),
+                    },
+                    source="power",
+                )
+            )
@@ -1,7 +1,13 @@
 from __future__ import annotations
 
+import asyncio
 import logging
-from threading import Event
+from collections import OrderedDict
+from concurrent.futures import Future
+from pathlib import Path
+from threading import Event, Lock, Thread
+from time import perf_counter, time
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple
 
 from assistant.automation.actions import (
     OpenBrowserAction,
@@ -12,106 +18,838 @@ from assistant.automation.actions import (
     TypeTextAction,
 )
 from assistant.automation.engine import AutomationEngine
-from assistant.commands.parser import CommandIntent, RuleBasedCommandParser
-from assistant.commands.router import CommandRouter
+from assistant.automation.executor import ActionExecutor
+from assistant.automation.launcher import HelperProcessLauncher, Launcher, use_launcher
+from assistant.automation.pipeline import (
+    ActionFactory,
+    Pipeline,
+    PipelineResult,
+    PipelineRun,
+    PipelineStep,
+    StepStatus,
+)
+from assistant.commands.cache import IntentCache
+from assistant.commands.gesture_map import GestureMap
+from assistant.commands.parser import CommandIntent, IntentStep, RuleBasedCommandParser, is_compound
+from assistant.commands.router import ActionRoute, CommandRouter, ResolvedCommand
+from assistant.core import tracing
+from assistant.core.async_bus import AsyncEventBus
 from assistant.core.config import AssistantConfig
 from assistant.core.events import AssistantEvent, EventBus
+from assistant.core.history import HistoryEntry, HistoryLog, Outcome
+from assistant.core.power import ActivityGovernor
+from assistant.core.startup import CommandGate, StartupProfile
+from assistant.core.supervisor import Backoff, Supervisor
+from assistant.core.watcher import FileWatcher
 from assistant.feedback.feedback import FeedbackManager, FeedbackMessage
+from assistant.input.asr import AudioSource, MicrophoneSource, StreamingRecognizer
+from assistant.input.foreground import ForegroundApp
+from assistant.input.gesture_debounce import GestureDebouncer
 from assistant.input.gesture_input import GestureInputService
 from assistant.input.voice_input import VoiceInputService
+from assistant.replay.recording import Recorder, RecordingAudioSource
+from assistant.ui.overlay import Overlay
+
+
+HISTORY_PHRASES = {"repeat last command": "repeat_last", "do that again": "repeat_last"}
+
+
+def _same(value: Any) -> Any:
+    return value
+
+
+def _ignore(_value: Any) -> None:
+    return None
+
+
+def _submit_inline(name: str, fn: Callable[[], Any], timeout: float | None) -> "Future[Any]":
+    """Pipeline ``submit`` for steps that hand their work off themselves (handlers return futures)."""
+    try:
+        result = fn()
+    except Exception as exc:  # noqa: BLE001
+        future: "Future[Any]" = Future()
+        future.set_exception(exc)
+        return future
+    if isinstance(result, Future):
+        return result
+    future = Future()
+    future.set_result(result)
+    return future
+
+
+def _outcome(future: "Future[Any]") -> Outcome:
+    if future.cancelled():
+        return Outcome.CANCELLED
+    if future.exception() is not None:
+        return Outcome.FAILED
+    result = future.result()
+    return Outcome.FAILED if isinstance(result, PipelineResult) and not result.succeeded else Outcome.OK
 
 
 class ServiceManager:
-    def __init__(self, config: AssistantConfig) -> None:
+    def __init__(
+        self,
+        config: AssistantConfig,
+        config_path: str | Path | None = None,
+        bus: EventBus | None = None,
+        startup: StartupProfile | None = None,
+        feedback: FeedbackManager | None = None,
+        audio_source_factory: Callable[[], AudioSource] | None = None,
+        recognizer_factory: Callable[[int], StreamingRecognizer] | None = None,
+        debouncer_factory: Callable[[], GestureDebouncer] | None = None,
+    ) -> None:
+        # The optional factories replace the input services' microphone, speech recognizer and gesture
+        # debouncer; the replay driver feeds recorded sessions through them.
         self.config = config
-        self.bus = EventBus()
-        self.parser = RuleBasedCommandParser()
+        # Stage timings, reported in full at readiness when it is passed in (--profile-startup).
+        self.startup = startup or StartupProfile()
+        self._report_startup = startup is not None
+        self.startup.begin("init")
+        self._config_path = config_path
+        # Fork the launcher helper first, while the process is still small and single-threaded.
+        self._launcher: Launcher | None = None
+        if config.launcher_helper:
+            self._launcher = HelperProcessLauncher()
+            use_launcher(self._launcher)
+        self.tracer = tracing.Tracer(enabled=config.tracing, jsonl_path=config.trace_jsonl)
+        # Services record into the process-wide tracer; the previous one is put back on shutdown.
+        self._previous_tracer = tracing.use_tracer(self.tracer)
+        self.bus = bus or EventBus()
+        self.parser = RuleBasedCommandParser(fuzzy_threshold=config.fuzzy_threshold)
         self.router = CommandRouter()
-        self.automation = AutomationEngine()
-        self.feedback = FeedbackManager(speech_rate=config.speech_rate)
+        self.intent_cache = IntentCache(config.intent_cache_size, config.intent_cache_ttl)
+        self.router.on_change(self.intent_cache.invalidate)
+        self.gesture_map = GestureMap.from_config(config.gesture_map)
+        self.foreground = ForegroundApp(ttl=config.foreground_ttl)
+        # ((mode, app), {gesture: resolved command}) for the context of the last gesture.
+        self._gesture_commands: Tuple[Tuple[str, Optional[str]], Dict[str, ResolvedCommand]] | None = None
+        self.router.on_change(self._invalidate_gestures)
+        self.automation = AutomationEngine(
+            ActionExecutor(max_workers=config.automation_workers, default_timeout=config.action_timeout)
+        )
+        self.feedback = feedback or FeedbackManager(speech_rate=config.speech_rate)
+        # Records audio, landmarks and events for headless replay (see assistant/replay).
+        self.recorder = Recorder(config.record_path) if config.record_path else None
+        self.history: HistoryLog | None = None
+        if config.history_dir:
+            self.history = HistoryLog(
+                config.history_dir,
+                segment_records=config.history_segment_records,
+                max_segments=config.history_max_segments,
+            )
+        # Fed from the bus wildcard; command.* events are only published while it is enabled.
+        self.overlay = Overlay(self.bus, fps=config.overlay_fps) if config.overlay else None
+        self.power: ActivityGovernor | None = None
+        if config.power_idle_after is not None:
+            self.power = ActivityGovernor(self.bus, config.power_idle_after, config.power_sleep_after)
+        activity = self.power.activity if self.power else None
+        # Restarts voice or gesture input when its loop fails (device unplugged, backend error).
+        self.supervisor: Supervisor | None = None
+        if config.supervise:
+            self.supervisor = Supervisor(
+                self.bus,
+                backoff=Backoff(initial=config.restart_backoff, maximum=config.restart_backoff_max),
+                failure_threshold=config.restart_circuit_threshold,
+                cooldown=config.restart_circuit_cooldown,
+            )
         self.voice = VoiceInputService(
             self.bus,
             language=config.language,
             timeout=config.listen_timeout,
             phrase_time_limit=config.phrase_time_limit,
+            backend=config.voice_backend,
+            vosk_model_path=config.vosk_model_path,
+            vad=config.voice_vad,
+            wake_word=config.wake_word,
+            wake_follow_up=config.wake_word_follow_up,
+            source_factory=audio_source_factory
+            or (self._recording_microphone if self.recorder and config.voice_backend != "google" else None),
+            recognizer_factory=recognizer_factory,
+            on_activity=activity,
+            on_ready=lambda ok: self._service_ready("voice", ok),
+            on_exit=lambda error: self._service_exited("voice", error),
         )
         self.gesture = GestureInputService(
             self.bus,
-            camera_index=config.gesture_camera_index,
+            cameras=config.gesture_cameras or [config.gesture_camera_index],
             min_confidence=config.gesture_confidence,
+            downscale=config.gesture_downscale,
+            roi_crop=config.gesture_roi_crop,
+            calibration_path=config.gesture_calibration,
+            debouncer_factory=debouncer_factory
+            or (
+                lambda: GestureDebouncer(
+                    min_dwell=config.gesture_min_dwell,
+                    cooldown=config.gesture_cooldown,
+                    hold_interval=config.gesture_hold_interval,
+                )
+            ),
+            landmark_sink=self.recorder.landmarks if self.recorder else None,
+            max_hands=config.gesture_max_hands,
+            fps_budget=config.gesture_fps_budget,
+            on_activity=activity,
+            on_ready=lambda ok: self._service_ready("gesture", ok),
+            on_exit=lambda error: self._service_exited("gesture", error),
         )
+        if self.supervisor:
+            self.supervisor.add("voice", self.voice)
+            self.supervisor.add("gesture", self.gesture)
+        if self.power:
+            self.power.register(self.voice)
+            self.power.register(self.gesture)
         self._stop = Event()
+        # Utterances a partial transcript already acted on: id -> (intent name, its future).
+        self._acted_utterances: "OrderedDict[int, Tuple[str, Future[Any] | None]]" = OrderedDict()
+        self._plugin_intents: Set[str] = set()
+        self._config_pipelines: Set[str] = set()
+        self._watcher = FileWatcher(config.reload_interval) if config.hot_reload else None
+        # Command events wait here until pipelines, plugins and the parser are loaded.
+        self._gate = CommandGate()
+        self._warming: Set[str] = set()
+        self._warming_lock = Lock()
         self._logger = logging.getLogger(self.__class__.__name__)
+        self.startup.end("init")
 
     def configure(self) -> None:
+        """Register every route and subscription at once (startup loads the extensions in the background)."""
+        self._configure_core()
+        self._load_extensions()
+
+    def _configure_core(self) -> None:
+        """The cheap part of ``configure``: built-in routes and the bus subscriptions."""
+        run = self.automation.execute
         self.router.bulk_register(
             [
-                ("open_browser", lambda _: self.automation.execute(OpenBrowserAction())),
-                ("open_file", lambda intent: self.automation.execute(OpenFileAction(intent.argument or ""))),
-                ("shutdown_pc", lambda _: self.automation.execute(ShutdownPCAction())),
-                ("play_music", lambda _: self.automation.execute(PlayMusicAction())),
-                ("switch_window", lambda _: self.automation.execute(SwitchWindowAction(self._logger))),
-                ("type_text", lambda intent: self.automation.execute(TypeTextAction(intent.argument or "", self._logger))),
+                ("open_browser", ActionRoute.constant(OpenBrowserAction(), run)),
+                ("open_file", ActionRoute(lambda intent: OpenFileAction(intent.argument or ""), run)),
+                ("shutdown_pc", ActionRoute.constant(ShutdownPCAction(), run)),
+                ("play_music", ActionRoute.constant(PlayMusicAction(), run)),
+                ("switch_window", ActionRoute.constant(SwitchWindowAction(self._logger), run)),
+                ("type_text", ActionRoute(lambda intent: TypeTextAction(intent.argument or "", self._logger), run)),
             ]
         )
 
         self.automation.register_pipeline(
             "summary_flow",
-            [
-                OpenFileAction("~/notes.txt"),
-                TypeTextAction("Summarize my notes", self._logger),
-            ],
+            Pipeline(
+                "summary_flow",
+                [
+                    PipelineStep("open_notes", OpenFileAction("~/notes.txt"), retries=1),
+                    PipelineStep("announce", lambda _: self.feedback.speak("Summarizing your notes"), required=False),
+                    PipelineStep(
+                        "type_prompt",
+                        TypeTextAction("Summarize my notes", self._logger),
+                        depends_on=("open_notes",),
+                    ),
+                ],
+            ),
+        )
+        self.router.register("summary_flow", lambda _: self.automation.start_pipeline("summary_flow"))
+        if self.history:
+            self.router.register("repeat_last", self._repeat_last)
+
+        self.bus.serialize("voice.text")
+        self.bus.serialize("voice.partial", key=lambda _: "voice.text")
+        self.bus.serialize("gesture.detected")
+        if self.recorder:
+            self.bus.subscribe("*", self.recorder.event)
+        if self.overlay:
+            self.bus.subscribe("*", self.overlay.on_event)
+        self.bus.subscribe("voice.partial", self._gate.wrap(self._on_voice_partial))
+        self.bus.subscribe("voice.text", self._gate.wrap(self._on_voice_text))
+        self.bus.subscribe("gesture.detected", self._gate.wrap(self._on_gesture))
+
+    def _load_extensions(self) -> None:
+        """Config pipelines, plugins and the full phrase table; then held commands are replayed."""
+        try:
+            self._register_pipelines(self.config.pipelines)
+            plugins = self.automation.load_plugins(self.config.plugin_dir, manifest_path=self.config.plugin_manifest)
+            self._register_plugins(plugins)
+            self._rebuild_parser()
+        finally:
+            held = self._gate.open()
+            if held:
+                self._logger.info("replayed %d command(s) received during startup", held)
+
+    def _register_pipelines(self, pipelines: Dict[str, List[Dict[str, Any]]]) -> None:
+        self._install_pipelines(self._build_pipelines(pipelines))
+
+    def _build_pipelines(self, pipelines: Dict[str, List[Dict[str, Any]]]) -> Dict[str, Pipeline]:
+        factories = self.action_factories()
+        return {name: Pipeline.from_config(name, spec, factories) for name, spec in pipelines.items()}
+
+    def _install_pipelines(self, built: Dict[str, Pipeline]) -> None:
+        for name in self._config_pipelines - built.keys():
+            self.automation.remove_pipeline(name)
+        for name, pipeline in built.items():
+            self.automation.register_pipeline(name, pipeline)
+        self.router.swap(
+            self._config_pipelines,
+            {name: (lambda _, name=name: self.automation.start_pipeline(name)) for name in built},
+        )
+        self._config_pipelines = set(built)
+
+    def _register_plugins(self, hooks: Dict[str, Callable[[], Any]]) -> None:
+        self.router.swap(
+            self._plugin_intents,
+            {name: (lambda _, name=name, cb=callback: self.automation.submit(name, cb)) for name, callback in hooks.items()},
         )
+        self._plugin_intents = set(hooks)
 
-        plugins = self.automation.load_plugins(self.config.plugin_dir)
-        for name, callback in plugins.items():
-            self.router.register(name, lambda _, cb=callback: cb())
+    def _rebuild_parser(self) -> None:
+        parser = RuleBasedCommandParser(fuzzy_threshold=self.config.fuzzy_threshold)
+        if self.history:
+            parser.add_phrases(HISTORY_PHRASES)
+        parser.add_phrases(self.config.command_map)
+        parser.add_phrases(self.automation.plugin_phrases)
+        parser.compile()
+        self.parser = parser
+        self.intent_cache.invalidate()
 
-        self.bus.subscribe("voice.text", self._on_voice_text)
-        self.bus.subscribe("gesture.detected", self._on_gesture)
+    def resolve(self, text: str) -> Optional[ResolvedCommand]:
+        """Parse ``text`` and bind it to its handler, through the intent cache."""
+        return self.intent_cache.resolve(text, self._resolve_uncached)
+
+    def _resolve_uncached(self, normalized: str) -> Optional[ResolvedCommand]:
+        intent = self.parser.parse(normalized)
+        return self.router.resolve(intent) if intent else None
+
+    def reload_plugins(self, _changed: List[Path] | None = None) -> bool:
+        """Pick up added, edited or removed plugins without restarting any service."""
+        hooks = self.automation.reload_plugins()
+        if hooks is None:
+            return False
+        self._register_plugins(hooks)
+        self._rebuild_parser()
+        self._logger.info("plugins reloaded: %s", ", ".join(sorted(hooks)) or "none")
+        self.bus.publish(AssistantEvent("plugins.reloaded", {"hooks": sorted(hooks)}, source="core"))
+        return True
+
+    def reload_config(self, _changed: List[Path] | None = None) -> Dict[str, Any]:
+        """Apply changed config fields to the services that use them; returns the applied changes.
+
+        All changed fields are validated (pipelines and the gesture map are
+        built) before any is applied, and a failure while applying rolls the
+        applied ones back, so the config is never left half-applied. Failures
+        publish ``config.error``.
+        """
+        if not self._config_path:
+            return {}
+        try:
+            latest = AssistantConfig.load(self._config_path)
+        except (OSError, ValueError, TypeError) as exc:
+            self._reload_failed(exc)
+            return {}
+        # field -> (build the new value, raising if it is invalid; apply what was built)
+        reloaders: Dict[str, Tuple[Callable[[Any], Any], Callable[[Any], None]]] = {
+            "speech_rate": (_same, self.feedback.set_speech_rate),
+            "gesture_confidence": (_same, self.gesture.set_min_confidence),
+            "command_map": (_same, _ignore),  # parser is rebuilt below
+            "fuzzy_threshold": (_same, _ignore),
+            "pipelines": (self._build_pipelines, self._install_pipelines),
+            "gesture_map": (GestureMap.from_config, self._swap_gesture_map),
+            "mode": (_same, self.set_mode),
+        }
+        changes = self.config.diff(latest)
+        restart = [name for name in changes if name not in reloaders]
+        changes = {name: value for name, value in changes.items() if name in reloaders}
+        try:
+            built = {name: reloaders[name][0](value) for name, value in changes.items()}
+        except Exception as exc:  # noqa: BLE001
+            self._reload_failed(exc)
+            return {}
+        previous = {name: getattr(self.config, name) for name in changes}
+        applied: Dict[str, Any] = {}
+        try:
+            for name, value in changes.items():
+                reloaders[name][1](built[name])
+                setattr(self.config, name, value)
+                applied[name] = value
+            if "command_map" in applied or "fuzzy_threshold" in applied:
+                self._rebuild_parser()
+        except Exception as exc:  # noqa: BLE001
+            # The previous values were in use a moment ago, so rebuilding them does not fail.
+            for name in reversed(list(applied)):
+                reloaders[name][1](reloaders[name][0](previous[name]))
+                setattr(self.config, name, previous[name])
+            if "command_map" in applied or "fuzzy_threshold" in applied:
+                self._rebuild_parser()
+            self._reload_failed(exc)
+            return {}
+        if restart:
+            self._logger.warning("config changes need a restart: %s", ", ".join(restart))
+        if applied or restart:
+            self.bus.publish(
+                AssistantEvent("config.changed", {"fields": sorted(applied), "restart_required": restart}, source="core")
+            )
+        return applied
+
+    def _reload_failed(self, exc: BaseException) -> None:
+        self._logger.warning("config not reloaded: %s", exc)
+        self.bus.publish(AssistantEvent("config.error", {"error": str(exc)}, source="core"))
+
+    def set_mode(self, mode: str) -> None:
+        """Switch the active mode, which selects the mode-specific gesture rules."""
+        if mode == self.config.mode:
+            return
+        previous, self.config.mode = self.config.mode, mode
+        self._invalidate_gestures()
+        self._logger.info("mode %s -> %s", previous, mode)
+        self.bus.publish(AssistantEvent("mode.changed", {"mode": mode, "previous": previous}, source="core"))
+
+    def _swap_gesture_map(self, gesture_map: GestureMap) -> None:
+        self.gesture_map = gesture_map
+        self._invalidate_gestures()
+
+    def _invalidate_gestures(self) -> None:
+        self._gesture_commands = None
+
+    def gesture_commands(self) -> Dict[str, ResolvedCommand]:
+        """Resolved commands for each gesture in the current mode and foreground app.
+
+        Rebuilt only when the context, the mapping or the routes change.
+        """
+        gesture_map = self.gesture_map
+        context = (self.config.mode, self.foreground.current() if gesture_map.uses_apps else None)
+        cached = self._gesture_commands
+        if cached is None or cached[0] != context:
+            table = gesture_map.table(*context)
+            cached = (context, {gesture: self.router.resolve(intent) for gesture, intent in table.items()})
+            self._gesture_commands = cached
+        return cached[1]
+
+    def action_factories(self) -> Dict[str, ActionFactory]:
+        """Actions that config-defined pipelines may reference by name."""
+        return {
+            "open_browser": OpenBrowserAction,
+            "open_file": OpenFileAction,
+            "play_music": PlayMusicAction,
+            "switch_window": lambda: SwitchWindowAction(self._logger),
+            "type_text": lambda text: TypeTextAction(str(text), self._logger),
+            "speak": lambda text: self.feedback.speak(str(text)),
+        }
 
     def start(self) -> None:
-        self.configure()
+        self._start_core()
         self.bus.start()
+        self._start_inputs()
+
+    def stop(self) -> None:
+        if self.supervisor:
+            self.supervisor.stop()
+        for stop_input in self._input_stoppers():
+            stop_input()
+        self.bus.stop()
+        self._shutdown()
+
+    async def run(self, stop: asyncio.Event) -> None:
+        """Serve on the running event loop until ``stop`` is set (the asyncio runtime).
+
+        Blocking startup work runs on a worker thread. On shutdown the input
+        services stop concurrently, then the bus is closed on the loop and
+        the remaining services are shut down.
+        """
+        await asyncio.to_thread(self._start_core)
+        self.bus.start()
+        self._start_inputs()
+        try:
+            await stop.wait()
+        finally:
+            # Stopped first and on its own, so no input is restarted while the others stop.
+            if self.supervisor:
+                await asyncio.to_thread(self.supervisor.stop)
+            await asyncio.gather(*(asyncio.to_thread(stop_input) for stop_input in self._input_stoppers()))
+            if isinstance(self.bus, AsyncEventBus):
+                await self.bus.aclose()
+            else:
+                await asyncio.to_thread(self.bus.stop)
+            await asyncio.to_thread(self._shutdown)
+
+    def _start_core(self) -> None:
+        with self.startup.stage("core"):
+            self._configure_core()
+        if self.gesture_map.uses_apps:
+            self.foreground.current()  # starts the first probe, so the first gesture already sees the app
+        if self._watcher:
+            if self._config_path:
+                self._watcher.watch(self._config_path, self.reload_config)
+            self._watcher.watch(self.config.plugin_dir, self.reload_plugins)
+            self._watcher.start()
+        if self.config.metrics_port is not None:
+            port = self.tracer.serve(self.config.metrics_port)
+            self._logger.info("metrics at http://127.0.0.1:%d/metrics", port)
+
+    def _start_inputs(self) -> None:
+        """Start the input services and warm up the slow backends in parallel.
+
+        Commands load on a ``warm-up`` thread; the TTS engine, MediaPipe
+        graphs and microphone calibration warm up on their services' own
+        threads. Each publishes ``service.ready`` when done; once all have,
+        the assistant announces itself.
+        """
+        with self._warming_lock:
+            self._warming = {"commands", "feedback", "voice", "gesture"}
+        for name in self._warming:
+            self.startup.begin(name)
+        if self.history:
+            self.history.start()
+        if self.overlay:
+            self.overlay.start()
+        if self.supervisor:
+            self.supervisor.start()
+        Thread(target=self._warm_commands, name="warm-up", daemon=True).start()
+        self.feedback.warm_up().add_done_callback(lambda done: self._service_ready("feedback", done.result()))
         self.voice.start()
         self.gesture.start()
+        if self.power:
+            self.power.start()
+
+    def _warm_commands(self) -> None:
+        try:
+            self._load_extensions()
+        except Exception as exc:  # noqa: BLE001
+            self._logger.error("commands not fully loaded: %s", exc)
+            self._service_ready("commands", False)
+            return
+        self._service_ready("commands", True)
+
+    def _service_ready(self, name: str, ok: bool = True) -> None:
+        """Publish ``service.ready`` for ``name``; the last service to report completes startup."""
+        if self.supervisor:
+            self.supervisor.ready(name, ok)
+        with self._warming_lock:
+            if name not in self._warming:
+                return
+            self._warming.discard(name)
+            remaining = len(self._warming)
+        seconds = self.startup.end(name)
+        self._logger.info("%s %s after %.0f ms", name, "ready" if ok else "unavailable", seconds * 1000)
+        self.bus.publish(
+            AssistantEvent("service.ready", {"service": name, "ok": ok, "seconds": round(seconds, 3)}, source="core")
+        )
+        if remaining:
+            return
+        self.bus.publish(AssistantEvent("assistant.ready", {"seconds": round(seconds, 3)}, source="core"))
+        if self._report_startup:
+            self._logger.info("%s", self.startup.report())
         self.feedback.publish_all(FeedbackMessage("Assistant", "Multimodal assistant started."))
 
-    def stop(self) -> None:
-        self.voice.stop()
-        self.gesture.stop()
-        self.bus.stop()
+    def _service_exited(self, name: str, error: Optional[BaseException]) -> None:
+        if self.supervisor:
+            self.supervisor.exited(name, error)
+
+    def _input_stoppers(self) -> List[Callable[[], None]]:
+        """Services that feed the bus, to be stopped before it."""
+        stoppers: List[Callable[[], None]] = [self.voice.stop, self.gesture.stop]
+        if self._watcher:
+            stoppers.append(self._watcher.stop)
+        if self.power:
+            stoppers.append(self.power.stop)
+        return stoppers
+
+    def _shutdown(self) -> None:
+        if self.overlay:
+            self.overlay.stop()
+        self.automation.shutdown()
         self.feedback.publish_all(FeedbackMessage("Assistant", "Assistant stopped."))
+        self.feedback.close()
+        if self._launcher:
+            self._launcher.close()
+        for stage, summary in self.tracer.summary().items():
+            self._logger.info(
+                "latency %s: n=%d p50=%.1fms p95=%.1fms p99=%.1fms",
+                stage,
+                summary["count"],
+                summary["p50"] * 1000,
+                summary["p95"] * 1000,
+                summary["p99"] * 1000,
+            )
+        if self.power:
+            for tier, usage in self.power.usage().items():
+                if usage.wall_seconds:
+                    self._logger.info(
+                        "power %s: %.0fs, %.1f%% cpu", tier.value, usage.wall_seconds, usage.cpu_percent
+                    )
+        cache = self.intent_cache.stats
+        self._logger.info(
+            "intent cache: hit rate %.0f%% (%d hits, %d misses), saved %.1fms",
+            cache.hit_rate * 100,
+            cache.hits,
+            cache.misses,
+            cache.saved_seconds * 1000,
+        )
+        if self.supervisor:
+            for name, health in self.supervisor.health().items():
+                if health.failures:
+                    self._logger.info(
+                        "service %s: %s, %d failures, %d restarts, last error: %s",
+                        name,
+                        health.state.value,
+                        health.failures,
+                        health.restarts,
+                        health.last_error,
+                    )
+        if tracing.tracer() is self.tracer:
+            tracing.use_tracer(self._previous_tracer)
+        self.tracer.close()
+        if self.recorder:
+            self.recorder.close()
+        if self.history:
+            self.history.close()
+            if self.history.dropped:
+                self._logger.warning("history: %d commands not recorded (writer fell behind)", self.history.dropped)
+
+    def _recording_microphone(self) -> AudioSource:
+        assert self.recorder is not None
+        return RecordingAudioSource(MicrophoneSource(), self.recorder)
+
+    def _on_voice_partial(self, event: AssistantEvent) -> None:
+        utterance_id = event.payload.get("utterance_id")
+        if utterance_id in self._acted_utterances:
+            return
+        with tracing.tracer().span(event.trace_id, "parse"):
+            resolved = self.resolve(str(event.payload.get("text", "")))
+        # Intents that take an argument wait for the final transcript so the argument is complete,
+        # and so do fuzzy matches, which a half-spoken word can produce.
+        if not resolved or resolved.intent.argument is not None or resolved.intent.confidence < 1.0:
+            return
+        self._logger.info("voice~ %s", event.payload.get("text"))
+        # Claimed before dispatching, so a later partial of the same utterance cannot act again.
+        self._acted_utterances[utterance_id] = (resolved.intent.name, None)
+        while len(self._acted_utterances) > 32:
+            self._acted_utterances.popitem(last=False)
+        self._acted_utterances[utterance_id] = (resolved.intent.name, self._dispatch_voice_intent(resolved, event))
 
     def _on_voice_text(self, event: AssistantEvent) -> None:
+        utterance_id = event.payload.get("utterance_id")
+        acted = self._acted_utterances.get(utterance_id) if utterance_id is not None else None
         text = str(event.payload.get("text", ""))
+        compound = is_compound(text)
+        if acted is not None and not compound:
+            return
         self._logger.info("voice> %s", text)
-        intent = self.parser.parse(text)
-        if not intent:
+        with tracing.tracer().span(event.trace_id, "parse"):
+            steps = self.parser.parse_all(text) if compound else []
+            resolved = self.resolve(text) if len(steps) < 2 and acted is None else None
+        if len(steps) > 1:
+            self._dispatch_compound(steps, acted, event)
+            return
+        if acted is not None:
+            return
+        if not resolved:
             self.feedback.speak("I did not understand that command.")
             return
+        if resolved.intent.confidence < 1.0:
+            self._logger.info("fuzzy match %s (score %.2f)", resolved.intent.name, resolved.intent.confidence)
+        self._dispatch_voice_intent(resolved, event)
 
-        success = self.router.dispatch(intent)
-        if success:
-            self.feedback.speak(f"Done: {intent.name}")
-        else:
+    def _dispatch_voice_intent(self, resolved: ResolvedCommand, event: AssistantEvent) -> "Future[Any] | None":
+        intent = resolved.intent
+        speech_started = event.payload.get("speech_started")
+        if speech_started is not None:
+            self._logger.info("time-to-first-intent %s: %.0f ms", intent.name, (perf_counter() - speech_started) * 1000)
+        future = self._submit_traced(resolved, event)
+        if future is None:
             self.feedback.speak("That command is not supported yet.")
+            return None
+        future.add_done_callback(lambda done, name=intent.name: self._confirm(name, done, event.trace_id))
+        return future
+
+    def _dispatch_compound(
+        self, steps: Sequence[IntentStep], acted: Tuple[str, "Future[Any] | None"] | None, event: AssistantEvent
+    ) -> None:
+        """Run the commands of one utterance as a batch with a single confirmation.
+
+        If a partial transcript already started one of them, the others run
+        as the batch. When that was the first command, the batch waits for it
+        unless the next one was joined with "also".
+        """
+        remaining = list(steps)
+        first_acted = False
+        if acted is not None:
+            position = next((i for i, step in enumerate(remaining) if step.intent.name == acted[0]), None)
+            if position is None:
+                self._logger.info("partial ran %s, which the final transcript does not contain", acted[0])
+            else:
+                remaining.pop(position)
+                first_acted = position == 0
+        batch = [(self.router.resolve(step.intent), step.after_previous) for step in remaining]
+        self._logger.info("compound command: %s", " -> ".join(step.intent.name for step in remaining))
+
+        def start() -> None:
+            # The whole utterance is recorded, so "repeat last command" can parse and run it again.
+            text = str(event.payload.get("text", ""))
+            future = self._traced("batch", lambda: self.submit_batch(batch), event, argument=text)
+            if future is not None:
+                future.add_done_callback(lambda done: self._confirm_batch(done, event.trace_id))
+
+        running = acted[1] if acted is not None and first_acted else None
+        if running is not None and batch[0][1]:
+            running.add_done_callback(lambda _: start())
+        else:
+            start()
+
+    def submit_batch(
+        self, batch: Sequence[Tuple[ResolvedCommand, bool]], name: str = "batch"
+    ) -> "Future[PipelineResult]":
+        """Run several commands as one unit; the future resolves once all have finished.
+
+        Each ``(command, after_previous)`` either waits for the commands before
+        it or joins them (``after_previous=False``). A failed or unhandled
+        command skips everything waiting on it. Steps are named
+        ``"<position>:<intent>"``.
+        """
+        steps: List[PipelineStep] = []
+        barrier: Tuple[str, ...] = ()
+        group: List[str] = []
+        for position, (resolved, after_previous) in enumerate(batch, 1):
+            if after_previous and group:
+                barrier, group = tuple(group), []
+            step = f"{position}:{resolved.intent.name}"
+            steps.append(PipelineStep(step, lambda _, r=resolved: self._run_step(r), depends_on=barrier))
+            group.append(step)
+        return PipelineRun(Pipeline(name, steps), _submit_inline).start()
+
+    def _run_step(self, resolved: ResolvedCommand) -> "Future[Any]":
+        future = self.router.run(resolved)
+        if future is None:
+            raise LookupError(f"No handler registered for intent={resolved.intent.name}")
+        return future
+
+    def _submit_traced(self, resolved: ResolvedCommand, event: AssistantEvent) -> "Future[Any] | None":
+        # Gesture events carry the classifier's confidence; voice intents their match score.
+        confidence = float(event.payload.get("confidence", resolved.intent.confidence))
+        intent = resolved.intent
+        return self._traced(intent.name, lambda: self.router.run(resolved), event, confidence, intent.argument)
+
+    def _traced(
+        self,
+        label: str,
+        submit: Callable[[], "Future[Any] | None"],
+        event: AssistantEvent,
+        confidence: float = 1.0,
+        argument: str | None = None,
+    ) -> "Future[Any] | None":
+        """Call ``submit`` and record dispatch, execution and end-to-end latency for ``event``'s trace.
+
+        With the history log enabled the command, its latencies and outcome are
+        also appended there.
+        """
+        tracer = tracing.tracer()
+        started = perf_counter()
+        future = submit()
+        dispatched = perf_counter()
+        tracer.record(event.trace_id, "dispatch", dispatched - started, label)
+        history = self.history
+        if history is not None and future is None:
+            history.record(
+                HistoryEntry(time(), event.source, label, argument, Outcome.UNHANDLED, dispatch=dispatched - started)
+            )
+        announce = self.overlay is not None
+        if announce:
+            payload = {"intent": label, "confidence": confidence, "source": event.source}
+            self.bus.publish(AssistantEvent("command.dispatched", payload, "core", trace_id=event.trace_id))
+        if future is not None:
+            origin = event.origin if event.origin is not None else event.ts
+
+            def finished(done: "Future[Any]") -> None:
+                executed = perf_counter()
+                tracer.record(event.trace_id, "execute", executed - dispatched, label)
+                latency = executed - origin
+                tracer.record(event.trace_id, "end_to_end", latency, label)
+                if history is not None:
+                    history.record(
+                        HistoryEntry(
+                            time(),
+                            event.source,
+                            label,
+                            argument,
+                            _outcome(done),
+                            dispatch=dispatched - started,
+                            execute=executed - dispatched,
+                            total=latency,
+                        )
+                    )
+                if announce:
+                    ok = not done.cancelled() and done.exception() is None
+                    payload = {"intent": label, "latency": latency, "ok": ok}
+                    self.bus.publish(AssistantEvent("command.completed", payload, "core", trace_id=event.trace_id))
+
+            future.add_done_callback(finished)
+        return future
+
+    def _repeat_last(self, _intent: CommandIntent) -> "Future[Any]":
+        """Run the most recent successful command again (the "repeat last command" intent).
+
+        A compound command is parsed from its recorded utterance and runs as
+        a batch again. The future fails if there is nothing to repeat or the
+        command is no longer registered, so the confirmation and history
+        record a failure.
+        """
+        assert self.history is not None
+        entry = self.history.last(exclude=("repeat_last",))
+        future: "Future[Any] | None" = None
+        if entry is None:
+            error = LookupError("nothing to repeat")
+        elif entry.intent == "batch":
+            steps = self.parser.parse_all(entry.argument or "")
+            error = LookupError(f"cannot repeat compound command {entry.argument!r}")
+            if len(steps) > 1:
+                self._logger.info("repeating %s", entry.argument)
+                future = self.submit_batch([(self.router.resolve(step.intent), step.after_previous) for step in steps])
+        else:
+            self._logger.info("repeating %s", entry.intent)
+            future = self.router.submit(CommandIntent(entry.intent, entry.argument))
+            error = LookupError(f"{entry.intent} is no longer registered")
+        if future is None:
+            future = Future()
+            future.set_exception(error)
+        return future
+
+    def _confirm(self, intent_name: str, future: "Future[Any]", trace_id: int = 0) -> None:
+        if future.cancelled():
+            return
+        exc = future.exception()
+        if exc is None and isinstance(future.result(), PipelineResult) and not future.result().succeeded:
+            exc = RuntimeError("pipeline step failed")
+        if exc is not None:
+            self._logger.warning("%s failed: %s", intent_name, exc)
+            text = f"Failed: {intent_name}"
+        else:
+            text = f"Done: {intent_name}"
+        self._speak_traced(text, trace_id, intent_name)
+
+    def _confirm_batch(self, future: "Future[PipelineResult]", trace_id: int = 0) -> None:
+        """One spoken summary for a compound command, e.g. "Done: open_browser and play_music"."""
+        if future.cancelled():
+            return
+        steps = sorted(future.result().steps.values(), key=lambda step: int(step.name.split(":", 1)[0]))
+        parts = []
+        labels = ((StepStatus.SUCCEEDED, "Done"), (StepStatus.FAILED, "Failed"), (StepStatus.SKIPPED, "Skipped"))
+        for status, label in labels:
+            names = [step.name.split(":", 1)[1] for step in steps if step.status is status]
+            if names:
+                listed = names[0] if len(names) == 1 else f"{', '.join(names[:-1])} and {names[-1]}"
+                parts.append(f"{label}: {listed}")
+        self._speak_traced(". ".join(parts), trace_id, "batch")
+
+    def _speak_traced(self, text: str, trace_id: int, label: str) -> None:
+        started = perf_counter()
+        spoken = self.feedback.speak_async(text)
+        spoken.add_done_callback(lambda _: tracing.tracer().record_since(trace_id, "feedback", started, label))
 
     def _on_gesture(self, event: AssistantEvent) -> None:
         gesture = str(event.payload.get("gesture"))
         self._logger.info("gesture> %s", gesture)
-        gesture_to_intent = {
-            "swipe_left": "switch_window",
-            "swipe_right": "switch_window",
-            "open_palm": "open_browser",
-            "fist": "play_music",
-            "point": "type_text",
-        }
-        intent_name = gesture_to_intent.get(gesture)
-        if not intent_name:
+        resolved = self.gesture_commands().get(gesture)
+        if resolved is None:
             return
+        intent_name = resolved.intent.name
+        future = self._submit_traced(resolved, event)
+        if future is not None:
+            future.add_done_callback(lambda done: self._notify_gesture(intent_name, gesture, done))
 
-        argument = "gesture triggered text" if intent_name == "type_text" else None
-        success = self.router.dispatch(CommandIntent(name=intent_name, argument=argument))
-        if success:
-            self.feedback.notify(FeedbackMessage("Gesture", f"Executed {intent_name} from {gesture}"))
+    def _notify_gesture(self, intent_name: str, gesture: str, future: "Future[Any]") -> None:
+        if future.cancelled() or future.exception() is not None:
+            return
+        self.feedback.notify(FeedbackMessage("Gesture", f"Executed {intent_name} from {gesture}"))
@@ -0,0 +1,182 @@
+"""Startup staging: timing of stages and imports, and holding early commands.
+
+Nothing from the rest of the assistant is imported here, so ``main`` can
+install the import timer before any of it is loaded.
+"""
+
+from __future__ import annotations
+
+import importlib.abc
+import logging
+import sys
+from contextlib import contextmanager
+from threading import Lock
+from time import perf_counter
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+if TYPE_CHECKING:
+    from assistant.core.events import AssistantEvent, EventHandler
+
+
+class _TimedLoader(importlib.abc.Loader):
+    """Delegating loader that reports how long executing a module took."""
+
+    def __init__(self, loader: Any, record: Callable[[str, float], None]) -> None:
+        self._loader = loader
+        self._record = record
+
+    def create_module(self, spec: Any) -> Optional[ModuleType]:
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module: ModuleType) -> None:
+        # Hand the real loader back to the module so nothing after the import sees the wrapper.
+        module.__loader__ = self._loader
+        if module.__spec__ is not None:
+            module.__spec__.loader = self._loader
+        started = perf_counter()
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._record(module.__name__, perf_counter() - started)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._loader, name)
+
+
+class _ImportTimer(importlib.abc.MetaPathFinder):
+    def __init__(self, record: Callable[[str, float], None]) -> None:
+        self._record = record
+
+    def find_spec(self, fullname: str, path: Optional[Sequence[str]], target: Optional[ModuleType] = None) -> Any:
+        for finder in sys.meta_path:
+            find_spec = getattr(finder, "find_spec", None)
+            if finder is self or find_spec is None:
+                continue
+            spec = find_spec(fullname, path, target)
+            if spec is None:
+                continue
+            if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                spec.loader = _TimedLoader(spec.loader, self._record)
+            return spec
+        return None
+
+
+class StartupProfile:
+    """Wall time of each startup stage and, once ``time_imports`` is called, of each import.
+
+    Stage offsets are relative to the profile's creation. Import times are
+    cumulative (a package includes the modules it imports) and are recorded
+    from every thread, so backends imported by the warm-up threads show up
+    too.
+    """
+
+    def __init__(self, clock: Callable[[], float] = perf_counter) -> None:
+        self._clock = clock
+        self.started = clock()
+        self._lock = Lock()
+        self._open: Dict[str, float] = {}
+        self._stages: Dict[str, Tuple[float, float]] = {}
+        self._imports: Dict[str, float] = {}
+        self._timer: _ImportTimer | None = None
+
+    def time_imports(self) -> None:
+        if self._timer is None:
+            self._timer = _ImportTimer(self._record_import)
+            sys.meta_path.insert(0, self._timer)
+
+    def stop_timing_imports(self) -> None:
+        if self._timer is not None:
+            sys.meta_path.remove(self._timer)
+            self._timer = None
+
+    def begin(self, name: str) -> None:
+        with self._lock:
+            self._open[name] = self._clock()
+
+    def end(self, name: str) -> float:
+        """Close stage ``name`` (begun now if it never was); returns seconds since startup began."""
+        now = self._clock()
+        with self._lock:
+            self._stages[name] = (self._open.pop(name, now), now)
+        return now - self.started
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        self.begin(name)
+        try:
+            yield
+        finally:
+            self.end(name)
+
+    def stages(self) -> List[Tuple[str, float, float]]:
+        """``(name, offset, seconds)`` per finished stage, in start order."""
+        with self._lock:
+            stages = [(name, start - self.started, end - start) for name, (start, end) in self._stages.items()]
+        return sorted(stages, key=lambda stage: stage[1])
+
+    def imports(self, top: int = 15) -> List[Tuple[str, float]]:
+        with self._lock:
+            return sorted(self._imports.items(), key=lambda item: -item[1])[:top]
+
+    def report(self, top: int = 15) -> str:
+        stages = self.stages()
+        ready = max((offset + seconds for _, offset, seconds in stages), default=0.0)
+        lines = [f"startup: ready after {ready * 1000:.0f} ms", f"  {'stage':<20} {'start':>9} {'time':>9}"]
+        for name, offset, seconds in stages:
+            lines.append(f"  {name:<20} {offset * 1000:>6.0f} ms {seconds * 1000:>6.0f} ms")
+        imports = self.imports(top)
+        if imports:
+            lines.append("  slowest imports (including what they import)")
+            lines += [f"  {name:<40} {seconds * 1000:>6.0f} ms" for name, seconds in imports]
+        return "\n".join(lines)
+
+    def _record_import(self, name: str, seconds: float) -> None:
+        with self._lock:
+            self._imports[name] = seconds
+
+
+class CommandGate:
+    """Holds command events until the command table is complete, then replays them in order.
+
+    Handlers wrapped with ``wrap`` run directly once ``open`` was called.
+    Before that their events are kept (up to ``max_held``, oldest dropped
+    first) instead of being parsed against a half-loaded table.
+    """
+
+    def __init__(self, max_held: int = 32) -> None:
+        self._max_held = max_held
+        self._held: List[Tuple[EventHandler, AssistantEvent]] = []
+        self._lock = Lock()
+        self.is_open = False
+        self._logger = logging.getLogger(self.__class__.__name__)
+
+    def wrap(self, handler: EventHandler) -> EventHandler:
+        def gated(event: AssistantEvent) -> None:
+            if not self.is_open:
+                with self._lock:
+                    if not self.is_open:
+                        self._held.append((handler, event))
+                        if len(self._held) > self._max_held:
+                            _, dropped = self._held.pop(0)
+                            self._logger.warning("dropped early %s event", dropped.event_type)
+                        return
+            handler(event)
+
+        return gated
+
+    def open(self) -> int:
+        """Replay the held events on the calling thread and let later ones through; returns how many were held."""
+        replayed = 0
+        while True:
+            with self._lock:
+                if not self._held:
+                    self.is_open = True
+                    return replayed
+                held, self._held = self._held, []
+            for handler, event in held:
+                try:
+                    handler(event)
+                except Exception as exc:  # noqa: BLE001
+                    self._logger.exception("early %s event failed: %s", event.event_type, exc)
+            replayed += len(held)
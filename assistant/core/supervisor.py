@@ -0,0 +1,231 @@
+from __future__ import annotations
+
+import logging
+import random
+import time
+from dataclasses import dataclass, replace
+from enum import Enum
+from threading import Condition, Lock, Thread
+from typing import Callable, Dict, Optional, Protocol
+
+from assistant.core import tracing
+from assistant.core.events import AssistantEvent, EventBus
+
+
+class ServiceState(str, Enum):
+    STARTING = "starting"
+    RUNNING = "running"
+    # Failed; restarting after a backoff delay.
+    BACKOFF = "backoff"
+    # Failed too often (or cannot work at all); one trial restart after the cooldown.
+    OPEN = "open"
+    # Ended on its own without an error, e.g. a recorded source ran out.
+    STOPPED = "stopped"
+
+
+class Supervised(Protocol):
+    def start(self) -> None: ...
+
+    def stop(self) -> None: ...
+
+
+@dataclass(slots=True, frozen=True)
+class Backoff:
+    """Exponential restart delays with jitter: ``initial * factor ** (n - 1)``, capped at ``maximum``.
+
+    Each delay is shortened by a random fraction of up to ``jitter`` so
+    services that failed together do not all retry at the same moment.
+    """
+
+    initial: float = 1.0
+    factor: float = 2.0
+    maximum: float = 60.0
+    jitter: float = 0.5
+
+    def delay(self, attempt: int, rand: Callable[[], float] = random.random) -> float:
+        base = min(self.maximum, self.initial * self.factor ** max(0, attempt - 1))
+        return base * (1.0 - self.jitter * rand())
+
+
+@dataclass(slots=True)
+class ServiceHealth:
+    state: ServiceState = ServiceState.STARTING
+    restarts: int = 0
+    failures: int = 0
+    consecutive_failures: int = 0
+    circuit_opens: int = 0
+    last_error: str | None = None
+    # Monotonic time the current run became ready, and of the next scheduled restart.
+    running_since: float | None = None
+    restart_at: float | None = None
+
+
+@dataclass(slots=True)
+class _Entry:
+    service: Supervised
+    health: ServiceHealth
+
+
+class Supervisor:
+    """Restarts input services whose capture loop failed.
+
+    Services report readiness and unexpected exits (``ready`` / ``exited``).
+    A failed service is stopped and started again, which reopens its devices,
+    after a ``backoff`` delay that grows with each failure in a row. After
+    ``failure_threshold`` failures in a row, or at once for a missing
+    dependency (``ImportError``), the circuit opens: the service is left
+    alone for ``cooldown`` seconds, then gets one trial restart. A run that
+    stays up for ``healthy_after`` seconds resets the count. Every state
+    change is published as ``service.health`` and counted in the tracer
+    (``supervisor.restarts.<name>`` and so on). Restarts run on one timer
+    thread that sleeps until the next one is due.
+    """
+
+    def __init__(
+        self,
+        bus: EventBus | None = None,
+        backoff: Backoff = Backoff(),
+        failure_threshold: int = 5,
+        cooldown: float = 300.0,
+        healthy_after: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+        rand: Callable[[], float] = random.random,
+    ) -> None:
+        self._bus = bus
+        self._backoff = backoff
+        self._failure_threshold = failure_threshold
+        self._cooldown = cooldown
+        self._healthy_after = healthy_after
+        self._clock = clock
+        self._rand = rand
+        self._services: Dict[str, _Entry] = {}
+        self._cond = Condition()
+        # Held while a service is being restarted, so ``stop`` can wait for it.
+        self._restart_lock = Lock()
+        self._stopping = False
+        self._thread: Thread | None = None
+        self._logger = logging.getLogger(self.__class__.__name__)
+
+    def add(self, name: str, service: Supervised) -> None:
+        with self._cond:
+            self._services[name] = _Entry(service, ServiceHealth())
+
+    def health(self) -> Dict[str, ServiceHealth]:
+        with self._cond:
+            return {name: replace(entry.health) for name, entry in self._services.items()}
+
+    def ready(self, name: str, ok: bool) -> None:
+        with self._cond:
+            entry = self._services.get(name)
+            if entry is None or not ok:
+                return
+            entry.health.state = ServiceState.RUNNING
+            entry.health.running_since = self._clock()
+        self._publish(name)
+
+    def exited(self, name: str, error: Optional[BaseException]) -> None:
+        """Called from a service's thread when it ended without being stopped."""
+        with self._cond:
+            entry = self._services.get(name)
+            if entry is None or self._stopping:
+                return
+            health = entry.health
+            now = self._clock()
+            if error is None:
+                health.state = ServiceState.STOPPED
+                health.restart_at = None
+            else:
+                healthy = health.running_since is not None and now - health.running_since >= self._healthy_after
+                health.failures += 1
+                health.consecutive_failures = 1 if healthy else health.consecutive_failures + 1
+                health.last_error = f"{type(error).__name__}: {error}"
+                if isinstance(error, ImportError) or health.consecutive_failures >= self._failure_threshold:
+                    health.state = ServiceState.OPEN
+                    health.circuit_opens += 1
+                    delay = self._cooldown
+                else:
+                    health.state = ServiceState.BACKOFF
+                    delay = self._backoff.delay(health.consecutive_failures, self._rand)
+                health.restart_at = now + delay
+                self._cond.notify_all()
+            health.running_since = None
+            state = health.state
+        if error is not None:
+            self._logger.warning("%s failed (%s), %s", name, error, _describe(state, health.restart_at, now))
+            tracing.tracer().increment(f"supervisor.failures.{name}")
+            if state is ServiceState.OPEN:
+                tracing.tracer().increment(f"supervisor.circuit_open.{name}")
+        self._publish(name)
+
+    def start(self) -> None:
+        if self._thread and self._thread.is_alive():
+            return
+        with self._cond:
+            self._stopping = False
+        self._thread = Thread(target=self._run, name="supervisor", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop restarting services; waits for a restart in progress to finish."""
+        with self._cond:
+            self._stopping = True
+            self._cond.notify_all()
+        with self._restart_lock:
+            pass
+        if self._thread:
+            self._thread.join(timeout=1)
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while True:
+                    if self._stopping:
+                        return
+                    now = self._clock()
+                    due = [(entry.health.restart_at, name) for name, entry in self._services.items()]
+                    pending = [(at, name) for at, name in due if at is not None]
+                    if pending and min(pending)[0] <= now:
+                        name = min(pending)[1]
+                        break
+                    self._cond.wait(min(pending)[0] - now if pending else None)
+                self._services[name].health.restart_at = None
+            self._restart(name)
+
+    def _restart(self, name: str) -> None:
+        with self._restart_lock:
+            with self._cond:
+                if self._stopping:
+                    return
+                entry = self._services[name]
+                entry.health.restarts += 1
+                entry.health.state = ServiceState.STARTING
+                attempt = entry.health.restarts
+            self._logger.info("restarting %s (restart %d)", name, attempt)
+            tracing.tracer().increment(f"supervisor.restarts.{name}")
+            self._publish(name)
+            try:
+                entry.service.stop()
+                entry.service.start()
+            except Exception as exc:  # noqa: BLE001
+                self.exited(name, exc)
+
+    def _publish(self, name: str) -> None:
+        if self._bus is None:
+            return
+        with self._cond:
+            health = self._services[name].health
+            payload = {
+                "service": name,
+                "state": health.state.value,
+                "restarts": health.restarts,
+                "failures": health.failures,
+                "last_error": health.last_error,
+            }
+        self._bus.publish(AssistantEvent("service.health", payload, source="supervisor"))
+
+
+def _describe(state: ServiceState, restart_at: float | None, now: float) -> str:
+    if restart_at is None:
+        return "not restarting"
+    action = "trial restart" if state is ServiceState.OPEN else "restarting"
+    return f"{action} in {restart_at - now:.1f} s"
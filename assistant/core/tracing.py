@@ -0,0 +1,211 @@
+"""Low-overhead latency tracing and counters.
+
+Every ``AssistantEvent`` carries a ``trace_id``; components record how long
+each stage took for that trace (``recognition``, ``queue``, ``parse``,
+``dispatch``, ``execute``, ``feedback``, ``end_to_end``). Durations go into
+fixed log-bucket histograms per stage and per ``(stage, intent)``, so a record
+costs one lock and a few arithmetic operations and memory stays constant.
+Individual spans can additionally be streamed to a JSONL file, and a summary
+can be served in the Prometheus text format.
+"""
+
+from __future__ import annotations
+
+import itertools
+import json
+import logging
+import math
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Lock, Thread
+from time import perf_counter, time
+from typing import IO, Dict, Iterator, List, Optional, Tuple
+
+STAGES = ("recognition", "queue", "parse", "dispatch", "execute", "feedback", "end_to_end")
+
+_trace_ids = itertools.count(1)
+
+
+def new_trace_id() -> int:
+    return next(_trace_ids)
+
+
+class Histogram:
+    """Log-bucketed latency histogram (about 9% relative error, 10 µs to ~5 min)."""
+
+    MIN = 1e-5
+    STEPS_PER_DOUBLING = 4
+    BUCKETS = 100
+
+    __slots__ = ("counts", "count", "total", "max")
+
+    def __init__(self) -> None:
+        self.counts = [0] * self.BUCKETS
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds: float) -> None:
+        if seconds <= self.MIN:
+            index = 0
+        else:
+            index = min(int(math.log2(seconds / self.MIN) * self.STEPS_PER_DOUBLING), self.BUCKETS - 1)
+        self.counts[index] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    @classmethod
+    def upper_bound(cls, index: int) -> float:
+        return cls.MIN * 2 ** ((index + 1) / cls.STEPS_PER_DOUBLING)
+
+    def quantile(self, q: float) -> float:
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank and count:
+                return min(self.upper_bound(index), self.max)
+        return self.max
+
+    def summary(self) -> Dict[str, float]:
+        return {
+            "count": self.count,
+            "avg": self.total / self.count if self.count else 0.0,
+            "p50": self.quantile(0.50),
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99),
+            "max": self.max,
+        }
+
+
+class Tracer:
+    """Collects stage latencies and counters; safe to call from any thread."""
+
+    def __init__(self, enabled: bool = True, jsonl_path: str | None = None) -> None:
+        self.enabled = enabled
+        self._lock = Lock()
+        self._stages: Dict[str, Histogram] = {}
+        self._by_intent: Dict[Tuple[str, str], Histogram] = {}
+        self._counters: Dict[str, float] = {}
+        self._sink: Optional[IO[str]] = open(jsonl_path, "a", encoding="utf-8") if jsonl_path else None
+        self._server: ThreadingHTTPServer | None = None
+        self._logger = logging.getLogger(self.__class__.__name__)
+
+    def record(self, trace_id: int, stage: str, seconds: float, intent: str | None = None) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            histogram = self._stages.get(stage)
+            if histogram is None:
+                histogram = self._stages[stage] = Histogram()
+            histogram.record(seconds)
+            if intent:
+                per_intent = self._by_intent.get((stage, intent))
+                if per_intent is None:
+                    per_intent = self._by_intent[(stage, intent)] = Histogram()
+                per_intent.record(seconds)
+            if self._sink is not None:
+                record = {"ts": time(), "trace_id": trace_id, "stage": stage, "seconds": seconds, "intent": intent}
+                self._sink.write(json.dumps(record) + "\n")
+
+    def record_since(self, trace_id: int, stage: str, started: float, intent: str | None = None) -> None:
+        """Record ``perf_counter() - started`` for a stage that began at a known timestamp."""
+        self.record(trace_id, stage, perf_counter() - started, intent)
+
+    @contextmanager
+    def span(self, trace_id: int, stage: str, intent: str | None = None) -> Iterator[None]:
+        started = perf_counter()
+        try:
+            yield
+        finally:
+            self.record(trace_id, stage, perf_counter() - started, intent)
+
+    def increment(self, name: str, value: float = 1) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def counters(self) -> Dict[str, float]:
+        with self._lock:
+            return dict(self._counters)
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Per-stage and per ``stage/intent`` count, average, p50/p95/p99 and max in seconds."""
+        with self._lock:
+            result = {stage: histogram.summary() for stage, histogram in self._stages.items()}
+            result.update(
+                {f"{stage}/{intent}": histogram.summary() for (stage, intent), histogram in self._by_intent.items()}
+            )
+        return result
+
+    def prometheus_text(self) -> str:
+        lines: List[str] = ["# TYPE assistant_stage_seconds summary"]
+        with self._lock:
+            series = [(stage, None, histogram) for stage, histogram in self._stages.items()]
+            series += [(stage, intent, histogram) for (stage, intent), histogram in self._by_intent.items()]
+            summaries = [(stage, intent, histogram.summary()) for stage, intent, histogram in series]
+            counters = dict(self._counters)
+        for stage, intent, summary in summaries:
+            labels = f'stage="{stage}"' + (f',intent="{intent}"' if intent else "")
+            for quantile in ("p50", "p95", "p99"):
+                value = summary[quantile]
+                lines.append(f'assistant_stage_seconds{{{labels},quantile="0.{quantile[1:]}"}} {value:.6f}')
+            lines.append(f"assistant_stage_seconds_sum{{{labels}}} {summary['avg'] * summary['count']:.6f}")
+            lines.append(f"assistant_stage_seconds_count{{{labels}}} {summary['count']}")
+        for name, value in sorted(counters.items()):
+            metric = "assistant_" + name.replace(".", "_").replace("-", "_")
+            lines.append(f"# TYPE {metric} counter")
+            lines.append(f"{metric} {value}")
+        return "\n".join(lines) + "\n"
+
+    def serve(self, port: int, host: str = "127.0.0.1") -> int:
+        """Serve ``prometheus_text()`` at ``http://host:port/metrics``; returns the bound port."""
+        tracer = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:  # noqa: N802
+                if self.path.rstrip("/") not in ("", "/metrics"):
+                    self.send_error(404)
+                    return
+                body = tracer.prometheus_text().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+                pass
+
+        self._server = ThreadingHTTPServer((host, port), _Handler)
+        Thread(target=self._server.serve_forever, name="metrics-http", daemon=True).start()
+        return self._server.server_address[1]
+
+    def close(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        with self._lock:
+            if self._sink is not None:
+                self._sink.close()
+                self._sink = None
+
+
+_tracer = Tracer()
+
+
+def tracer() -> Tracer:
+    return _tracer
+
+
+def use_tracer(new: Tracer) -> Tracer:
+    """Install ``new`` as the process-wide tracer; returns the previous one."""
+    global _tracer
+    previous, _tracer = _tracer, new
+    return previous
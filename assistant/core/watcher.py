@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass, field
+from pathlib import Path
+from threading import Event, Lock, Thread
+from typing import Callable, Dict, List, Tuple
+
+Snapshot = Dict[Path, Tuple[int, int]]
+ChangeCallback = Callable[[List[Path]], None]
+
+
+@dataclass(slots=True)
+class _Watch:
+    path: Path
+    pattern: str
+    callback: ChangeCallback
+    snapshot: Snapshot = field(default_factory=dict)
+
+
+class FileWatcher:
+    """Polls files and directories for changes on a single background thread.
+
+    A watched file or directory is compared by ``(mtime_ns, size)`` of each
+    file (matching ``pattern`` for directories); the callback receives the
+    paths that were added, modified or removed since the last poll. Polling
+    keeps the watcher dependency-free and portable; a ``stat`` per file per
+    interval is negligible next to the services being reloaded.
+    """
+
+    def __init__(self, interval: float = 1.0) -> None:
+        self._interval = interval
+        self._watches: List[_Watch] = []
+        self._lock = Lock()
+        self._stop = Event()
+        self._thread: Thread | None = None
+        self._logger = logging.getLogger(self.__class__.__name__)
+
+    def watch(self, path: str | Path, callback: ChangeCallback, pattern: str = "*.py") -> None:
+        watch = _Watch(Path(path), pattern, callback)
+        watch.snapshot = self._snapshot(watch)
+        with self._lock:
+            self._watches.append(watch)
+
+    def start(self) -> None:
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = Thread(target=self._run, name="file-watcher", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=1)
+
+    def poll(self) -> int:
+        """Check every watch once and run callbacks; returns the number of changed paths."""
+        with self._lock:
+            watches = list(self._watches)
+        total = 0
+        for watch in watches:
+            snapshot = self._snapshot(watch)
+            changed = sorted(
+                path for path in snapshot.keys() | watch.snapshot.keys() if snapshot.get(path) != watch.snapshot.get(path)
+            )
+            watch.snapshot = snapshot
+            if not changed:
+                continue
+            total += len(changed)
+            try:
+                watch.callback(changed)
+            except Exception as exc:  # noqa: BLE001
+                self._logger.warning("reload for %s failed: %s", watch.path, exc)
+        return total
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._interval):
+            self.poll()
+
+    @staticmethod
+    def _snapshot(watch: _Watch) -> Snapshot:
+        if watch.path.is_dir():
+            files = [file for file in watch.path.glob(watch.pattern) if not file.name.startswith("__")]
+        else:
+            files = [watch.path]
+        snapshot: Snapshot = {}
+        for file in files:
+            try:
+                stat = file.stat()
+            except OSError:
+                continue
+            snapshot[file] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
@@ -1,7 +1,11 @@
 from __future__ import annotations
 
 import logging
-from dataclasses import dataclass
+from collections import deque
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from threading import Condition, Thread
+from typing import Any, Deque, List, Optional, Protocol
 
 
 @dataclass(slots=True)
@@ -10,11 +14,55 @@ class FeedbackMessage:
     body: str
 
 
+class SpeechEngine(Protocol):
+    """Subset of the ``pyttsx3`` engine API used by the feedback manager."""
+
+    def say(self, text: str) -> None: ...
+
+    def runAndWait(self) -> None: ...
+
+    def stop(self) -> None: ...
+
+    def setProperty(self, name: str, value: Any) -> None: ...
+
+
+@dataclass(slots=True)
+class _Utterance:
+    text: str
+    key: str
+    urgent: bool
+    futures: List[Future] = field(default_factory=list)
+
+
 class FeedbackManager:
-    def __init__(self, speech_rate: int = 180) -> None:
+    """Spoken and desktop feedback.
+
+    Speech runs on a dedicated ``feedback-speech`` thread fed by a small queue:
+    pending messages sharing a key (by default the text itself) are merged,
+    and urgent messages jump the queue and interrupt the current utterance.
+    """
+
+    def __init__(
+        self,
+        speech_rate: int = 180,
+        engine: SpeechEngine | None = None,
+        max_pending: int = 16,
+        desktop_notifications: bool = True,
+    ) -> None:
         self._logger = logging.getLogger(self.__class__.__name__)
-        self._speech_engine = None
-        self._init_speech(speech_rate)
+        self._speech_engine: SpeechEngine | None = engine
+        self._speech_rate = speech_rate
+        self._rate_pending = False
+        self._init_pending = engine is None
+        self._max_pending = max_pending
+        self._desktop_notifications = desktop_notifications
+        self._pending: Deque[_Utterance] = deque()
+        self._current: Optional[_Utterance] = None
+        self._interrupted = False
+        self._closed = False
+        self._cond = Condition()
+        self._thread: Thread | None = None
+        self._warmed: "Future[bool]" = Future()
 
     def _init_speech(self, speech_rate: int) -> None:
         try:
@@ -26,14 +74,82 @@ class FeedbackManager:
         except Exception as exc:  # noqa: BLE001
             self._logger.warning("Speech synthesis unavailable: %s", exc)
 
-    def speak(self, text: str) -> None:
+    def start(self) -> None:
+        with self._cond:
+            if self._thread and self._thread.is_alive():
+                return
+            self._closed = False
+            self._thread = Thread(target=self._run, name="feedback-speech", daemon=True)
+            self._thread.start()
+
+    def warm_up(self) -> "Future[bool]":
+        """Start the speech thread so the TTS engine loads now rather than on the first message.
+
+        The future resolves to whether speech synthesis is available.
+        """
+        self.start()
+        return self._warmed
+
+    def close(self, timeout: float = 2.0) -> None:
+        """Finish queued speech (up to ``timeout``) and stop the speech thread."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        if self._thread:
+            self._thread.join(timeout=timeout)
+
+    def set_speech_rate(self, speech_rate: int) -> None:
+        """Change the speaking rate from the next utterance on; queued speech is kept."""
+        with self._cond:
+            self._speech_rate = speech_rate
+            self._rate_pending = True
+
+    def speak(self, text: str, urgent: bool = False) -> None:
+        self.speak_async(text, urgent=urgent)
+
+    def speak_async(self, text: str, urgent: bool = False, key: str | None = None) -> "Future[bool]":
+        """Queue ``text`` for speech without blocking.
+
+        The future resolves to ``True`` once the text was spoken in full and to
+        ``False`` if it was interrupted or dropped. A pending message with the
+        same ``key`` is superseded by this one and shares its future.
+        """
         self._logger.info("Assistant says: %s", text)
-        if not self._speech_engine:
-            return
-        self._speech_engine.say(text)
-        self._speech_engine.runAndWait()
+        future: "Future[bool]" = Future()
+        key = key if key is not None else text
+        if self._thread is None or not self._thread.is_alive():
+            self.start()
+
+        dropped: Optional[_Utterance] = None
+        with self._cond:
+            merged = next((item for item in self._pending if item.key == key), None)
+            if merged is not None:
+                merged.text = text
+                merged.futures.append(future)
+                if urgent and not merged.urgent:
+                    self._pending.remove(merged)
+                    merged.urgent = True
+                    self._enqueue_urgent(merged)
+            else:
+                utterance = _Utterance(text=text, key=key, urgent=urgent, futures=[future])
+                if urgent:
+                    self._enqueue_urgent(utterance)
+                else:
+                    if len(self._pending) >= self._max_pending:
+                        dropped = self._drop_oldest()
+                    self._pending.append(utterance)
+            if urgent and self._current is not None and not self._current.urgent:
+                self._interrupted = True
+                self._interrupt()
+            self._cond.notify_all()
+
+        if dropped is not None:
+            self._resolve(dropped, False)
+        return future
 
     def notify(self, msg: FeedbackMessage) -> None:
+        if not self._desktop_notifications:
+            return
         try:
             from plyer import notification
 
@@ -44,3 +160,79 @@ class FeedbackManager:
     def publish_all(self, msg: FeedbackMessage) -> None:
         self.speak(msg.body)
         self.notify(msg)
+
+    def _enqueue_urgent(self, utterance: _Utterance) -> None:
+        index = 0
+        while index < len(self._pending) and self._pending[index].urgent:
+            index += 1
+        self._pending.insert(index, utterance)
+
+    def _drop_oldest(self) -> Optional[_Utterance]:
+        for item in self._pending:
+            if not item.urgent:
+                self._pending.remove(item)
+                return item
+        return None
+
+    def _interrupt(self) -> None:
+        if not self._speech_engine:
+            return
+        try:
+            self._speech_engine.stop()
+        except Exception as exc:  # noqa: BLE001
+            self._logger.debug("Unable to interrupt speech: %s", exc)
+
+    def _run(self) -> None:
+        if self._init_pending:
+            self._init_pending = False
+            self._init_speech(self._speech_rate)
+        if not self._warmed.done():
+            self._warmed.set_result(self._speech_engine is not None)
+
+        while True:
+            with self._cond:
+                while not self._pending and not self._closed:
+                    self._cond.wait()
+                if not self._pending:
+                    return
+                utterance = self._pending.popleft()
+                self._current = utterance
+                self._interrupted = False
+                rate = self._speech_rate if self._rate_pending else None
+                self._rate_pending = False
+
+            if rate is not None:
+                self._apply_rate(rate)
+
+            spoken = self._say(utterance.text)
+
+            with self._cond:
+                spoken = spoken and not self._interrupted
+                self._current = None
+            self._resolve(utterance, spoken)
+
+    def _apply_rate(self, speech_rate: int) -> None:
+        # pyttsx3 engines are bound to the thread that created them, so properties are set here.
+        if not self._speech_engine:
+            return
+        try:
+            self._speech_engine.setProperty("rate", speech_rate)
+        except Exception as exc:  # noqa: BLE001
+            self._logger.warning("Unable to change speech rate: %s", exc)
+
+    def _say(self, text: str) -> bool:
+        if not self._speech_engine:
+            return True
+        try:
+            self._speech_engine.say(text)
+            self._speech_engine.runAndWait()
+        except Exception as exc:  # noqa: BLE001
+            self._logger.warning("Speech synthesis failed: %s", exc)
+            return False
+        return True
+
+    @staticmethod
+    def _resolve(utterance: _Utterance, spoken: bool) -> None:
+        for future in utterance.futures:
+            if not future.done():
+                future.set_result(spoken)
@@ -0,0 +1,352 @@
+"""Streaming speech recognition: audio sources, voice activity detection and recognizer backends."""
+
+from __future__ import annotations
+
+import itertools
+import json
+import logging
+import math
+import time
+import wave
+from array import array
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+from threading import Event
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Callable, Deque, Optional, Protocol
+
+if TYPE_CHECKING:
+    from assistant.input.wake_word import WakeWordGate
+
+SAMPLE_RATE = 16000
+CHUNK_MS = 30
+# Utterance ids are unique per process, so a restarted pipeline never reuses one the service manager acted on.
+_utterance_ids = itertools.count(1)
+
+
+class AudioSource(Protocol):
+    sample_rate: int
+
+    def read(self, frames: int) -> bytes:
+        """Return up to ``frames`` mono 16-bit samples; ``b""`` means the stream has ended."""
+        ...
+
+    def close(self) -> None: ...
+
+
+class MicrophoneSource:
+    """PyAudio microphone stream (the same backend SpeechRecognition uses)."""
+
+    def __init__(self, sample_rate: int = SAMPLE_RATE, device_index: int | None = None) -> None:
+        import pyaudio
+
+        self.sample_rate = sample_rate
+        self._audio = pyaudio.PyAudio()
+        self._stream = self._audio.open(
+            format=pyaudio.paInt16,
+            channels=1,
+            rate=sample_rate,
+            input=True,
+            input_device_index=device_index,
+            frames_per_buffer=sample_rate * CHUNK_MS // 1000,
+        )
+
+    def read(self, frames: int) -> bytes:
+        return self._stream.read(frames, exception_on_overflow=False)
+
+    def close(self) -> None:
+        self._stream.stop_stream()
+        self._stream.close()
+        self._audio.terminate()
+
+
+class WavFileSource:
+    """Reads a mono 16-bit WAV file, optionally paced to real time."""
+
+    def __init__(self, path: str | Path, realtime: bool = False) -> None:
+        self._wav = wave.open(str(path), "rb")
+        if self._wav.getnchannels() != 1 or self._wav.getsampwidth() != 2:
+            raise ValueError(f"{path}: expected mono 16-bit PCM")
+        self.sample_rate = self._wav.getframerate()
+        self._realtime = realtime
+
+    def read(self, frames: int) -> bytes:
+        data = self._wav.readframes(frames)
+        if self._realtime and data:
+            time.sleep(len(data) / 2 / self.sample_rate)
+        return data
+
+    def close(self) -> None:
+        self._wav.close()
+
+
+def rms(chunk: bytes) -> float:
+    samples = array("h")
+    samples.frombytes(chunk[: len(chunk) - len(chunk) % 2])
+    if not samples:
+        return 0.0
+    return math.sqrt(sum(sample * sample for sample in samples) / len(samples))
+
+
+class VoiceActivityDetector(Protocol):
+    def is_speech(self, chunk: bytes, sample_rate: int) -> bool: ...
+
+
+class EnergyVAD:
+    """RMS energy detector with an adaptive noise floor."""
+
+    def __init__(self, threshold: float | None = None, ratio: float = 3.0, min_rms: float = 300.0) -> None:
+        self._threshold = threshold
+        self._ratio = ratio
+        self._min_rms = min_rms
+        self._noise_floor = min_rms / ratio
+
+    def is_speech(self, chunk: bytes, sample_rate: int) -> bool:
+        energy = rms(chunk)
+        if self._threshold is not None:
+            return energy >= self._threshold
+        speech = energy > max(self._noise_floor * self._ratio, self._min_rms)
+        if not speech:
+            self._noise_floor = 0.95 * self._noise_floor + 0.05 * energy
+        return speech
+
+
+class WebRtcVAD:
+    """``webrtcvad`` wrapper; chunks must be 10, 20 or 30 ms long."""
+
+    def __init__(self, aggressiveness: int = 2) -> None:
+        import webrtcvad
+
+        self._vad = webrtcvad.Vad(aggressiveness)
+
+    def is_speech(self, chunk: bytes, sample_rate: int) -> bool:
+        return self._vad.is_speech(chunk, sample_rate)
+
+
+def make_vad(kind: str = "energy") -> VoiceActivityDetector:
+    if kind == "webrtc":
+        try:
+            return WebRtcVAD()
+        except Exception as exc:  # noqa: BLE001
+            logging.getLogger("make_vad").warning("webrtcvad unavailable, using energy VAD: %s", exc)
+    return EnergyVAD()
+
+
+class StreamingRecognizer(Protocol):
+    def start_utterance(self) -> None: ...
+
+    def accept(self, chunk: bytes) -> Optional[str]:
+        """Feed audio; return the partial transcript when it changed."""
+        ...
+
+    def finish(self) -> str:
+        """Close the utterance and return the final transcript."""
+        ...
+
+
+class VoskRecognizer:
+    """Offline streaming recognizer backed by a local Vosk model.
+
+    ``model`` is the model directory or an already loaded ``vosk.Model``;
+    the loaded model is available as ``model`` to share with a keyword spotter.
+    """
+
+    def __init__(self, model: Any, sample_rate: int = SAMPLE_RATE, grammar: list[str] | None = None) -> None:
+        import vosk
+
+        vosk.SetLogLevel(-1)
+        self.model = vosk.Model(model) if isinstance(model, str) else model
+        self._sample_rate = sample_rate
+        self._grammar = json.dumps(grammar) if grammar else None
+        self._recognizer = None
+        self._partial = ""
+        self._committed = ""
+
+    def _new_recognizer(self):  # type: ignore[no-untyped-def]
+        import vosk
+
+        if self._grammar:
+            return vosk.KaldiRecognizer(self.model, self._sample_rate, self._grammar)
+        return vosk.KaldiRecognizer(self.model, self._sample_rate)
+
+    def start_utterance(self) -> None:
+        if self._recognizer is None:
+            self._recognizer = self._new_recognizer()
+        else:
+            self._recognizer.Reset()
+        self._partial = ""
+        self._committed = ""
+
+    def accept(self, chunk: bytes) -> Optional[str]:
+        assert self._recognizer is not None
+        if self._recognizer.AcceptWaveform(chunk):
+            text = json.loads(self._recognizer.Result()).get("text", "")
+            self._committed = f"{self._committed} {text}".strip()
+            partial = self._committed
+        else:
+            text = json.loads(self._recognizer.PartialResult()).get("partial", "")
+            partial = f"{self._committed} {text}".strip()
+        if partial and partial != self._partial:
+            self._partial = partial
+            return partial
+        return None
+
+    def finish(self) -> str:
+        assert self._recognizer is not None
+        text = json.loads(self._recognizer.FinalResult()).get("text", "")
+        return f"{self._committed} {text}".strip()
+
+
+@dataclass(slots=True)
+class StreamingStats:
+    utterances: int = 0
+    partials: int = 0
+    wake_activations: int = 0
+    vad_skipped: int = 0
+    audio_seconds: float = 0.0
+    recognizer_seconds: float = 0.0
+    first_partial_total: float = 0.0
+    first_partial_count: int = 0
+
+    @property
+    def time_to_first_partial(self) -> float:
+        """Average seconds from speech onset to the first partial transcript."""
+        return self.first_partial_total / self.first_partial_count if self.first_partial_count else 0.0
+
+
+# (text, utterance_id, speech_started_at)
+TranscriptHandler = Callable[[str, int, float], None]
+
+
+class StreamingVoicePipeline:
+    """Feeds VAD-gated audio chunks to a streaming recognizer.
+
+    Audio is only sent to the recognizer between speech onset and the end of
+    the hangover period. A short pre-roll buffer keeps the first syllable that
+    triggered the detector. With a wake-word ``gate``, voiced frames go to the
+    wake-word detector instead until it fires.
+
+    While waiting for speech, ``vad_stride`` > 1 runs the detector on only
+    every n-th chunk (the others still fill the pre-roll), trading a little
+    onset latency for CPU when the assistant is idle. ``on_speech`` is called
+    at every speech onset.
+    """
+
+    def __init__(
+        self,
+        source: AudioSource,
+        recognizer: StreamingRecognizer,
+        on_partial: TranscriptHandler,
+        on_final: TranscriptHandler,
+        vad: VoiceActivityDetector | None = None,
+        chunk_ms: int = CHUNK_MS,
+        start_chunks: int = 2,
+        hangover_ms: int = 450,
+        preroll_ms: int = 300,
+        max_utterance_s: float = 8.0,
+        gate: WakeWordGate | None = None,
+        on_wake: Callable[[], None] | None = None,
+        on_speech: Callable[[], None] | None = None,
+        vad_stride: int = 1,
+    ) -> None:
+        self._source = source
+        self._recognizer = recognizer
+        self._on_partial = on_partial
+        self._on_final = on_final
+        self._vad = vad or EnergyVAD()
+        self._chunk_frames = source.sample_rate * chunk_ms // 1000
+        self._chunk_s = chunk_ms / 1000
+        self._start_chunks = start_chunks
+        self._hangover_chunks = max(1, hangover_ms // chunk_ms)
+        self._max_chunks = int(max_utterance_s / self._chunk_s)
+        self._preroll: Deque[bytes] = deque(maxlen=max(1, preroll_ms // chunk_ms))
+        self._gate = gate
+        self._on_wake = on_wake
+        self._on_speech = on_speech
+        self.vad_stride = vad_stride
+        self._utterance_id = 0
+        self.stats = StreamingStats()
+
+    def run(self, stop: Event) -> None:
+        """Process audio until ``stop`` is set or the source ends."""
+        in_speech = False
+        voiced = silent = length = 0
+        started_at = 0.0
+        first_partial = False
+        gate_open = speech = False
+        waiting = 0
+
+        while not stop.is_set():
+            chunk = self._source.read(self._chunk_frames)
+            if not chunk:
+                break
+            now = self.stats.audio_seconds
+            self.stats.audio_seconds += len(chunk) / 2 / self._source.sample_rate
+            if not in_speech and not speech and waiting % max(1, self.vad_stride):
+                waiting += 1
+                self.stats.vad_skipped += 1
+                if self._gate is None or gate_open:
+                    self._preroll.append(chunk)
+                continue
+            waiting = 0 if in_speech else waiting + 1
+            speech = self._vad.is_speech(chunk, self._source.sample_rate)
+
+            if self._gate is not None and not in_speech:
+                if self._gate.is_open(now):
+                    gate_open = True
+                else:
+                    if gate_open:
+                        gate_open = False
+                        self._gate.close()
+                    if speech and self._gate.feed(chunk, now):
+                        gate_open = True
+                        self.stats.wake_activations += 1
+                        self._preroll.extend(self._gate.take_buffer())
+                        if self._on_wake:
+                            self._on_wake()
+                    continue
+
+            if not in_speech:
+                self._preroll.append(chunk)
+                voiced = voiced + 1 if speech else 0
+                if voiced < self._start_chunks:
+                    continue
+                in_speech, silent, length, first_partial = True, 0, 0, False
+                if self._on_speech:
+                    self._on_speech()
+                self._utterance_id = next(_utterance_ids)
+                started_at = perf_counter() - len(self._preroll) * self._chunk_s
+                self._recognizer.start_utterance()
+                pending = list(self._preroll)
+                self._preroll.clear()
+            else:
+                pending = [chunk]
+                silent = 0 if speech else silent + 1
+
+            for piece in pending:
+                length += 1
+                self.stats.recognizer_seconds += self._chunk_s
+                partial = self._recognizer.accept(piece)
+                if partial:
+                    self.stats.partials += 1
+                    if not first_partial:
+                        first_partial = True
+                        self.stats.first_partial_total += perf_counter() - started_at
+                        self.stats.first_partial_count += 1
+                    self._on_partial(partial, self._utterance_id, started_at)
+
+            if silent >= self._hangover_chunks or length >= self._max_chunks:
+                self._finish(started_at)
+                in_speech, voiced = False, 0
+                if self._gate is not None:
+                    self._gate.extend(self.stats.audio_seconds)
+
+        if in_speech:
+            self._finish(started_at)
+
+    def _finish(self, started_at: float) -> None:
+        self.stats.utterances += 1
+        text = self._recognizer.finish()
+        if text:
+            self._on_final(text, self._utterance_id, started_at)
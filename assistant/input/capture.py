@@ -0,0 +1,455 @@
+from __future__ import annotations
+
+import logging
+import time
+from dataclasses import dataclass, replace
+from pathlib import Path
+from threading import Condition, Event, Thread
+from time import perf_counter
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Protocol, Sequence, Tuple
+
+
+class FrameSource(Protocol):
+    def read(self) -> Tuple[bool, Any]: ...
+
+    def release(self) -> None: ...
+
+
+class CameraSource:
+    """OpenCV camera that reuses one read buffer and keeps the driver queue short."""
+
+    def __init__(self, camera_index: int = 0) -> None:
+        import cv2
+
+        self._cap = cv2.VideoCapture(camera_index)
+        if not self._cap.isOpened():
+            raise OSError(f"camera {camera_index} could not be opened")
+        self._cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        self._buffer: Any = None
+
+    def read(self) -> Tuple[bool, Any]:
+        ok, frame = self._cap.read(self._buffer)
+        if ok:
+            self._buffer = frame
+        return ok, frame
+
+    def release(self) -> None:
+        self._cap.release()
+
+
+def _pace(next_at: float, interval: float) -> float:
+    """Sleep until ``next_at`` and return when the following frame is due."""
+    delay = next_at - perf_counter()
+    if delay > 0:
+        time.sleep(delay)
+    return max(next_at, perf_counter()) + interval
+
+
+class VideoFileSource:
+    """Frames from a video file, paced at the file's frame rate unless ``realtime`` is off."""
+
+    def __init__(self, path: str | Path, realtime: bool = True, loop: bool = False) -> None:
+        import cv2
+
+        self._cv2 = cv2
+        self._cap = cv2.VideoCapture(str(path))
+        if not self._cap.isOpened():
+            raise OSError(f"video {path} could not be opened")
+        fps = self._cap.get(cv2.CAP_PROP_FPS) or 30.0
+        self._interval = 1.0 / fps if realtime else 0.0
+        self._next_at = 0.0
+        self._loop = loop
+        self._buffer: Any = None
+        self.exhausted = False
+
+    def read(self) -> Tuple[bool, Any]:
+        if self._interval:
+            self._next_at = _pace(self._next_at, self._interval)
+        ok, frame = self._cap.read(self._buffer)
+        if not ok and self._loop:
+            self._cap.set(self._cv2.CAP_PROP_POS_FRAMES, 0)
+            ok, frame = self._cap.read(self._buffer)
+        if ok:
+            self._buffer = frame
+        else:
+            self.exhausted = not self._loop
+        return ok, frame
+
+    def release(self) -> None:
+        self._cap.release()
+
+
+def open_source(spec: int | str) -> FrameSource:
+    """A camera for an index (``0`` or ``"0"``), otherwise a video file path."""
+    if isinstance(spec, int) or spec.isdigit():
+        return CameraSource(int(spec))
+    return VideoFileSource(spec)
+
+
+class SyntheticFrameSource:
+    """Plays back prepared frames, optionally paced at ``fps``; used in tests and replays."""
+
+    def __init__(self, frames: Iterable[Any], fps: float | None = None) -> None:
+        self._frames: Iterator[Any] = iter(frames)
+        self._interval = 1.0 / fps if fps else 0.0
+        self._next_at = 0.0
+        self.exhausted = False
+
+    def read(self) -> Tuple[bool, Any]:
+        if self._interval:
+            self._next_at = _pace(self._next_at, self._interval)
+        try:
+            return True, next(self._frames)
+        except StopIteration:
+            self.exhausted = True
+            return False, None
+
+    def release(self) -> None:
+        self.exhausted = True
+
+
+@dataclass(slots=True, frozen=True)
+class Roi:
+    """Normalized region of interest inside a frame."""
+
+    x0: float = 0.0
+    y0: float = 0.0
+    x1: float = 1.0
+    y1: float = 1.0
+
+    @property
+    def is_full(self) -> bool:
+        return self.x0 <= 0.0 and self.y0 <= 0.0 and self.x1 >= 1.0 and self.y1 >= 1.0
+
+    @classmethod
+    def around(cls, xs: Iterable[float], ys: Iterable[float], margin: float = 0.15) -> "Roi":
+        xs, ys = list(xs), list(ys)
+        return cls(
+            max(0.0, min(xs) - margin),
+            max(0.0, min(ys) - margin),
+            min(1.0, max(xs) + margin),
+            min(1.0, max(ys) + margin),
+        )
+
+    def to_frame(self, x: float, y: float) -> Tuple[float, float]:
+        """Map coordinates normalized to this ROI back to full-frame coordinates."""
+        return self.x0 + x * (self.x1 - self.x0), self.y0 + y * (self.y1 - self.y0)
+
+
+FULL_FRAME = Roi()
+
+
+@dataclass(slots=True)
+class FrameRef:
+    slot: int
+    seq: int
+    captured_at: float
+    data: Any
+
+
+Converter = Callable[[Any, Any], Any]
+Allocator = Callable[[Any], Any]
+
+
+class FrameRing:
+    """Preallocated triple buffer that always hands the reader the newest frame.
+
+    The writer converts each frame straight into a free slot, so steady-state
+    capture allocates nothing; frames overwritten before being read are counted
+    as dropped.
+    """
+
+    def __init__(self, allocate: Allocator, convert: Converter, slots: int = 3) -> None:
+        if slots < 3:
+            raise ValueError("FrameRing needs at least three slots")
+        self._allocate = allocate
+        self._convert = convert
+        self._slots: List[Any] = [None] * slots
+        self._cond = Condition()
+        self._latest: Optional[FrameRef] = None
+        self._latest_read = True
+        self._reading: Optional[int] = None
+        self._seq = 0
+        self.dropped = 0
+
+    def write(self, frame: Any, captured_at: float) -> None:
+        with self._cond:
+            busy = {self._reading, self._latest.slot if self._latest else None}
+            slot = next(index for index in range(len(self._slots)) if index not in busy)
+        if self._slots[slot] is None:
+            self._slots[slot] = self._allocate(frame)
+        data = self._convert(frame, self._slots[slot])
+        with self._cond:
+            if not self._latest_read:
+                self.dropped += 1
+            self._seq += 1
+            self._latest = FrameRef(slot=slot, seq=self._seq, captured_at=captured_at, data=data)
+            self._latest_read = False
+            self._cond.notify_all()
+
+    def acquire(self, after_seq: int, timeout: float) -> Optional[FrameRef]:
+        """Block until a frame newer than ``after_seq`` exists and lock its slot for reading."""
+        with self._cond:
+            if not self._cond.wait_for(lambda: self._latest is not None and self._latest.seq > after_seq, timeout):
+                return None
+            ref = self._latest
+            assert ref is not None
+            self._reading = ref.slot
+            self._latest_read = True
+            return ref
+
+    def release(self) -> None:
+        with self._cond:
+            self._reading = None
+
+
+@dataclass(slots=True)
+class PipelineStats:
+    captured: int = 0
+    processed: int = 0
+    skipped: int = 0
+    dropped: int = 0
+    read_failures: int = 0
+    latency_total: float = 0.0
+    latency_max: float = 0.0
+    inference_total: float = 0.0
+
+    @property
+    def latency_avg(self) -> float:
+        return self.latency_total / self.processed if self.processed else 0.0
+
+    @property
+    def inference_avg(self) -> float:
+        return self.inference_total / self.processed if self.processed else 0.0
+
+    @classmethod
+    def combine(cls, stats: Iterable["PipelineStats"]) -> "PipelineStats":
+        total = cls()
+        for item in stats:
+            total.captured += item.captured
+            total.processed += item.processed
+            total.skipped += item.skipped
+            total.dropped += item.dropped
+            total.read_failures += item.read_failures
+            total.latency_total += item.latency_total
+            total.latency_max = max(total.latency_max, item.latency_max)
+            total.inference_total += item.inference_total
+        return total
+
+
+# infer(image, roi) -> result; on_result(result, frame, roi) -> ROI to use next, or None when no hand was seen.
+Inference = Callable[[Any, Roi], Any]
+ResultHandler = Callable[[Any, FrameRef, Roi], Optional[Roi]]
+
+
+def _copy_into(frame: Any, slot: Any) -> Any:
+    slot[:] = frame
+    return slot
+
+
+class GesturePipeline:
+    """Two-stage capture/inference pipeline for one frame source.
+
+    The capture thread reads frames as fast as the source delivers them and
+    converts each into the ring. The inference stage always takes the newest
+    frame, so latency stays bounded when inference is slower than the camera.
+    While no hand is visible it processes only every ``max_skip + 1``-th new
+    frame, and once a hand is found it follows the ROI returned by the handler.
+    Inference runs on whichever thread drives ``poll``/``process``: its own
+    (``start``/``run``) or an ``InferenceScheduler`` shared with other sources.
+
+    Failed reads are retried with a growing pause (10 ms up to 0.5 s) rather
+    than in a tight loop. If a source raises, or delivers no frame for
+    ``stall_timeout`` seconds without reporting itself ``exhausted``, capture
+    stops and the error is kept in ``error``; the scheduler then raises it.
+    """
+
+    def __init__(
+        self,
+        source: FrameSource,
+        infer: Inference,
+        on_result: ResultHandler,
+        allocate: Allocator = bytearray,
+        convert: Converter = _copy_into,
+        max_skip: int = 2,
+        slots: int = 3,
+        stall_timeout: float | None = 5.0,
+    ) -> None:
+        self._source = source
+        self._stall_timeout = stall_timeout
+        self.error: BaseException | None = None
+        self._infer = infer
+        self._on_result = on_result
+        self._ring = FrameRing(allocate=allocate, convert=convert, slots=slots)
+        self._max_skip = max_skip
+        self._skip = 0
+        self._pending_skip = 0
+        self._last_seq = 0
+        self._roi = FULL_FRAME
+        self._capture_interval = 0.0
+        self._stats = PipelineStats()
+        self._stop = Event()
+        self._threads: List[Thread] = []
+        self._logger = logging.getLogger(self.__class__.__name__)
+
+    def stats(self) -> PipelineStats:
+        return replace(self._stats, dropped=self._ring.dropped)
+
+    def start(self) -> None:
+        self._stop.clear()
+        worker = Thread(target=self.run, args=(self._stop,), name="gesture-infer", daemon=True)
+        self._threads = [worker]
+        worker.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        for thread in self._threads:
+            thread.join(timeout=1.0)
+
+    def run(self, stop: Event) -> None:
+        """Run inference on the calling thread until ``stop`` is set."""
+        InferenceScheduler([self]).run(stop)
+
+    def start_capture(self, stop: Event, wake: Event) -> Thread:
+        """Start the capture thread; ``wake`` is set after every captured frame."""
+        capture = Thread(target=self._capture, args=(stop, wake), name="gesture-capture", daemon=True)
+        capture.start()
+        return capture
+
+    def release(self) -> None:
+        self._source.release()
+
+    def set_capture_fps(self, fps: float | None) -> None:
+        """Cap how often the source is read; ``None`` reads frames as fast as it delivers them."""
+        self._capture_interval = 1.0 / fps if fps else 0.0
+
+    def _capture(self, stop: Event, wake: Event) -> None:
+        next_at = 0.0
+        failures = 0
+        last_frame = perf_counter()
+        while not stop.is_set():
+            if self._capture_interval:
+                delay = next_at - perf_counter()
+                if delay > 0 and stop.wait(delay):
+                    break
+                next_at = perf_counter() + self._capture_interval
+            try:
+                ok, frame = self._source.read()
+            except Exception as exc:  # noqa: BLE001
+                self._fail(exc, wake)
+                return
+            if not ok:
+                self._stats.read_failures += 1
+                if getattr(self._source, "exhausted", False):
+                    return
+                if self._stall_timeout is not None and perf_counter() - last_frame >= self._stall_timeout:
+                    self._fail(TimeoutError(f"no frame for {self._stall_timeout:.1f} s"), wake)
+                    return
+                stop.wait(min(0.01 * 2 ** min(failures, 6), 0.5))
+                failures += 1
+                continue
+            failures = 0
+            last_frame = perf_counter()
+            self._stats.captured += 1
+            self._ring.write(frame, perf_counter())
+            wake.set()
+
+    def _fail(self, error: BaseException, wake: Event) -> None:
+        self._logger.warning("frame source failed: %s", error)
+        self.error = error
+        wake.set()
+
+    def poll(self) -> Optional[FrameRef]:
+        """The newest frame not yet looked at, if it is due for inference; pass it to ``process``."""
+        ref = self._ring.acquire(self._last_seq, timeout=0)
+        if ref is None:
+            return None
+        self._last_seq = ref.seq
+        if self._pending_skip:
+            self._pending_skip -= 1
+            self._stats.skipped += 1
+            self._ring.release()
+            return None
+        return ref
+
+    def process(self, ref: FrameRef) -> None:
+        roi = self._roi
+        try:
+            started = perf_counter()
+            result = self._infer(ref.data, roi)
+            finished = perf_counter()
+            next_roi = self._on_result(result, ref, roi)
+        except Exception as exc:  # noqa: BLE001
+            self._logger.exception("gesture inference failure: %s", exc)
+            next_roi = None
+            finished = started = perf_counter()
+        finally:
+            self._ring.release()
+
+        done = perf_counter()
+        self._stats.processed += 1
+        self._stats.inference_total += finished - started
+        latency = done - ref.captured_at
+        self._stats.latency_total += latency
+        self._stats.latency_max = max(self._stats.latency_max, latency)
+
+        if next_roi is None:
+            self._roi = FULL_FRAME
+            self._skip = min(self._skip + 1, self._max_skip)
+        else:
+            self._roi = next_roi
+            self._skip = 0
+        self._pending_skip = self._skip
+
+
+class InferenceScheduler:
+    """Runs inference for several pipelines on one thread.
+
+    Sources are served round-robin, each with its newest frame, so a fast
+    camera cannot starve a slow one. ``fps_budget`` caps the combined inference
+    rate: a second camera splits the budget instead of doubling the CPU spent.
+    ``run`` raises the error of the first source whose capture failed.
+    """
+
+    def __init__(self, pipelines: Sequence[GesturePipeline], fps_budget: float | None = None) -> None:
+        self._pipelines = list(pipelines)
+        self._interval = 0.0
+        self.set_fps_budget(fps_budget)
+
+    def set_fps_budget(self, fps_budget: float | None) -> None:
+        """Change the combined inference rate; takes effect from the next frame."""
+        self._interval = 1.0 / fps_budget if fps_budget else 0.0
+
+    def run(self, stop: Event) -> None:
+        """Serve every pipeline on the calling thread until ``stop`` is set."""
+        wake = Event()
+        captures = [pipeline.start_capture(stop, wake) for pipeline in self._pipelines]
+        turn = 0
+        next_at = 0.0
+        try:
+            while not stop.is_set():
+                delay = next_at - perf_counter()
+                if delay > 0 and stop.wait(delay):
+                    break
+                wake.clear()
+                for pipeline in self._pipelines:
+                    if pipeline.error is not None:
+                        raise pipeline.error
+                ref = None
+                for offset in range(len(self._pipelines)):
+                    index = (turn + offset) % len(self._pipelines)
+                    ref = self._pipelines[index].poll()
+                    if ref is not None:
+                        break
+                if ref is None:
+                    wake.wait(0.1)
+                    continue
+                turn = index + 1
+                next_at = perf_counter() + self._interval
+                self._pipelines[index].process(ref)
+        finally:
+            stop.set()
+            for capture in captures:
+                capture.join(timeout=1.0)
+            for pipeline in self._pipelines:
+                pipeline.release()
@@ -0,0 +1,106 @@
+"""Which application has the keyboard focus."""
+
+from __future__ import annotations
+
+import logging
+import shutil
+import subprocess
+from threading import Lock, Thread
+from time import monotonic
+from typing import Callable, Optional
+
+from assistant.core.host import system
+
+Probe = Callable[[], Optional[str]]
+
+_logger = logging.getLogger("foreground")
+
+
+def _run(argv: list[str]) -> Optional[str]:
+    result = subprocess.run(argv, capture_output=True, text=True, timeout=0.5, check=False)
+    if result.returncode != 0:
+        return None
+    return result.stdout.strip().lower() or None
+
+
+def _windows_class() -> Optional[str]:
+    import ctypes
+
+    user32 = ctypes.windll.user32  # type: ignore[attr-defined]
+    buffer = ctypes.create_unicode_buffer(256)
+    if not user32.GetClassNameW(user32.GetForegroundWindow(), buffer, len(buffer)):
+        return None
+    return buffer.value.lower() or None
+
+
+def default_probe() -> Optional[Probe]:
+    """Window-class lookup for this platform, or ``None`` if none is available (e.g. Wayland without xdotool)."""
+    if system() == "Windows":
+        return _windows_class
+    if system() == "Darwin":
+        script = 'tell application "System Events" to get name of first process whose frontmost is true'
+        return lambda: _run(["osascript", "-e", script])
+    xdotool = shutil.which("xdotool")
+    if xdotool:
+        return lambda: _run([xdotool, "getactivewindow", "getwindowclassname"])
+    return None
+
+
+def _in_thread(refresh: Callable[[], None]) -> None:
+    Thread(target=refresh, name="foreground-probe", daemon=True).start()
+
+
+class ForegroundApp:
+    """Class of the focused window, cached for ``ttl`` seconds.
+
+    A probe spawns ``xdotool``/``osascript`` or calls Win32 and can take up
+    to half a second, so it never runs on the caller's thread: once the
+    value is older than ``ttl``, ``current`` starts one refresh through
+    ``spawn`` (a background thread by default) and returns the cached value
+    until it finishes. A failed probe reads as ``None`` (no app-specific
+    mapping), and so does the value before the first probe finished.
+    """
+
+    def __init__(
+        self,
+        probe: Probe | None = None,
+        ttl: float = 1.0,
+        clock: Callable[[], float] = monotonic,
+        spawn: Callable[[Callable[[], None]], None] = _in_thread,
+    ) -> None:
+        self._probe = probe if probe is not None else default_probe()
+        self._ttl = ttl
+        self._clock = clock
+        self._spawn = spawn
+        self._lock = Lock()
+        self._value: Optional[str] = None
+        self._expires = float("-inf")
+        self._refreshing = False
+        self.probes = 0
+
+    def current(self) -> Optional[str]:
+        if self._probe is None:
+            return None
+        with self._lock:
+            if self._refreshing or self._clock() < self._expires:
+                return self._value
+            self._refreshing = True
+            self.probes += 1
+        self._spawn(self._refresh)
+        return self._value
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._expires = float("-inf")
+
+    def _refresh(self) -> None:
+        assert self._probe is not None
+        try:
+            value = self._probe()
+        except Exception as exc:  # noqa: BLE001
+            _logger.debug("foreground app probe failed: %s", exc)
+            value = None
+        with self._lock:
+            self._value = value
+            self._expires = self._clock() + self._ttl
+            self._refreshing = False
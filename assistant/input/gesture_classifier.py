@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import List, Optional, Protocol, Sequence, Tuple
+
+import numpy as np
+
+from assistant.input.gesture_features import EXTENSION, STATIC, VELOCITY
+
+Prediction = Tuple[Optional[str], float]
+
+
+class GestureClassifier(Protocol):
+    def predict(self, features: np.ndarray) -> List[Prediction]:
+        """Classify ``(N, NUM_FEATURES)`` rows into ``(gesture or None, confidence)``."""
+        ...
+
+
+def _swipes(features: np.ndarray, threshold: float) -> np.ndarray:
+    dx = features[:, VELOCITY][:, 0]
+    return np.where(dx > threshold, "swipe_right", np.where(dx < -threshold, "swipe_left", ""))
+
+
+class RuleGestureClassifier:
+    """The original finger-up rules plus a horizontal swipe threshold, evaluated per batch."""
+
+    def __init__(self, swipe_threshold: float = 0.20) -> None:
+        self._swipe_threshold = swipe_threshold
+
+    def predict(self, features: np.ndarray) -> List[Prediction]:
+        features = np.atleast_2d(features)
+        fingers = features[:, EXTENSION][:, 1:] > 0.5
+        static = np.select(
+            [fingers.all(axis=1), ~fingers.any(axis=1), fingers[:, 0] & ~fingers[:, 1:].any(axis=1)],
+            ["open_palm", "fist", "point"],
+            default="",
+        )
+        swipes = _swipes(features, self._swipe_threshold)
+        labels = np.where(swipes != "", swipes, static)
+        return [(str(label), 1.0) if label else (None, 0.0) for label in labels]
+
+
+class CentroidGestureClassifier:
+    """Nearest-centroid (or k-nearest-neighbour) model over static hand-shape features.
+
+    Swipes are still detected from the velocity features, since a single
+    calibrated pose cannot describe motion.
+    """
+
+    def __init__(
+        self,
+        samples: np.ndarray,
+        labels: Sequence[str],
+        k: int = 1,
+        max_distance: float = 1.0,
+        swipe_threshold: float = 0.20,
+    ) -> None:
+        self._samples = np.asarray(samples, dtype=np.float32)[:, STATIC]
+        self._sample_labels = np.asarray(labels)
+        self._labels = np.unique(self._sample_labels)
+        self._centroids = np.stack([self._samples[self._sample_labels == label].mean(axis=0) for label in self._labels])
+        self._k = k
+        self._max_distance = max_distance
+        self._swipe_threshold = swipe_threshold
+
+    @classmethod
+    def load(cls, path: str | Path, **kwargs: float) -> "CentroidGestureClassifier":
+        """Load a calibration file: ``{"samples": [[...], ...], "labels": [...], "k": 1, "max_distance": 1.0}``."""
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+        options = {key: data[key] for key in ("k", "max_distance") if key in data}
+        options.update(kwargs)
+        return cls(np.asarray(data["samples"], dtype=np.float32), data["labels"], **options)
+
+    def predict(self, features: np.ndarray) -> List[Prediction]:
+        features = np.atleast_2d(features)
+        static = features[:, STATIC]
+        if self._k > 1:
+            distances = np.linalg.norm(static[:, None, :] - self._samples[None, :, :], axis=-1)
+            nearest = np.argsort(distances, axis=1)[:, : self._k]
+            votes = self._sample_labels[nearest]
+            best_distance = np.take_along_axis(distances, nearest[:, :1], axis=1)[:, 0]
+            labels = [max(set(row), key=list(row).count) for row in votes]
+        else:
+            distances = np.linalg.norm(static[:, None, :] - self._centroids[None, :, :], axis=-1)
+            best = distances.argmin(axis=1)
+            best_distance = distances[np.arange(len(static)), best]
+            labels = list(self._labels[best])
+
+        confidence = np.clip(1.0 - best_distance / self._max_distance, 0.0, 1.0)
+        swipes = _swipes(features, self._swipe_threshold)
+        predictions: List[Prediction] = []
+        for swipe, label, score in zip(swipes, labels, confidence):
+            if swipe:
+                predictions.append((str(swipe), 1.0))
+            elif score > 0.0:
+                predictions.append((str(label), float(score)))
+            else:
+                predictions.append((None, 0.0))
+        return predictions
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from enum import Enum
+from typing import Dict, FrozenSet, List, Optional
+
+MOMENTARY_GESTURES = frozenset({"swipe_left", "swipe_right"})
+
+
+class GesturePhase(str, Enum):
+    ENTER = "enter"
+    HOLD = "hold"
+    RELEASE = "release"
+
+
+@dataclass(slots=True, frozen=True)
+class GestureTransition:
+    gesture: str
+    phase: GesturePhase
+    confidence: float
+    held_for: float = 0.0
+
+
+class GestureDebouncer:
+    """Turns per-frame classifications into enter/hold/release edges for one hand.
+
+    A static gesture must be seen for ``min_dwell`` seconds above
+    ``exit_confidence`` and then reach ``enter_confidence`` before it enters.
+    It stays active while confidence stays above ``exit_confidence`` and is
+    released after ``release_after`` seconds without support. Re-entering the
+    same gesture within ``cooldown`` seconds is suppressed. Momentary gestures
+    (swipes) skip the dwell and only respect the cooldown.
+    """
+
+    def __init__(
+        self,
+        min_dwell: float = 0.15,
+        cooldown: float = 0.75,
+        enter_confidence: float = 0.7,
+        exit_confidence: float = 0.5,
+        release_after: float = 0.15,
+        hold_interval: float | None = None,
+        momentary: FrozenSet[str] = MOMENTARY_GESTURES,
+    ) -> None:
+        self._min_dwell = min_dwell
+        self._cooldown = cooldown
+        self._enter_confidence = enter_confidence
+        self._exit_confidence = exit_confidence
+        self._release_after = release_after
+        self._hold_interval = hold_interval
+        self._momentary = momentary
+        self._last_enter: Dict[str, float] = {}
+        self._candidate: Optional[str] = None
+        self._candidate_since = 0.0
+        self._active: Optional[str] = None
+        self._active_since = 0.0
+        self._active_emitted = False
+        self._last_support = 0.0
+        self._last_hold = 0.0
+        self._confidence = 0.0
+
+    @property
+    def active(self) -> Optional[str]:
+        return self._active
+
+    def reset(self) -> None:
+        self._candidate = None
+        self._active = None
+
+    def update(self, gesture: Optional[str], confidence: float, now: float) -> List[GestureTransition]:
+        transitions: List[GestureTransition] = []
+
+        if gesture in self._momentary:
+            if confidence >= self._enter_confidence and self._cooled_down(gesture, now):
+                self._last_enter[gesture] = now
+                transitions.append(GestureTransition(gesture, GesturePhase.ENTER, confidence))
+            return transitions
+
+        if self._active is not None:
+            if gesture == self._active and confidence >= self._exit_confidence:
+                self._last_support = now
+                self._confidence = confidence
+                if self._active_emitted and self._hold_interval and now - self._last_hold >= self._hold_interval:
+                    self._last_hold = now
+                    transitions.append(
+                        GestureTransition(self._active, GesturePhase.HOLD, confidence, now - self._active_since)
+                    )
+                return transitions
+            if now - self._last_support < self._release_after:
+                return transitions
+            if self._active_emitted:
+                transitions.append(
+                    GestureTransition(self._active, GesturePhase.RELEASE, self._confidence, now - self._active_since)
+                )
+            self._active = None
+
+        if gesture is None or confidence < self._exit_confidence:
+            self._candidate = None
+            return transitions
+        if gesture != self._candidate:
+            self._candidate = gesture
+            self._candidate_since = now
+        if now - self._candidate_since < self._min_dwell or confidence < self._enter_confidence:
+            return transitions
+
+        self._active = gesture
+        self._active_since = now
+        self._last_support = now
+        self._last_hold = now
+        self._confidence = confidence
+        self._candidate = None
+        self._active_emitted = self._cooled_down(gesture, now)
+        if self._active_emitted:
+            self._last_enter[gesture] = now
+            transitions.append(GestureTransition(gesture, GesturePhase.ENTER, confidence))
+        return transitions
+
+    def _cooled_down(self, gesture: str, now: float) -> bool:
+        last = self._last_enter.get(gesture)
+        return last is None or now - last >= self._cooldown
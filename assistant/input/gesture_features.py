@@ -0,0 +1,139 @@
+"""Vectorized hand-landmark features.
+
+Landmarks are handled as ``(21, 3)`` float32 arrays (or ``(T, 21, 3)`` for a
+recorded sequence), so every feature is computed with whole-array NumPy
+operations and works the same on one frame or on a batch.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Iterable, Optional
+
+import numpy as np
+
+NUM_LANDMARKS = 21
+WRIST = 0
+MIDDLE_MCP = 9
+INDEX_TIP = 8
+TIP_IDS = np.array([4, 8, 12, 16, 20])
+# Landmark compared against each tip to decide whether the finger is extended.
+EXTENSION_REF_IDS = np.array([3, 6, 10, 14, 18])
+FINGER_CHAINS = np.array(
+    [
+        [0, 1, 2, 3, 4],
+        [0, 5, 6, 7, 8],
+        [0, 9, 10, 11, 12],
+        [0, 13, 14, 15, 16],
+        [0, 17, 18, 19, 20],
+    ]
+)
+
+EXTENSION = slice(0, 5)
+ANGLES = slice(5, 20)
+DISTANCES = slice(20, 25)
+VELOCITY = slice(25, 27)
+STATIC = slice(0, 25)
+NUM_FEATURES = 27
+
+SWIPE_WINDOW = 6
+SWIPE_MIN_FRAMES = 5
+
+
+def landmarks_to_array(landmarks: Iterable[Any], out: Optional[np.ndarray] = None) -> np.ndarray:
+    """Copy MediaPipe landmark objects into a ``(21, 3)`` float32 array (reusing ``out``)."""
+    if out is None:
+        out = np.empty((NUM_LANDMARKS, 3), dtype=np.float32)
+    for row, point in zip(out, landmarks):
+        row[0], row[1], row[2] = point.x, point.y, point.z
+    return out
+
+
+def finger_extension(points: np.ndarray) -> np.ndarray:
+    """``(..., 5)`` bool: thumb compared on x, the other fingers on y."""
+    tips = points[..., TIP_IDS, :]
+    refs = points[..., EXTENSION_REF_IDS, :]
+    extended = tips[..., 1] < refs[..., 1]
+    extended[..., 0] = tips[..., 0, 0] > refs[..., 0, 0]
+    return extended
+
+
+def joint_angles(points: np.ndarray) -> np.ndarray:
+    """``(..., 15)`` bend angle at the three inner joints of each finger, scaled to ``[0, 1]``."""
+    chains = points[..., FINGER_CHAINS, :]
+    joint = chains[..., 1:-1, :]
+    before = chains[..., :-2, :] - joint
+    after = chains[..., 2:, :] - joint
+    dot = np.einsum("...k,...k->...", before, after)
+    norms = np.linalg.norm(before, axis=-1) * np.linalg.norm(after, axis=-1)
+    cosine = np.clip(dot / np.maximum(norms, 1e-6), -1.0, 1.0)
+    angles = np.arccos(cosine) / np.pi
+    return angles.reshape(*angles.shape[:-2], 15)
+
+
+def hand_size(points: np.ndarray) -> np.ndarray:
+    return np.maximum(np.linalg.norm(points[..., MIDDLE_MCP, :] - points[..., WRIST, :], axis=-1), 1e-6)
+
+
+def tip_distances(points: np.ndarray) -> np.ndarray:
+    """``(..., 5)`` wrist-to-fingertip distances divided by hand size."""
+    distances = np.linalg.norm(points[..., TIP_IDS, :] - points[..., WRIST : WRIST + 1, :], axis=-1)
+    return distances / hand_size(points)[..., None]
+
+
+def extract_features(points: np.ndarray, velocity: Optional[np.ndarray] = None) -> np.ndarray:
+    """``(..., NUM_FEATURES)`` float32 feature rows; ``velocity`` is the index-tip (dx, dy)."""
+    batch_shape = points.shape[:-2]
+    features = np.empty((*batch_shape, NUM_FEATURES), dtype=np.float32)
+    features[..., EXTENSION] = finger_extension(points)
+    features[..., ANGLES] = joint_angles(points)
+    features[..., DISTANCES] = tip_distances(points)
+    features[..., VELOCITY] = 0.0 if velocity is None else velocity
+    return features
+
+
+def sequence_velocity(sequence: np.ndarray, window: int = SWIPE_WINDOW, min_frames: int = SWIPE_MIN_FRAMES) -> np.ndarray:
+    """``(T, 2)`` index-tip displacement over the trailing ``window`` frames of a recorded sequence."""
+    tips = sequence[:, INDEX_TIP, :2]
+    velocity = np.zeros((len(sequence), 2), dtype=np.float32)
+    if len(sequence) < min_frames:
+        return velocity
+    start = np.maximum(np.arange(len(sequence)) - (window - 1), 0)
+    velocity[:] = tips - tips[start]
+    velocity[: min_frames - 1] = 0.0
+    return velocity
+
+
+def sequence_features(sequence: np.ndarray) -> np.ndarray:
+    """Features for a whole ``(T, 21, 3)`` recording in one vectorized pass."""
+    return extract_features(sequence, sequence_velocity(sequence))
+
+
+class LandmarkHistory:
+    """Fixed-size ring buffer of recent landmark arrays for one hand."""
+
+    def __init__(self, capacity: int = SWIPE_WINDOW, min_frames: int = SWIPE_MIN_FRAMES) -> None:
+        self._buffer = np.zeros((capacity, NUM_LANDMARKS, 3), dtype=np.float32)
+        self._capacity = capacity
+        self._min_frames = min_frames
+        self._count = 0
+        self._head = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def append(self, points: np.ndarray) -> None:
+        self._buffer[self._head] = points
+        self._head = (self._head + 1) % self._capacity
+        self._count = min(self._count + 1, self._capacity)
+
+    def clear(self) -> None:
+        self._count = 0
+        self._head = 0
+
+    def velocity(self) -> np.ndarray:
+        """Index-tip (dx, dy) between the oldest and newest buffered frames."""
+        if self._count < self._min_frames:
+            return np.zeros(2, dtype=np.float32)
+        newest = self._buffer[(self._head - 1) % self._capacity, INDEX_TIP, :2]
+        oldest = self._buffer[(self._head - self._count) % self._capacity, INDEX_TIP, :2]
+        return newest - oldest
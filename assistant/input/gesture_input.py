@@ -1,29 +1,137 @@
 from __future__ import annotations
 
 import logging
-from collections import deque
+from contextlib import ExitStack
+from dataclasses import dataclass
 from threading import Event, Thread
-from typing import Deque, Optional
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, Callable, Iterable, List, Optional, Sequence, Tuple
 
+from assistant.core import tracing
 from assistant.core.events import AssistantEvent, EventBus
+from assistant.core.power import PowerTier, TierProfile
+from assistant.input.capture import (
+    FULL_FRAME,
+    FrameRef,
+    FrameSource,
+    GesturePipeline,
+    InferenceScheduler,
+    PipelineStats,
+    Roi,
+    open_source,
+)
+from assistant.input.gesture_debounce import GestureDebouncer, GesturePhase, GestureTransition
+from assistant.input.hand_tracking import HandTrack, HandTracker, two_hand_gesture
+
+if TYPE_CHECKING:
+    from assistant.input.gesture_classifier import GestureClassifier
+    from assistant.input.gesture_features import LandmarkHistory
+    from assistant.input.motion import MotionDetector
+
+# Receives the first camera's first hand landmarks (or ``None``) and the frame's capture time.
+LandmarkSink = Callable[[Optional[List[Tuple[float, float, float]]], float], None]
+
+_PHASE_EVENTS = {
+    GesturePhase.ENTER: "gesture.detected",
+    GesturePhase.HOLD: "gesture.hold",
+    GesturePhase.RELEASE: "gesture.released",
+}
+
+
+def _hand_scores(result: Any, count: int) -> List[float]:
+    handedness = getattr(result, "multi_handedness", None)
+    if not handedness:
+        return [1.0] * count
+    return [float(hand.classification[0].score) for hand in handedness[:count]]
+
+
+def _capped(configured: float | None, cap: float | None) -> float | None:
+    if cap is None:
+        return configured
+    return cap if configured is None else min(configured, cap)
+
+
+@dataclass(slots=True)
+class _HandState:
+    history: LandmarkHistory
+    debouncer: GestureDebouncer
+    points: Any = None
+
+
+@dataclass(slots=True)
+class _Camera:
+    index: int
+    tracker: HandTracker
+    pair: GestureDebouncer
+    pipeline: GesturePipeline | None = None
+    motion: MotionDetector | None = None
 
 
 class GestureInputService:
-    """MediaPipe based hand gesture recognition service."""
+    """MediaPipe based hand gesture recognition over one or more cameras.
+
+    Every camera (or video file) gets its own capture thread and MediaPipe
+    graph; inference for all of them shares one thread through an
+    ``InferenceScheduler`` limited to ``fps_budget`` frames per second. Each
+    hand is tracked with its own ID, landmark history and debouncer, and two
+    hands showing a pair in ``TWO_HAND_GESTURES`` produce one gesture with
+    ``hand="both"``. Events carry ``camera`` and ``hand``.
+
+    ``set_tier`` trades responsiveness for CPU while nobody is around: lower
+    capture and inference rates and resolution, and in ``motion_only`` tiers
+    frame differencing instead of MediaPipe. Visible hands and motion are
+    reported to ``on_activity``. ``on_ready`` is called once per start:
+    with ``True`` once every camera is open and has its MediaPipe graph, or
+    with ``False`` if that failed. If the service ends without ``stop`` (a
+    missing dependency, a camera that cannot be opened or stalls) ``on_exit``
+    gets the error.
+    """
 
-    def __init__(self, bus: EventBus, camera_index: int = 0, min_confidence: float = 0.6) -> None:
+    def __init__(
+        self,
+        bus: EventBus,
+        cameras: Sequence[int | str] = (0,),
+        min_confidence: float = 0.6,
+        downscale: float = 1.0,
+        roi_crop: bool = False,
+        source_factories: Sequence[Callable[[], FrameSource]] | None = None,
+        classifier: GestureClassifier | None = None,
+        calibration_path: str | None = None,
+        debouncer_factory: Callable[[], GestureDebouncer] = GestureDebouncer,
+        landmark_sink: LandmarkSink | None = None,
+        max_hands: int = 2,
+        fps_budget: float | None = None,
+        on_activity: Callable[[str], None] | None = None,
+        on_ready: Callable[[bool], None] | None = None,
+        on_exit: Callable[[Optional[BaseException]], None] | None = None,
+    ) -> None:
         self._bus = bus
-        self._camera_index = camera_index
+        self._sources = list(source_factories or [lambda spec=spec: open_source(spec) for spec in cameras])
         self._min_confidence = min_confidence
+        self._downscale = downscale
+        self._roi_crop = roi_crop
+        self._max_hands = max_hands
+        self._fps_budget = fps_budget
+        self._cameras: List[_Camera] = []
         self._thread: Thread | None = None
         self._stop = Event()
         self._logger = logging.getLogger(self.__class__.__name__)
-        self._x_history: Deque[float] = deque(maxlen=6)
+        self._classifier = classifier
+        self._calibration_path = calibration_path
+        self._new_debouncer = debouncer_factory
+        self._landmark_sink = landmark_sink
+        self._on_activity = on_activity
+        self._on_ready = on_ready
+        self._on_exit = on_exit
+        self._ready_reported = False
+        self._profile = TierProfile()
+        self._scheduler: InferenceScheduler | None = None
 
     def start(self) -> None:
         if self._thread and self._thread.is_alive():
             return
         self._stop.clear()
+        self._ready_reported = False
         self._thread = Thread(target=self._run, name="gesture-input", daemon=True)
         self._thread.start()
 
@@ -32,58 +140,213 @@ class GestureInputService:
         if self._thread:
             self._thread.join(timeout=1)
 
+    def stats(self) -> Optional[PipelineStats]:
+        """Capture and inference counters summed over all cameras."""
+        stats = self.camera_stats()
+        return PipelineStats.combine(stats) if stats else None
+
+    def camera_stats(self) -> List[PipelineStats]:
+        return [camera.pipeline.stats() for camera in self._cameras if camera.pipeline]
+
+    def set_min_confidence(self, min_confidence: float) -> None:
+        """Change the hand confidence threshold without rebuilding the MediaPipe graph.
+
+        The graph keeps the threshold it was created with; hands scored below
+        the new value are treated as absent, so lowering it below the startup
+        value only takes effect after a restart.
+        """
+        self._min_confidence = min_confidence
+
+    def set_tier(self, tier: PowerTier, profile: TierProfile) -> None:
+        """Apply a power tier's rates to the running cameras (and to cameras started later)."""
+        self._profile = profile
+        if self._scheduler is not None:
+            self._scheduler.set_fps_budget(_capped(self._fps_budget, profile.gesture_fps))
+        for camera in self._cameras:
+            if camera.pipeline is not None:
+                camera.pipeline.set_capture_fps(profile.capture_fps)
+            if camera.motion is not None:
+                camera.motion.reset()
+        self._logger.debug("gesture input %s: %s", tier.value, profile)
+
     def _run(self) -> None:
+        error: BaseException | None = None
         try:
-            import cv2
-            import mediapipe as mp
+            self._serve()
         except Exception as exc:  # noqa: BLE001
-            self._logger.error("Gesture dependencies unavailable: %s", exc)
-            return
+            error = exc
+            self._logger.error("gesture input unavailable: %s", exc)
+        finally:
+            self._report_ready(False)
+        if self._on_exit is not None and not self._stop.is_set():
+            self._on_exit(error)
 
-        cap = cv2.VideoCapture(self._camera_index)
-        mp_hands = mp.solutions.hands
-        with mp_hands.Hands(min_detection_confidence=self._min_confidence, min_tracking_confidence=self._min_confidence) as hands:
-            while not self._stop.is_set():
-                ok, frame = cap.read()
-                if not ok:
-                    continue
-                rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                result = hands.process(rgb)
-                gesture = self._recognize(result)
-                if gesture:
-                    self._bus.publish(AssistantEvent(event_type="gesture.detected", payload={"gesture": gesture}, source="gesture"))
-        cap.release()
-
-    def _recognize(self, result: object) -> Optional[str]:
-        multi_hand_landmarks = getattr(result, "multi_hand_landmarks", None)
-        if not multi_hand_landmarks:
+    def _report_ready(self, ok: bool) -> None:
+        if self._on_ready is not None and not self._ready_reported:
+            self._ready_reported = True
+            self._on_ready(ok)
+
+    def _serve(self) -> None:
+        import cv2
+        import mediapipe as mp
+        import numpy as np
+
+        from assistant.input.motion import MotionDetector
+
+        self._prepare(len(self._sources))
+
+        def convert(frame: Any, slot: Any) -> Any:
+            return cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=slot)
+
+        def inference(hands: Any, camera: _Camera) -> Callable[[Any, Roi], Any]:
+            def infer(image: Any, roi: Roi) -> Any:
+                if self._profile.motion_only and camera.motion is not None:
+                    if camera.motion.update(image) and self._on_activity:
+                        self._on_activity("motion")
+                    return None
+                if not roi.is_full:
+                    height, width = image.shape[:2]
+                    image = image[int(roi.y0 * height) : int(roi.y1 * height), int(roi.x0 * width) : int(roi.x1 * width)]
+                scale = self._downscale * self._profile.downscale
+                if scale < 1.0:
+                    image = cv2.resize(image, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+                return hands.process(np.ascontiguousarray(image))
+
+            return infer
+
+        with ExitStack() as stack:
+            for camera, source in zip(self._cameras, self._sources):
+                hands = stack.enter_context(
+                    mp.solutions.hands.Hands(
+                        max_num_hands=self._max_hands,
+                        min_detection_confidence=self._min_confidence,
+                        min_tracking_confidence=self._min_confidence,
+                    )
+                )
+                camera.motion = MotionDetector()
+                camera.pipeline = GesturePipeline(
+                    source(),
+                    inference(hands, camera),
+                    lambda result, frame, roi, camera=camera: self._on_result(camera, result, frame, roi),
+                    allocate=np.empty_like,
+                    convert=convert,
+                )
+                camera.pipeline.set_capture_fps(self._profile.capture_fps)
+            pipelines = [camera.pipeline for camera in self._cameras if camera.pipeline]
+            self._scheduler = InferenceScheduler(pipelines, _capped(self._fps_budget, self._profile.gesture_fps))
+            self._report_ready(True)
+            self._scheduler.run(self._stop)
+
+    def run_landmarks(self, frames: Iterable[Tuple[float, Optional[Sequence[Tuple[float, float, float]]]]]) -> None:
+        """Recognize pre-extracted ``(captured_at, landmarks)`` frames of one hand instead of camera input.
+
+        Used to replay recorded sessions without OpenCV or MediaPipe; ``None``
+        landmarks mean no hand was visible in that frame.
+        """
+        self._prepare(1)
+        camera = self._cameras[0]
+        for seq, (captured_at, points) in enumerate(frames):
+            if self._stop.is_set():
+                return
+            hands = [SimpleNamespace(landmark=[SimpleNamespace(x=x, y=y, z=z) for x, y, z in points])] if points else []
+            result = SimpleNamespace(multi_hand_landmarks=hands)
+            self._on_result(camera, result, FrameRef(0, seq, captured_at, None), FULL_FRAME)
+
+    def _prepare(self, count: int) -> None:
+        from assistant.input.gesture_features import LandmarkHistory
+
+        if self._classifier is None:
+            self._classifier = self._load_classifier()
+        self._cameras = [
+            _Camera(
+                index,
+                HandTracker(lambda: _HandState(LandmarkHistory(), self._new_debouncer())),
+                self._new_debouncer(),
+            )
+            for index in range(count)
+        ]
+
+    def _on_result(self, camera: _Camera, result: Any, frame: FrameRef, roi: Roi) -> Optional[Roi]:
+        now = frame.captured_at
+        detected = getattr(result, "multi_hand_landmarks", None) or []
+        scores = _hand_scores(result, len(detected))
+        hands = [hand.landmark for hand, score in zip(detected, scores) if score >= self._min_confidence]
+        if hands and self._on_activity:
+            self._on_activity("gesture")
+        if not roi.is_full:
+            for landmarks in hands:
+                for point in landmarks:
+                    point.x, point.y = roi.to_frame(point.x, point.y)
+        if self._landmark_sink and camera.index == 0:
+            first = [(point.x, point.y, point.z) for point in hands[0]] if hands else None
+            self._landmark_sink(first, now)
+
+        tracks = camera.tracker.update([(landmarks[0].x, landmarks[0].y) for landmarks in hands], now)
+        predictions = self._recognize(tracks, hands)
+        pair, pair_confidence = None, 0.0
+        if len(predictions) >= 2:
+            (first, first_confidence), (second, second_confidence) = predictions[:2]
+            pair = two_hand_gesture(first, second)
+            pair_confidence = min(first_confidence, second_confidence)
+        for track, (gesture, confidence) in zip(tracks, predictions):
+            # Hands taking part in a two-hand gesture do not also fire their own.
+            transitions = track.state.debouncer.update(None if pair else gesture, confidence, now)
+            self._emit(transitions, camera.index, track.id, now)
+        for track in camera.tracker.missing(now):
+            self._emit(track.state.debouncer.update(None, 0.0, now), camera.index, track.id, now)
+        self._emit(camera.pair.update(pair, pair_confidence, now), camera.index, "both", now)
+
+        if not hands:
             return None
+        if not self._roi_crop:
+            return FULL_FRAME
+        points = [point for landmarks in hands for point in landmarks]
+        return Roi.around((point.x for point in points), (point.y for point in points))
+
+    def _emit(self, transitions: Iterable[GestureTransition], camera: int, hand: int | str, captured_at: float) -> None:
+        for transition in transitions:
+            event = AssistantEvent(
+                event_type=_PHASE_EVENTS[transition.phase],
+                payload={
+                    "gesture": transition.gesture,
+                    "confidence": transition.confidence,
+                    "held_for": transition.held_for,
+                    "camera": camera,
+                    "hand": hand,
+                },
+                source="gesture",
+                origin=captured_at,
+            )
+            if transition.phase is GesturePhase.ENTER:
+                tracing.tracer().record(event.trace_id, "recognition", event.ts - captured_at)
+            self._bus.publish(event)
+
+    def _recognize(self, tracks: Sequence[HandTrack], hands: Sequence[Any]) -> List[Tuple[Optional[str], float]]:
+        """Classify every visible hand in one batch."""
+        if not hands:
+            return []
+        import numpy as np
+
+        from assistant.input.gesture_features import extract_features, landmarks_to_array
+
+        rows = []
+        for track, landmarks in zip(tracks, hands):
+            state: _HandState = track.state
+            state.points = landmarks_to_array(landmarks, out=state.points)
+            state.history.append(state.points)
+            rows.append(extract_features(state.points, state.history.velocity()))
+        predictions = self._classifier.predict(np.stack(rows))
+        for track, (gesture, _) in zip(tracks, predictions):
+            if gesture in ("swipe_left", "swipe_right"):
+                track.state.history.clear()
+        return predictions
+
+    def _load_classifier(self) -> GestureClassifier:
+        from assistant.input.gesture_classifier import CentroidGestureClassifier, RuleGestureClassifier
 
-        hand = multi_hand_landmarks[0]
-        landmarks = hand.landmark
-        tip_ids = [4, 8, 12, 16, 20]
-
-        fingers_up = []
-        fingers_up.append(landmarks[4].x > landmarks[3].x)
-        for tip in tip_ids[1:]:
-            fingers_up.append(landmarks[tip].y < landmarks[tip - 2].y)
-
-        index_x = landmarks[8].x
-        self._x_history.append(index_x)
-        if len(self._x_history) >= 5:
-            delta = self._x_history[-1] - self._x_history[0]
-            if delta > 0.20:
-                self._x_history.clear()
-                return "swipe_right"
-            if delta < -0.20:
-                self._x_history.clear()
-                return "swipe_left"
-
-        if all(fingers_up[1:]):
-            return "open_palm"
-        if not any(fingers_up[1:]):
-            return "fist"
-        if fingers_up[1] and not any(fingers_up[2:]):
-            return "point"
-
-        return None
+        if self._calibration_path:
+            try:
+                return CentroidGestureClassifier.load(self._calibration_path)
+            except Exception as exc:  # noqa: BLE001
+                self._logger.warning("Gesture calibration unavailable, using rules: %s", exc)
+        return RuleGestureClassifier()
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import itertools
+import math
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+# Pairs of per-hand gestures (sorted by name) recognized as one two-hand gesture.
+TWO_HAND_GESTURES: Dict[Tuple[str, str], str] = {
+    ("open_palm", "open_palm"): "both_palms",
+    ("fist", "fist"): "both_fists",
+}
+
+
+def two_hand_gesture(first: Optional[str], second: Optional[str]) -> Optional[str]:
+    if first is None or second is None:
+        return None
+    return TWO_HAND_GESTURES.get((min(first, second), max(first, second)))
+
+
+@dataclass(slots=True)
+class HandTrack:
+    id: int
+    x: float
+    y: float
+    last_seen: float
+    # Per-hand recognition state (landmark history, debouncer, ...), created by the tracker's factory.
+    state: Any = None
+
+
+class HandTracker:
+    """Gives each hand in one camera's view a stable ID across frames.
+
+    Hands are matched to tracks by wrist distance, closest pairs first and at
+    most ``max_jump`` apart (in normalized frame units); unmatched hands open a
+    new track. Tracks not seen for ``lost_after`` seconds are dropped.
+    """
+
+    def __init__(self, new_state: Callable[[], Any], max_jump: float = 0.2, lost_after: float = 0.5) -> None:
+        self._new_state = new_state
+        self._max_jump = max_jump
+        self._lost_after = lost_after
+        self._ids = itertools.count(1)
+        self.tracks: Dict[int, HandTrack] = {}
+
+    def update(self, wrists: Sequence[Tuple[float, float]], now: float) -> List[HandTrack]:
+        """Tracks for ``wrists``, in the same order."""
+        pairs = sorted(
+            (math.dist(wrist, (track.x, track.y)), index, track.id)
+            for index, wrist in enumerate(wrists)
+            for track in self.tracks.values()
+        )
+        assigned: Dict[int, int] = {}
+        for distance, index, track_id in pairs:
+            if distance > self._max_jump:
+                break
+            if index not in assigned and track_id not in assigned.values():
+                assigned[index] = track_id
+
+        matched: List[HandTrack] = []
+        for index, (x, y) in enumerate(wrists):
+            track = self.tracks.get(assigned.get(index, -1))
+            if track is None:
+                track = HandTrack(next(self._ids), x, y, now, self._new_state())
+                self.tracks[track.id] = track
+            track.x, track.y, track.last_seen = x, y, now
+            matched.append(track)
+        return matched
+
+    def missing(self, now: float) -> List[HandTrack]:
+        """Tracks not seen in the frame at ``now``; stale ones are dropped after being returned once more."""
+        missing = [track for track in self.tracks.values() if track.last_seen < now]
+        for track in missing:
+            if now - track.last_seen > self._lost_after:
+                del self.tracks[track.id]
+        return missing
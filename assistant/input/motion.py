@@ -0,0 +1,42 @@
+"""Cheap motion detection used to wake a sleeping camera."""
+
+from __future__ import annotations
+
+from typing import Any, Optional
+
+import numpy as np
+
+
+class MotionDetector:
+    """Frame differencing on a small grayscale thumbnail.
+
+    Each frame is subsampled to about ``size`` pixels on its long side and
+    compared with the previous one; motion is reported when more than
+    ``min_area`` of the thumbnail changed by over ``pixel_threshold`` grey
+    levels. A thumbnail costs microseconds, against tens of milliseconds for
+    hand landmark inference.
+    """
+
+    def __init__(self, size: int = 48, pixel_threshold: float = 25.0, min_area: float = 0.01) -> None:
+        self._size = size
+        self._pixel_threshold = pixel_threshold
+        self._min_area = min_area
+        self._previous: Optional[np.ndarray] = None
+        # Fraction of the thumbnail that changed in the last frame.
+        self.score = 0.0
+
+    def update(self, image: Any) -> bool:
+        """Whether ``image`` (an ``(H, W)`` or ``(H, W, C)`` array) moved since the previous frame."""
+        step = max(1, max(image.shape[:2]) // self._size)
+        thumb = image[::step, ::step]
+        thumb = thumb.mean(axis=2, dtype=np.float32) if thumb.ndim == 3 else thumb.astype(np.float32)
+        previous, self._previous = self._previous, thumb
+        if previous is None or previous.shape != thumb.shape:
+            self.score = 0.0
+            return False
+        self.score = float(np.count_nonzero(np.abs(thumb - previous) > self._pixel_threshold)) / thumb.size
+        return self.score > self._min_area
+
+    def reset(self) -> None:
+        self._previous = None
+        self.score = 0.0
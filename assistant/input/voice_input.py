@@ -1,19 +1,96 @@
 from __future__ import annotations
 
 import logging
+import re
 from threading import Event, Thread
+from time import monotonic
+from typing import Any, Callable, Optional, Tuple, Type
 
+from assistant.core import tracing
 from assistant.core.events import AssistantEvent, EventBus
+from assistant.core.power import PowerTier, TierProfile
+from assistant.input.asr import (
+    CHUNK_MS,
+    SAMPLE_RATE,
+    AudioSource,
+    StreamingRecognizer,
+    StreamingStats,
+    StreamingVoicePipeline,
+)
+from assistant.input.wake_word import WakeWordDetector, WakeWordGate
+
+# Recognition errors in a row before the capture loop gives up and lets the supervisor reopen the device.
+MAX_CONSECUTIVE_ERRORS = 5
 
 
 class VoiceInputService:
-    """Continuously captures microphone input and emits transcribed text events."""
+    """Continuously captures microphone input and emits transcribed text events.
+
+    The ``google`` backend transcribes whole phrases through SpeechRecognition.
+    The ``vosk`` backend runs offline: audio is VAD-gated, streamed in chunks,
+    and ``voice.partial`` events are published as words arrive, followed by a
+    ``voice.text`` event carrying the same ``utterance_id``.
+
+    With a ``wake_word`` full recognition only runs for ``wake_follow_up``
+    seconds after a local keyword spotter hears it. The streaming backend
+    spots it in the audio stream; the ``google`` backend runs the spotter over
+    each captured phrase and only sends phrases that contain it (or follow it)
+    to Google. Without a spotter (no ``vosk_model_path`` or
+    ``wake_detector_factory``) the ``google`` backend has to transcribe every
+    phrase and drop those that do not start with the wake word, and says so
+    with a warning. The wake word matches whole words only.
+
+    ``set_tier`` thins out voice activity detection while the assistant is
+    idle; the ``google`` backend instead pauses after each listen that heard
+    nothing to transcribe. Speech onsets are reported to
+    ``on_activity``. ``on_ready`` is called once per start, with ``True``
+    after the microphone is calibrated or the models are loaded, or with
+    ``False`` if the backend could not start. When the capture thread ends
+    without ``stop`` (the device or backend failed, or a finite source ran
+    out) ``on_exit`` gets the error, or ``None``.
+    """
 
-    def __init__(self, bus: EventBus, language: str = "en-US", timeout: int = 3, phrase_time_limit: int = 5) -> None:
+    def __init__(
+        self,
+        bus: EventBus,
+        language: str = "en-US",
+        timeout: int = 3,
+        phrase_time_limit: int = 5,
+        backend: str = "google",
+        vosk_model_path: str | None = None,
+        vad: str = "energy",
+        source_factory: Callable[[], AudioSource] | None = None,
+        recognizer_factory: Callable[[int], StreamingRecognizer] | None = None,
+        wake_word: str = "",
+        wake_follow_up: float = 8.0,
+        wake_detector_factory: Callable[[int], WakeWordDetector] | None = None,
+        on_activity: Callable[[str], None] | None = None,
+        on_ready: Callable[[bool], None] | None = None,
+        on_exit: Callable[[Optional[BaseException]], None] | None = None,
+    ) -> None:
         self._bus = bus
         self._language = language
         self._timeout = timeout
         self._phrase_time_limit = phrase_time_limit
+        self._backend = backend
+        self._vosk_model_path = vosk_model_path
+        self._vad = vad
+        self._source_factory = source_factory
+        self._recognizer_factory = recognizer_factory
+        self._wake_word = wake_word.strip().lower()
+        # Leading wake word as whole words, with the punctuation after it: "assistant, open ..." but not "assistants".
+        words = re.findall(r"[\w']+", self._wake_word)
+        self._wake_pattern = re.compile(r"^\W*" + r"\W+".join(map(re.escape, words)) + r"\b[\s,.!?]*", re.I)
+        self._wake_follow_up = wake_follow_up
+        self._wake_detector_factory = wake_detector_factory
+        self._wake_until = 0.0
+        self._on_activity = on_activity
+        self._on_ready = on_ready
+        self._on_exit = on_exit
+        self._ready_reported = False
+        self._vad_stride = 1
+        self._listen_pause = 0.0
+        self._pipeline: StreamingVoicePipeline | None = None
         self._stop = Event()
         self._thread: Thread | None = None
         self._logger = logging.getLogger(self.__class__.__name__)
@@ -22,6 +99,7 @@ class VoiceInputService:
         if self._thread and self._thread.is_alive():
             return
         self._stop.clear()
+        self._ready_reported = False
         self._thread = Thread(target=self._run, name="voice-input", daemon=True)
         self._thread.start()
 
@@ -30,24 +108,214 @@ class VoiceInputService:
         if self._thread:
             self._thread.join(timeout=1)
 
+    def wait(self, timeout: float | None = None) -> bool:
+        """Block until the capture thread ends (e.g. a finite source ran out); ``True`` if it did."""
+        if self._thread:
+            self._thread.join(timeout=timeout)
+            return not self._thread.is_alive()
+        return True
+
+    def stats(self) -> Optional[StreamingStats]:
+        return self._pipeline.stats if self._pipeline else None
+
+    def set_tier(self, tier: PowerTier, profile: TierProfile) -> None:
+        self._vad_stride = profile.vad_stride
+        self._listen_pause = profile.listen_pause
+        if self._pipeline is not None:
+            self._pipeline.vad_stride = profile.vad_stride
+
     def _run(self) -> None:
+        error: BaseException | None = None
         try:
-            import speech_recognition as sr
+            if self._backend == "google" and not self._recognizer_factory:
+                self._run_google()
+            else:
+                self._run_streaming()
         except Exception as exc:  # noqa: BLE001
-            self._logger.error("SpeechRecognition unavailable: %s", exc)
-            return
+            error = exc
+            self._logger.error("voice input unavailable: %s", exc)
+        finally:
+            self._report_ready(False)
+        if self._on_exit is not None and not self._stop.is_set():
+            self._on_exit(error)
+
+    def _report_ready(self, ok: bool) -> None:
+        if self._on_ready is not None and not self._ready_reported:
+            self._ready_reported = True
+            self._on_ready(ok)
+
+    def _run_google(self) -> None:
+        import speech_recognition as sr
 
         recognizer = sr.Recognizer()
         mic = sr.Microphone()
 
         with mic as source:
             recognizer.adjust_for_ambient_noise(source)
+        spotter = self._phrase_spotter()
+        self._report_ready(True)
+
+        def listen() -> Any:
+            with mic as source:
+                return recognizer.listen(source, timeout=self._timeout, phrase_time_limit=self._phrase_time_limit)
+
+        self._phrase_loop(
+            listen,
+            lambda audio: recognizer.recognize_google(audio, language=self._language),
+            lambda audio: audio.get_raw_data(convert_rate=SAMPLE_RATE, convert_width=2),
+            (sr.WaitTimeoutError, sr.UnknownValueError),
+            spotter,
+        )
+
+    def _phrase_spotter(self) -> Optional[WakeWordDetector]:
+        """Local keyword spotter that decides which phrases are worth a cloud transcription."""
+        if not self._wake_word:
+            return None
+        if self._wake_detector_factory:
+            return self._wake_detector_factory(SAMPLE_RATE)
+        if self._vosk_model_path:
+            from assistant.input.wake_word import VoskKeywordSpotter
+
+            return VoskKeywordSpotter(self._vosk_model_path, self._wake_word, SAMPLE_RATE)
+        self._logger.warning(
+            "wake word %r with the google backend and no vosk_model_path: every phrase is sent to Google "
+            "and only filtered afterwards; set vosk_model_path to spot the wake word locally",
+            self._wake_word,
+        )
+        return None
 
+    def _phrase_loop(
+        self,
+        listen: Callable[[], Any],
+        transcribe: Callable[[Any], str],
+        pcm: Callable[[Any], bytes],
+        quiet: Tuple[Type[BaseException], ...],
+        spotter: Optional[WakeWordDetector] = None,
+    ) -> None:
+        """Whole-phrase capture: ``listen`` for a phrase, gate it on the wake word, ``transcribe`` it.
+
+        ``pcm`` gives a phrase's 16 kHz 16-bit mono samples for the spotter;
+        ``quiet`` are the errors that mean nothing intelligible was said.
+        """
+        failures = 0
         while not self._stop.is_set():
+            text = ""
             try:
-                with mic as source:
-                    audio = recognizer.listen(source, timeout=self._timeout, phrase_time_limit=self._phrase_time_limit)
-                text = recognizer.recognize_google(audio, language=self._language)
-                self._bus.publish(AssistantEvent(event_type="voice.text", payload={"text": text}, source="voice"))
-            except Exception as exc:  # noqa: BLE001
+                audio = listen()
+                if spotter is None or self._phrase_has_wake_word(spotter, pcm(audio)):
+                    text = self._apply_wake_word(transcribe(audio))
+                failures = 0
+                if text:
+                    if self._on_activity:
+                        self._on_activity("voice")
+                    self._bus.publish(AssistantEvent(event_type="voice.text", payload={"text": text}, source="voice"))
+            except quiet as exc:
                 self._logger.debug("voice loop: %s", exc)
+            except Exception as exc:  # noqa: BLE001
+                # Back off 1, 2, 4, 8 s; after that the supervisor reopens the microphone.
+                failures += 1
+                if failures >= MAX_CONSECUTIVE_ERRORS:
+                    raise
+                delay = 0.5 * 2**failures
+                self._logger.warning("voice recognition failed, retrying in %.0f s: %s", delay, exc)
+                self._stop.wait(delay)
+                continue
+            if not text and self._listen_pause:
+                # Idle tiers: listen less often while nobody is talking to the assistant.
+                self._stop.wait(self._listen_pause)
+
+    def _phrase_has_wake_word(self, spotter: WakeWordDetector, samples: bytes) -> bool:
+        """Whether a captured phrase should be transcribed: it contains the wake word or follows one."""
+        if monotonic() < self._wake_until:
+            return True
+        step = SAMPLE_RATE * CHUNK_MS // 1000 * 2
+        heard = any(spotter.process(samples[start : start + step]) for start in range(0, len(samples), step))
+        spotter.reset()
+        if not heard:
+            self._logger.debug("phrase without wake word not transcribed")
+            return False
+        self._publish_wake()
+        self._wake_until = monotonic() + self._wake_follow_up
+        return True
+
+    def _apply_wake_word(self, text: str) -> str:
+        """Transcript-level wake word filter: drops text that neither starts with it nor follows it."""
+        if not self._wake_word:
+            return text
+        now = monotonic()
+        if self._wake_pattern.match(text):
+            if now >= self._wake_until:
+                self._publish_wake()
+            self._wake_until = now + self._wake_follow_up
+            return self._strip_wake_word(text)
+        if now < self._wake_until:
+            self._wake_until = now + self._wake_follow_up
+            return text.strip()
+        self._logger.debug("ignored without wake word: %s", text)
+        return ""
+
+    def _strip_wake_word(self, text: str) -> str:
+        text = text.strip()
+        if self._wake_word:
+            return self._wake_pattern.sub("", text, count=1).strip(" ,.")
+        return text
+
+    def _run_streaming(self) -> None:
+        from assistant.input.asr import MicrophoneSource, VoskRecognizer, make_vad
+        from assistant.input.wake_word import VoskKeywordSpotter
+
+        gate: WakeWordGate | None = None
+        source = self._source_factory() if self._source_factory else MicrophoneSource()
+        try:
+            model: Any = self._vosk_model_path
+            if self._recognizer_factory:
+                recognizer = self._recognizer_factory(source.sample_rate)
+            else:
+                if not self._vosk_model_path:
+                    raise ValueError("vosk_model_path is not configured")
+                vosk_recognizer = VoskRecognizer(self._vosk_model_path, sample_rate=source.sample_rate)
+                # The keyword spotter decodes with the same acoustic model instead of loading it again.
+                model, recognizer = vosk_recognizer.model, vosk_recognizer
+            if self._wake_word:
+                if self._wake_detector_factory:
+                    detector = self._wake_detector_factory(source.sample_rate)
+                else:
+                    detector = VoskKeywordSpotter(model, self._wake_word, source.sample_rate)
+                gate = WakeWordGate(detector, follow_up=self._wake_follow_up)
+        except Exception:
+            source.close()
+            raise
+
+        self._pipeline = StreamingVoicePipeline(
+            source,
+            recognizer,
+            on_partial=lambda text, utterance, started: self._publish("voice.partial", text, utterance, started),
+            on_final=lambda text, utterance, started: self._publish("voice.text", text, utterance, started),
+            vad=make_vad(self._vad),
+            gate=gate,
+            on_wake=self._publish_wake,
+            on_speech=(lambda: self._on_activity("voice")) if self._on_activity else None,
+            vad_stride=self._vad_stride,
+        )
+        self._report_ready(True)
+        try:
+            self._pipeline.run(self._stop)
+        finally:
+            source.close()
+
+    def _publish_wake(self) -> None:
+        self._bus.publish(AssistantEvent(event_type="voice.wake", payload={"wake_word": self._wake_word}, source="voice"))
+
+    def _publish(self, event_type: str, text: str, utterance_id: int, speech_started: float) -> None:
+        text = self._strip_wake_word(text)
+        if not text:
+            return
+        event = AssistantEvent(
+            event_type=event_type,
+            payload={"text": text, "utterance_id": utterance_id, "speech_started": speech_started},
+            source="voice",
+            origin=speech_started,
+        )
+        if event_type == "voice.text":
+            tracing.tracer().record(event.trace_id, "recognition", event.ts - speech_started)
+        self._bus.publish(event)
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import json
+from collections import deque
+from typing import Any, Deque, List, Protocol
+
+from assistant.input.asr import SAMPLE_RATE
+
+
+class WakeWordDetector(Protocol):
+    def process(self, chunk: bytes) -> bool:
+        """Feed one short audio frame; return ``True`` when the wake word was heard."""
+        ...
+
+    def reset(self) -> None: ...
+
+
+class VoskKeywordSpotter:
+    """Keyword spotter decoding against a two-entry grammar (wake word or unknown).
+
+    A grammar this small is far cheaper to decode than open-vocabulary ASR, so
+    it can stay on while the full recognizer is idle. ``model`` is the model
+    directory or the ``vosk.Model`` the recognizer already loaded, so the
+    acoustic model is held in memory once.
+    """
+
+    def __init__(self, model: Any, wake_word: str, sample_rate: int = SAMPLE_RATE) -> None:
+        import vosk
+
+        vosk.SetLogLevel(-1)
+        self._wake_word = wake_word.lower()
+        if isinstance(model, str):
+            model = vosk.Model(model)
+        self._recognizer = vosk.KaldiRecognizer(model, sample_rate, json.dumps([self._wake_word, "[unk]"]))
+
+    def process(self, chunk: bytes) -> bool:
+        if self._recognizer.AcceptWaveform(chunk):
+            text = json.loads(self._recognizer.Result()).get("text", "")
+        else:
+            text = json.loads(self._recognizer.PartialResult()).get("partial", "")
+        if self._wake_word in text.split():
+            self._recognizer.Reset()
+            return True
+        return False
+
+    def reset(self) -> None:
+        self._recognizer.Reset()
+
+
+class WakeWordGate:
+    """Keeps the full recognizer closed until the wake word fires.
+
+    While closed, frames go to the detector and into a small rolling buffer.
+    When the detector fires the gate opens for ``follow_up`` seconds, and the
+    buffered audio is handed to the recognizer so speech that runs straight on
+    from the wake word is not clipped. Each utterance heard while open extends
+    the window. Times are in seconds of audio processed.
+    """
+
+    def __init__(self, detector: WakeWordDetector, follow_up: float = 8.0, buffer_chunks: int = 10) -> None:
+        self._detector = detector
+        self._follow_up = follow_up
+        self._buffer: Deque[bytes] = deque(maxlen=buffer_chunks)
+        self._open_until = -1.0
+        self.activations = 0
+        self.frames_checked = 0
+
+    def is_open(self, now: float) -> bool:
+        return now < self._open_until
+
+    def feed(self, chunk: bytes, now: float) -> bool:
+        """Process a frame heard while closed; return ``True`` if it opened the gate."""
+        self._buffer.append(chunk)
+        self.frames_checked += 1
+        if not self._detector.process(chunk):
+            return False
+        self.activations += 1
+        self._open_until = now + self._follow_up
+        return True
+
+    def extend(self, now: float) -> None:
+        self._open_until = max(self._open_until, now + self._follow_up)
+
+    def close(self) -> None:
+        self._open_until = -1.0
+        self._buffer.clear()
+        self._detector.reset()
+
+    def take_buffer(self) -> List[bytes]:
+        chunks = list(self._buffer)
+        self._buffer.clear()
+        return chunks
@@ -10,3 +10,8 @@ def open_school_system() -> None:
 PLUGIN_HOOKS = {
     "open_school_system": open_school_system,
 }
+
+PLUGIN_PHRASES = {
+    "open school system": "open_school_system",
+    "school portal": "open_school_system",
+}
@@ -0,0 +1,250 @@
+"""Feed a recorded session back through the assistant without devices.
+
+Recorded audio drives the real ``VoiceInputService`` streaming path (VAD,
+utterance segmentation, partials) with a recognizer that replays the
+recorded transcripts; recorded landmarks drive ``GestureInputService``'s
+classifier and debouncer. Everything downstream — event bus, parser, router,
+tracing — is the production ``ServiceManager``; only the actions and speech
+output are stubbed.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from threading import Lock, Thread
+from time import perf_counter, sleep
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from assistant.core.config import AssistantConfig
+from assistant.feedback.feedback import FeedbackManager
+from assistant.input.asr import SAMPLE_RATE
+from assistant.input.gesture_debounce import GestureDebouncer
+from assistant.replay.recording import RecordKind, read_recording
+
+
+class Pacer:
+    """Maps recorded time to wall-clock time at ``speed`` × real time."""
+
+    def __init__(self, speed: float = 1.0) -> None:
+        if speed <= 0:
+            raise ValueError("speed must be positive")
+        self.speed = speed
+        self.origin = perf_counter()
+
+    def wait_until(self, t: float) -> float:
+        target = self.origin + t / self.speed
+        delay = target - perf_counter()
+        if delay > 0:
+            sleep(delay)
+        return target
+
+
+class ReplayAudioSource:
+    """``AudioSource`` serving recorded chunks on the pacer's clock."""
+
+    def __init__(self, chunks: List[Tuple[float, bytes]], sample_rate: int, pacer: Pacer) -> None:
+        self.sample_rate = sample_rate
+        self._chunks = iter(chunks)
+        self._pacer = pacer
+        self._buffer = bytearray()
+
+    def read(self, frames: int) -> bytes:
+        wanted = frames * 2
+        while len(self._buffer) < wanted:
+            item = next(self._chunks, None)
+            if item is None:
+                break
+            t, chunk = item
+            self._pacer.wait_until(t)
+            self._buffer += chunk
+        data = bytes(self._buffer[:wanted])
+        del self._buffer[:wanted]
+        return data
+
+    def close(self) -> None:
+        pass
+
+
+class TranscriptRecognizer:
+    """Streaming recognizer that replays recorded final transcripts, one word per few chunks."""
+
+    def __init__(self, transcripts: List[str], chunks_per_word: int = 3) -> None:
+        self._transcripts = list(transcripts)
+        self._chunks_per_word = chunks_per_word
+        self._words: List[str] = []
+        self._chunks = 0
+
+    def start_utterance(self) -> None:
+        self._words = self._transcripts.pop(0).split() if self._transcripts else []
+        self._chunks = 0
+
+    def accept(self, chunk: bytes) -> Optional[str]:
+        self._chunks += 1
+        count = self._chunks // self._chunks_per_word
+        if self._chunks % self._chunks_per_word or count > len(self._words):
+            return None
+        return " ".join(self._words[:count])
+
+    def finish(self) -> str:
+        return " ".join(self._words)
+
+
+class _SilentSpeech:
+    def say(self, text: str) -> None:
+        pass
+
+    def runAndWait(self) -> None:  # noqa: N802
+        pass
+
+    def stop(self) -> None:
+        pass
+
+    def setProperty(self, name: str, value: Any) -> None:  # noqa: N802
+        pass
+
+
+@dataclass(slots=True)
+class Session:
+    sample_rate: int = SAMPLE_RATE
+    audio: List[Tuple[float, bytes]] = field(default_factory=list)
+    landmarks: List[Tuple[float, Optional[List[Tuple[float, float, float]]]]] = field(default_factory=list)
+    transcripts: List[str] = field(default_factory=list)
+    duration: float = 0.0
+
+    @classmethod
+    def load(cls, path: str | Path) -> "Session":
+        session = cls()
+        for record in read_recording(path):
+            session.duration = max(session.duration, record.t)
+            if record.kind is RecordKind.AUDIO:
+                session.audio.append((record.t, record.body))
+            elif record.kind is RecordKind.LANDMARKS:
+                session.landmarks.append((record.t, record.landmarks()))
+            elif record.kind is RecordKind.META:
+                session.sample_rate = int(record.json().get("sample_rate", session.sample_rate))
+            elif record.kind is RecordKind.EVENT:
+                event = record.json()
+                if event.get("event_type") == "voice.text":
+                    session.transcripts.append(str(event["payload"].get("text", "")))
+        return session
+
+
+@dataclass(slots=True)
+class ReplayReport:
+    recorded_seconds: float
+    wall_seconds: float
+    published: int
+    handled: int
+    dropped: int
+    coalesced: int
+    intents: List[str]
+    stages: Dict[str, Dict[str, float]]
+
+    @property
+    def throughput(self) -> float:
+        """Events handled per wall-clock second."""
+        return self.handled / self.wall_seconds if self.wall_seconds else 0.0
+
+    @property
+    def speedup(self) -> float:
+        return self.recorded_seconds / self.wall_seconds if self.wall_seconds else 0.0
+
+
+class ReplayDriver:
+    """Replays one recording through a headless ``ServiceManager`` at ``speed`` × real time.
+
+    Gesture dwell and cooldown times are divided by ``speed`` so debouncing
+    behaves as it did live; latencies are measured on the wall clock.
+    """
+
+    def __init__(self, path: str | Path, speed: float = 1.0, config: AssistantConfig | None = None) -> None:
+        self.session = Session.load(path)
+        self.speed = speed
+        self.config = replace(
+            config or AssistantConfig(),
+            hot_reload=False,
+            wake_word="",
+            launcher_helper=False,
+            metrics_port=None,
+            trace_jsonl=None,
+            record_path=None,
+        )
+        self._logger = logging.getLogger(self.__class__.__name__)
+
+    def run(self, timeout: float = 120.0) -> ReplayReport:
+        from assistant.core.service_manager import ServiceManager
+
+        config = self.config
+        pacer = Pacer(self.speed)
+        # The replay sources go in through the manager's factories, so the services it builds, supervises
+        # and tiers are the ones being replayed.
+        manager = ServiceManager(
+            config,
+            feedback=FeedbackManager(engine=_SilentSpeech(), desktop_notifications=False),
+            audio_source_factory=lambda: ReplayAudioSource(self.session.audio, self.session.sample_rate, pacer),
+            recognizer_factory=lambda _: TranscriptRecognizer(self.session.transcripts),
+            debouncer_factory=lambda: GestureDebouncer(
+                min_dwell=config.gesture_min_dwell / self.speed,
+                cooldown=config.gesture_cooldown / self.speed,
+                release_after=0.15 / self.speed,
+                hold_interval=config.gesture_hold_interval / self.speed if config.gesture_hold_interval else None,
+            ),
+        )
+        manager.configure()
+        intents: List[str] = []
+        lock = Lock()
+
+        def stub(intent: Any) -> None:
+            with lock:
+                intents.append(intent.name)
+
+        manager.router.swap((), {name: stub for name in manager.router.names()})
+
+        started = perf_counter()
+        manager.bus.start()
+        gesture_thread: Thread | None = None
+        if self.session.landmarks:
+            gesture_thread = Thread(
+                target=manager.gesture.run_landmarks, args=(self._paced_frames(pacer),), name="replay-gesture", daemon=True
+            )
+            gesture_thread.start()
+        if self.session.audio:
+            manager.voice.start()
+
+        deadline = started + timeout
+        if not manager.voice.wait(timeout):
+            self._logger.warning("voice replay did not finish within %.0f s", timeout)
+        if gesture_thread:
+            gesture_thread.join(max(deadline - perf_counter(), 0))
+        self._drain(manager, deadline)
+        wall = perf_counter() - started
+
+        stats = manager.bus.stats().values()
+        report = ReplayReport(
+            recorded_seconds=self.session.duration,
+            wall_seconds=wall,
+            published=sum(lane.published for lane in stats),
+            handled=sum(lane.handled for lane in stats),
+            dropped=sum(lane.dropped for lane in stats),
+            coalesced=sum(lane.coalesced for lane in stats),
+            intents=list(intents),
+            stages=manager.tracer.summary(),
+        )
+        manager.stop()
+        return report
+
+    def _paced_frames(self, pacer: Pacer) -> Iterator[Tuple[float, Any]]:
+        for t, points in self.session.landmarks:
+            yield pacer.wait_until(t), points
+
+    @staticmethod
+    def _drain(manager: Any, deadline: float) -> None:
+        """Wait until every published event was handled, dropped or coalesced."""
+        while perf_counter() < deadline:
+            stats = manager.bus.stats().values()
+            settled = sum(lane.handled + lane.dropped + lane.coalesced for lane in stats)
+            if settled >= sum(lane.published for lane in stats):
+                return
+            sleep(0.01)
@@ -0,0 +1,148 @@
+"""Compact binary recordings of an assistant session.
+
+A recording is a header followed by length-prefixed records::
+
+    b"MDRC" version:u8
+    kind:u8 t:f64 length:u32 body[length]   (repeated)
+
+``t`` is seconds since the recording started. Bodies are:
+
+* ``META`` / ``EVENT``: compact UTF-8 JSON,
+* ``AUDIO``: raw mono 16-bit PCM as read from the microphone,
+* ``LANDMARKS``: 21 × 3 little-endian float32 (252 bytes) for one hand, or
+  empty when no hand was visible.
+
+An hour of 16 kHz audio is about 115 MB; a landmark frame costs 265 bytes.
+"""
+
+from __future__ import annotations
+
+import json
+import struct
+from array import array
+from dataclasses import dataclass
+from enum import IntEnum
+from pathlib import Path
+from threading import Lock
+from time import perf_counter
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from assistant.core.events import AssistantEvent
+
+MAGIC = b"MDRC"
+VERSION = 1
+_HEADER = struct.Struct("<BdI")
+
+Landmarks = Sequence[Tuple[float, float, float]]
+
+
+class RecordKind(IntEnum):
+    META = 0
+    EVENT = 1
+    AUDIO = 2
+    LANDMARKS = 3
+
+
+@dataclass(slots=True, frozen=True)
+class Record:
+    kind: RecordKind
+    t: float
+    body: bytes
+
+    def json(self) -> Dict[str, Any]:
+        return json.loads(self.body.decode("utf-8"))
+
+    def landmarks(self) -> Optional[List[Tuple[float, float, float]]]:
+        if not self.body:
+            return None
+        values = array("f")
+        values.frombytes(self.body)
+        return [(values[i], values[i + 1], values[i + 2]) for i in range(0, len(values), 3)]
+
+
+def encode_landmarks(points: Optional[Landmarks]) -> bytes:
+    if points is None:
+        return b""
+    return array("f", [float(value) for point in points for value in point[:3]]).tobytes()
+
+
+class Recorder:
+    """Thread-safe writer; capture threads, the event bus and the audio source may all call it.
+
+    ``at`` arguments are ``perf_counter`` timestamps (default: now).
+    """
+
+    def __init__(self, path: str | Path, **meta: Any) -> None:
+        self.path = Path(path)
+        self._file: BinaryIO | None = open(self.path, "wb")
+        self._file.write(MAGIC + bytes([VERSION]))
+        self._lock = Lock()
+        self.started = perf_counter()
+        self.records = 0
+        if meta:
+            self.meta(**meta)
+
+    def meta(self, **values: Any) -> None:
+        self._write(RecordKind.META, json.dumps(values, separators=(",", ":")).encode("utf-8"))
+
+    def event(self, event: AssistantEvent, at: float | None = None) -> None:
+        body = {"event_type": event.event_type, "payload": event.payload, "source": event.source}
+        self._write(RecordKind.EVENT, json.dumps(body, separators=(",", ":"), default=str).encode("utf-8"), at)
+
+    def audio(self, chunk: bytes, at: float | None = None) -> None:
+        if chunk:
+            self._write(RecordKind.AUDIO, chunk, at)
+
+    def landmarks(self, points: Optional[Landmarks], at: float | None = None) -> None:
+        self._write(RecordKind.LANDMARKS, encode_landmarks(points), at)
+
+    def _write(self, kind: RecordKind, body: bytes, at: float | None = None) -> None:
+        t = (at if at is not None else perf_counter()) - self.started
+        with self._lock:
+            if self._file is None:
+                return
+            self._file.write(_HEADER.pack(kind, t, len(body)))
+            self._file.write(body)
+            self.records += 1
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+class RecordingAudioSource:
+    """Wraps an ``AudioSource`` and records every chunk it returns."""
+
+    def __init__(self, source: Any, recorder: Recorder) -> None:
+        self._source = source
+        self._recorder = recorder
+        self.sample_rate = source.sample_rate
+        recorder.meta(sample_rate=source.sample_rate)
+
+    def read(self, frames: int) -> bytes:
+        chunk = self._source.read(frames)
+        self._recorder.audio(chunk)
+        return chunk
+
+    def close(self) -> None:
+        self._source.close()
+
+
+def read_recording(path: str | Path) -> Iterator[Record]:
+    with open(path, "rb") as file:
+        if file.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path} is not an assistant recording")
+        version = file.read(1)
+        if not version or version[0] != VERSION:
+            raise ValueError(f"{path}: unsupported recording version")
+        while True:
+            header = file.read(_HEADER.size)
+            if len(header) < _HEADER.size:
+                return
+            kind, t, length = _HEADER.unpack(header)
+            body = file.read(length)
+            if len(body) < length:
+                return  # truncated tail from an interrupted session
+            yield Record(RecordKind(kind), t, body)
@@ -0,0 +1,81 @@
+"""Generated sessions for headless replay tests and benchmarks."""
+
+from __future__ import annotations
+
+import math
+from array import array
+from pathlib import Path
+from typing import List, Sequence, Tuple
+
+from assistant.core.events import AssistantEvent
+from assistant.input.asr import CHUNK_MS, SAMPLE_RATE
+from assistant.replay.recording import Recorder
+
+POSES = {
+    "open_palm": (True, True, True, True, True),
+    "fist": (False, False, False, False, False),
+    "point": (False, True, False, False, False),
+}
+FPS = 30
+
+
+def hand(extended: Tuple[bool, ...], x_shift: float = 0.0) -> List[Tuple[float, float, float]]:
+    """Upright hand whose extended fingers have tips above their middle joints, moved right by ``x_shift``."""
+    points = [(0.0, 0.0, 0.0)] * 21
+    points[0] = (0.5 + x_shift, 0.9, 0.0)
+    for finger, (base, up) in enumerate(zip([1, 5, 9, 13, 17], extended)):
+        x = 0.3 + 0.1 * finger + x_shift
+        for joint in range(4):
+            y = 0.7 - 0.05 * joint if up or joint < 2 else 0.6 + 0.05 * joint
+            points[base + joint] = (x, y, 0.0)
+    # The thumb is judged on x.
+    points[4] = (points[3][0] + (0.05 if extended[0] else -0.05), points[4][1], 0.0)
+    return points
+
+
+def _tone(seconds: float, amplitude: float) -> List[bytes]:
+    frames = SAMPLE_RATE * CHUNK_MS // 1000
+    chunks = []
+    for start in range(0, int(seconds * SAMPLE_RATE), frames):
+        samples = array(
+            "h", (int(amplitude * math.sin(2 * math.pi * 440 * n / SAMPLE_RATE)) for n in range(start, start + frames))
+        )
+        chunks.append(samples.tobytes())
+    return chunks
+
+
+def write_synthetic_session(
+    path: str | Path,
+    commands: Sequence[str] = (),
+    gestures: Sequence[str] = (),
+    speech_seconds: float = 0.6,
+    pose_seconds: float = 0.6,
+) -> Path:
+    """Record ``commands`` as tone bursts (with their transcripts) and ``gestures`` as held poses.
+
+    Voice and gesture tracks share one timeline, so they overlap like a real session.
+    """
+    recorder = Recorder(path, sample_rate=SAMPLE_RATE, synthetic=True)
+    chunk_s = CHUNK_MS / 1000
+    t = 0.0
+    for text in commands:
+        for segment, amplitude in ((0.3, 0), (speech_seconds, 8000), (0.8, 0)):
+            for chunk in _tone(segment, amplitude):
+                recorder.audio(chunk, at=recorder.started + t)
+                t += chunk_s
+        event = AssistantEvent("voice.text", {"text": text}, "voice")
+        recorder.event(event, at=recorder.started + t)
+    audio_end = t
+
+    t = 0.0
+    for gesture in gestures:
+        for points, seconds in ((None, 0.4), (hand(POSES[gesture]), pose_seconds), (None, 0.4)):
+            for _ in range(int(seconds * FPS)):
+                recorder.landmarks(points, at=recorder.started + t)
+                t += 1 / FPS
+    # Keep the silence flowing until both tracks have ended.
+    while audio_end < t:
+        recorder.audio(_tone(chunk_s, 0)[0], at=recorder.started + audio_end)
+        audio_end += chunk_s
+    recorder.close()
+    return Path(path)
@@ -1,32 +1,140 @@
 from __future__ import annotations
 
+import logging
 import threading
-import tkinter as tk
+from threading import Lock
+from typing import Any, Dict, Iterable, Optional
+
+from assistant.core.events import AssistantEvent, EventBus
+
+FIELDS = ("status", "heard", "intent", "confidence", "latency", "queue_depth")
+
+
+class StatusQueue:
+    """Coalescing update queue holding only the latest value per field.
+
+    It can never hold more than one entry per field, so producers never block
+    and a burst of updates costs one redraw.
+    """
+
+    def __init__(self, fields: Iterable[str] = FIELDS) -> None:
+        self._fields = frozenset(fields)
+        self._pending: Dict[str, Any] = {}
+        self._lock = Lock()
+        self.coalesced = 0
+
+    def put(self, field: str, value: Any) -> None:
+        if field not in self._fields:
+            raise KeyError(f"Unknown overlay field: {field}")
+        with self._lock:
+            if field in self._pending:
+                self.coalesced += 1
+            self._pending[field] = value
+
+    def drain(self) -> Dict[str, Any]:
+        """Every field updated since the last drain, with its latest value."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        return pending
 
 
 class Overlay:
-    """Small optional always-on-top status overlay."""
+    """Small optional always-on-top status overlay.
 
-    def __init__(self) -> None:
-        self._root = None
-        self._label = None
-        self._thread = None
+    Any thread may call ``set_status`` or publish events; subscribed to the
+    bus wildcard, ``on_event`` only records the latest intent, confidence,
+    transcript and action latency in a ``StatusQueue``. The Tk thread drains
+    the queue with ``after()`` at ``fps`` and redraws only when something
+    changed, reading the bus queue depth at the same time. With ``headless``
+    no window is created and ``render`` can be called directly.
+    """
+
+    def __init__(self, bus: EventBus | None = None, fps: float = 10.0, headless: bool = False) -> None:
+        self._bus = bus
+        self._interval_ms = max(1, int(1000 / fps))
+        self.headless = headless
+        self.updates = StatusQueue()
+        self.state: Dict[str, Any] = {"status": "Assistant Ready"}
+        self._root: Any = None
+        self._label: Any = None
+        self._thread: threading.Thread | None = None
+        self._closing = threading.Event()
+        self._logger = logging.getLogger(self.__class__.__name__)
 
     def start(self) -> None:
-        if self._thread and self._thread.is_alive():
+        if self.headless or (self._thread and self._thread.is_alive()):
             return
-        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._closing.clear()
+        self._thread = threading.Thread(target=self._run, name="overlay", daemon=True)
         self._thread.start()
 
+    def stop(self) -> None:
+        self._closing.set()
+        if self._thread:
+            self._thread.join(timeout=1)
+
+    def set_status(self, text: str) -> None:
+        self.updates.put("status", text)
+
+    def on_event(self, event: AssistantEvent) -> None:
+        payload = event.payload
+        kind = event.event_type
+        if kind in ("voice.text", "voice.partial"):
+            self.updates.put("heard", payload.get("text"))
+        elif kind == "gesture.detected":
+            self.updates.put("heard", f"gesture {payload.get('gesture')}")
+        elif kind == "command.dispatched":
+            self.updates.put("intent", payload.get("intent"))
+            self.updates.put("confidence", payload.get("confidence"))
+        elif kind == "command.completed":
+            self.updates.put("latency", payload.get("latency"))
+        elif kind == "power.tier":
+            self.updates.put("status", f"Assistant {payload.get('tier')}")
+
+    def render(self) -> Dict[str, Any]:
+        """Apply pending updates to ``state``; returns the fields that changed."""
+        changes = self.updates.drain()
+        if self._bus is not None:
+            changes["queue_depth"] = self._bus.queue_depth()
+        changes = {field: value for field, value in changes.items() if self.state.get(field) != value}
+        self.state.update(changes)
+        return changes
+
+    def text(self) -> str:
+        state = self.state
+        lines = [str(state.get("status", ""))]
+        if state.get("heard"):
+            lines.append(f"heard: {state['heard']}")
+        if state.get("intent"):
+            confidence = state.get("confidence")
+            lines.append(f"intent: {state['intent']}" + (f" ({confidence:.0%})" if confidence is not None else ""))
+        latency: Optional[float] = state.get("latency")
+        details = [f"queue {state.get('queue_depth', 0)}"]
+        if latency is not None:
+            details.append(f"last action {latency * 1000:.0f} ms")
+        lines.append(", ".join(details))
+        return "\n".join(lines)
+
     def _run(self) -> None:
-        self._root = tk.Tk()
+        try:
+            import tkinter as tk
+
+            self._root = tk.Tk()
+        except Exception as exc:  # noqa: BLE001
+            self._logger.warning("Overlay unavailable: %s", exc)
+            return
         self._root.title("Assistant")
-        self._root.geometry("240x70+30+30")
+        self._root.geometry("280x100+30+30")
         self._root.attributes("-topmost", True)
-        self._label = tk.Label(self._root, text="Assistant Ready", font=("Arial", 12))
+        self._label = tk.Label(self._root, text=self.text(), font=("Arial", 11), justify=tk.LEFT)
         self._label.pack(fill=tk.BOTH, expand=True)
+        self._root.after(self._interval_ms, self._tick)
         self._root.mainloop()
 
-    def set_status(self, text: str) -> None:
-        if self._label:
-            self._label.config(text=text)
+    def _tick(self) -> None:
+        if self._closing.is_set():
+            self._root.destroy()
+            return
+        if self.render():
+            self._label.config(text=self.text())
+        self._root.after(self._interval_ms, self._tick)
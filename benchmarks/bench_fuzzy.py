@@ -0,0 +1,85 @@
+"""Accuracy and latency of the fuzzy fallback on misrecognized commands.
+
+Run from the repository root: ``python -m benchmarks.bench_fuzzy``.
+"""
+
+from __future__ import annotations
+
+from time import perf_counter
+from typing import List, Optional, Tuple
+
+from assistant.commands.parser import RuleBasedCommandParser
+
+# (what the recognizer heard, the intent the user meant; None for unrelated speech)
+CORPUS: List[Tuple[str, Optional[str]]] = [
+    ("open browsers", "open_browser"),
+    ("open brouser", "open_browser"),
+    ("opun browser", "open_browser"),
+    ("lanch browser", "open_browser"),
+    ("launch the browser", None),
+    ("play musik", "play_music"),
+    ("play musics", "play_music"),
+    ("plays music", "play_music"),
+    ("start musik please", "play_music"),
+    ("swich window", "switch_window"),
+    ("switch windoe", "switch_window"),
+    ("which window", "switch_window"),
+    ("next windo", "switch_window"),
+    ("open fial /tmp/notes.txt", "open_file"),
+    ("opn file report.pdf", "open_file"),
+    ("type tex hello world", "type_text"),
+    ("tipe text good morning", "type_text"),
+    ("power of", "shutdown_pc"),
+    ("shutdown pee see", None),
+    ("what is the weather", None),
+    ("hello there", None),
+    ("open the door", None),
+    ("play", None),
+    ("window", None),
+]
+
+
+def evaluate(parser: RuleBasedCommandParser) -> Tuple[int, int, int]:
+    correct = wrong = missed = 0
+    for heard, meant in CORPUS:
+        intent = parser.parse(heard)
+        name = intent.name if intent else None
+        if name == meant:
+            correct += 1
+        elif name is None:
+            missed += 1
+        else:
+            wrong += 1
+    return correct, wrong, missed
+
+
+def latency(parser: RuleBasedCommandParser, rounds: int) -> List[float]:
+    samples: List[float] = []
+    for _ in range(rounds):
+        for heard, _ in CORPUS:
+            started = perf_counter()
+            parser.suggest(heard)
+            samples.append(perf_counter() - started)
+    return sorted(samples)
+
+
+def main() -> None:
+    print(f"{'threshold':>9} {'correct':>8} {'wrong':>6} {'missed':>7}")
+    for threshold in (None, 0.7, 0.8, 0.9):
+        correct, wrong, missed = evaluate(RuleBasedCommandParser(fuzzy_threshold=threshold))
+        print(f"{str(threshold):>9} {correct:>8} {wrong:>6} {missed:>7}")
+
+    print(f"\n{'phrases':>8} {'p50 us':>8} {'p99 us':>8}")
+    for extra in (0, 100, 1000, 5000):
+        parser = RuleBasedCommandParser(fuzzy_threshold=0.8)
+        parser.add_phrases({f"custom command {n} zz": f"custom_{n}" for n in range(extra)})
+        parser.add_phrases({f"{word} lights": f"lights_{word}" for word in ("kitchen", "bedroom", "hallway")})
+        parser.compile()
+        samples = latency(parser, rounds=20)
+        p50 = samples[len(samples) // 2]
+        p99 = samples[int(len(samples) * 0.99)]
+        print(f"{len(parser.compile()) :>8} {p50 * 1e6:>8.1f} {p99 * 1e6:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Cost of recording commands in the history log, and of querying it.
+
+Run from the repository root: ``python -m benchmarks.bench_history``.
+
+``record`` is what dispatch pays per command; the writer thread's ``flush``
+and the queries run off the hot path.
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+from time import perf_counter
+from typing import List, Optional
+
+from assistant.core.history import HistoryEntry, HistoryLog, Outcome
+
+INTENTS = ("open_browser", "play_music", "switch_window", "type_text", "open_file")
+
+
+def entry(n: int) -> HistoryEntry:
+    intent = INTENTS[n % len(INTENTS)]
+    argument = f"note {n}" if intent in ("type_text", "open_file") else None
+    outcome = Outcome.FAILED if n % 50 == 0 else Outcome.OK
+    return HistoryEntry(1.7e9 + n, "voice" if n % 2 else "gesture", intent, argument, outcome, 1e-4, 0.05, 0.3)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--commands", type=int, default=100_000)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as directory:
+        log = HistoryLog(directory, max_pending=args.commands)
+        entries = [entry(n) for n in range(args.commands)]
+        samples: List[float] = []
+        for item in entries:
+            started = perf_counter()
+            log.record(item)
+            samples.append(perf_counter() - started)
+        samples.sort()
+        p50, p99 = samples[len(samples) // 2], samples[int(len(samples) * 0.99)]
+        print(f"record: p50 {p50 * 1e9:.0f} ns, p99 {p99 * 1e9:.0f} ns")
+
+        started = perf_counter()
+        log.flush()
+        elapsed = perf_counter() - started
+        print(f"flush:  {args.commands / elapsed:,.0f} records/s")
+
+        size = sum(path.stat().st_size for path in log.directory.iterdir())
+        print(f"disk:   {size / 1024:,.0f} KiB in {len(log.segments())} segments")
+
+        for name, query in (
+            ("last", lambda: log.last(source="gesture")),
+            ("usage", log.usage),
+            ("ranking", log.ranking),
+        ):
+            started = perf_counter()
+            query()
+            print(f"{name + ':':<7} {(perf_counter() - started) * 1000:.1f} ms")
+        log.close()
+
+
+if __name__ == "__main__":
+    main()
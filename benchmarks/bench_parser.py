@@ -0,0 +1,82 @@
+"""Compare the compiled phrase automaton with the original linear parser chain.
+
+Run from the repository root: ``python -m benchmarks.bench_parser``.
+"""
+
+from __future__ import annotations
+
+from time import perf_counter
+from typing import List, Optional, Tuple
+
+from assistant.commands.matcher import PhraseRule
+from assistant.commands.parser import BUILTIN_PHRASES, CommandIntent, RuleBasedCommandParser
+
+UTTERANCES = [
+    "open browser",
+    "please open file /home/user/notes.txt",
+    "open file /home/user/notes.txt",
+    "type text hello world",
+    "switch window",
+    "could you play music for me",
+    "something the assistant does not know about",
+]
+
+
+class LinearCommandParser:
+    """The original ``any(p in normalized ...)`` chain, extended with extra phrase groups."""
+
+    def __init__(self, extra: List[Tuple[str, str]]) -> None:
+        self._extra = extra
+
+    def parse(self, text: str) -> Optional[CommandIntent]:
+        normalized = text.strip().lower()
+        if any(p in normalized for p in ["open browser", "launch browser"]):
+            return CommandIntent(name="open_browser")
+        if normalized.startswith("open file"):
+            return CommandIntent(name="open_file", argument=normalized.removeprefix("open file").strip())
+        if any(p in normalized for p in ["shutdown pc", "shutdown computer", "power off"]):
+            return CommandIntent(name="shutdown_pc")
+        if any(p in normalized for p in ["play music", "start music"]):
+            return CommandIntent(name="play_music")
+        if any(p in normalized for p in ["switch window", "next window"]):
+            return CommandIntent(name="switch_window")
+        if normalized.startswith("type text"):
+            return CommandIntent(name="type_text", argument=normalized.removeprefix("type text").strip())
+        for phrase, intent in self._extra:
+            if phrase in normalized:
+                return CommandIntent(name=intent)
+        return None
+
+
+def synthetic_phrases(count: int) -> List[Tuple[str, str]]:
+    return [(f"custom command number {n} zz", f"custom_{n}") for n in range(count)]
+
+
+def time_parser(parser: object, rounds: int) -> float:
+    parse = parser.parse  # type: ignore[attr-defined]
+    started = perf_counter()
+    for _ in range(rounds):
+        for text in UTTERANCES:
+            parse(text)
+    return (perf_counter() - started) / (rounds * len(UTTERANCES))
+
+
+def main() -> None:
+    print(f"{'phrases':>8} {'linear us':>10} {'automaton us':>13} {'speedup':>8}")
+    for count in (0, 100, 1000, 5000):
+        extra = synthetic_phrases(count)
+        linear = LinearCommandParser(extra)
+        compiled = RuleBasedCommandParser(BUILTIN_PHRASES)
+        compiled.add_phrases([PhraseRule(phrase, intent) for phrase, intent in extra])
+        compiled.compile()
+        rounds = max(20, 20000 // (count + 10))
+        linear_cost = time_parser(linear, rounds)
+        compiled_cost = time_parser(compiled, rounds)
+        print(
+            f"{len(BUILTIN_PHRASES) + count:>8} {linear_cost * 1e6:>10.2f} {compiled_cost * 1e6:>13.2f} "
+            f"{linear_cost / compiled_cost:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Startup cost of eager plugin imports versus the lazy manifest loader.
+
+Run from the repository root: ``python -m benchmarks.bench_plugins [--plugins 100]``.
+Each synthetic plugin does some import-time work to stand in for a plugin
+that pulls in a heavy library.
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+from pathlib import Path
+from time import perf_counter
+
+from assistant.automation.engine import AutomationEngine
+
+PLUGIN = """
+import decimal
+import json
+
+_TABLE = [decimal.Decimal(i).sqrt() for i in range({work})]
+
+
+def hook_{index}():
+    return json.dumps(str(_TABLE[-1]))
+
+
+PLUGIN_HOOKS = {{"hook_{index}": hook_{index}}}
+PLUGIN_PHRASES = {{"run plugin {index}": "hook_{index}"}}
+"""
+
+
+def write_plugins(root: Path, count: int, work: int) -> None:
+    for index in range(count):
+        (root / f"plugin_{index:03d}.py").write_text(PLUGIN.format(index=index, work=work), encoding="utf-8")
+
+
+def time_load(plugin_dir: Path, lazy: bool) -> float:
+    engine = AutomationEngine()
+    started = perf_counter()
+    hooks = engine.load_plugins(str(plugin_dir), lazy=lazy)
+    elapsed = perf_counter() - started
+    assert len(hooks) == len(list(plugin_dir.glob("plugin_*.py")))
+    engine.shutdown()
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--plugins", type=int, default=100)
+    parser.add_argument("--work", type=int, default=2000, help="import-time work per plugin")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        root = Path(directory)
+        write_plugins(root, args.plugins, args.work)
+        eager = time_load(root, lazy=False)
+        cold = time_load(root, lazy=True)
+        warm = time_load(root, lazy=True)
+
+    print(f"{args.plugins} plugins")
+    print(f"  eager import      {eager * 1000:8.1f} ms")
+    print(f"  lazy, cold cache  {cold * 1000:8.1f} ms  ({eager / cold:5.1f}x)")
+    print(f"  lazy, warm cache  {warm * 1000:8.1f} ms  ({eager / warm:5.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
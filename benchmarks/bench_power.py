@@ -0,0 +1,89 @@
+"""CPU use of the gesture capture/inference path in each power tier.
+
+Run from the repository root: ``python -m benchmarks.bench_power``.
+
+MediaPipe is replaced by a NumPy stand-in whose cost grows with the number
+of pixels (about 10 ms on a full 640x480 frame here), so the numbers show
+how much each tier's rates, downscale and motion gating save, not the
+absolute cost on a given laptop. The governor logs the real per-tier CPU
+share when the assistant stops.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from threading import Event, Thread
+from typing import Any, Optional
+
+import numpy as np
+
+from assistant.core.power import DEFAULT_PROFILES, PowerTier, TierProfile
+from assistant.input.capture import GesturePipeline, InferenceScheduler, Roi, SyntheticFrameSource
+from assistant.input.motion import MotionDetector
+
+WIDTH, HEIGHT = 640, 480
+CAMERA_FPS = 30.0
+CONFIGURED_BUDGET = 30.0
+
+
+def frames() -> Any:
+    rng = np.random.default_rng(0)
+    scene = rng.integers(0, 200, size=(HEIGHT, WIDTH, 3), dtype=np.uint8)
+    noise = [rng.integers(0, 6, size=scene.shape, dtype=np.uint8) for _ in range(8)]
+    n = 0
+    while True:
+        yield scene + noise[n % len(noise)]
+        n += 1
+
+
+def stand_in(image: Any, scale: float) -> None:
+    """Roughly MediaPipe-shaped work: cost proportional to the pixels looked at."""
+    step = max(1, round(1 / scale))
+    small = image[::step, ::step].astype(np.float32)
+    for _ in range(6):
+        small = (small[:-1, :-1] + small[1:, :-1] + small[:-1, 1:] + small[1:, 1:]) * 0.25
+
+
+def measure(profile: TierProfile, seconds: float) -> tuple[float, int]:
+    motion = MotionDetector()
+
+    def infer(image: Any, roi: Roi) -> Any:
+        if profile.motion_only:
+            motion.update(image)
+            return None
+        return stand_in(image, profile.downscale)
+
+    pipeline = GesturePipeline(
+        SyntheticFrameSource(frames(), fps=CAMERA_FPS),
+        infer,
+        lambda result, frame, roi: None,
+        allocate=np.empty_like,
+    )
+    pipeline.set_capture_fps(profile.capture_fps)
+    budget = CONFIGURED_BUDGET if profile.gesture_fps is None else min(CONFIGURED_BUDGET, profile.gesture_fps)
+    scheduler = InferenceScheduler([pipeline], budget)
+    stop = Event()
+    worker = Thread(target=scheduler.run, args=(stop,), daemon=True)
+    cpu_started, started = time.process_time(), time.perf_counter()
+    worker.start()
+    time.sleep(seconds)
+    stop.set()
+    worker.join()
+    wall = time.perf_counter() - started
+    return 100.0 * (time.process_time() - cpu_started) / wall, pipeline.stats().processed
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=5.0, help="measurement time per tier")
+    args = parser.parse_args(argv)
+
+    print(f"{'tier':>7} {'cpu %':>7} {'inferences/s':>13}")
+    for tier in PowerTier:
+        cpu, processed = measure(DEFAULT_PROFILES[tier], args.seconds)
+        print(f"{tier.value:>7} {cpu:>7.1f} {processed / args.seconds:>13.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Replay a recorded (or generated) session through the assistant and print latency and drop counts.
+
+Record a session by setting ``"record_path"`` in ``config.json`` (streaming voice
+backend for audio), then run from the repository root::
+
+    python -m benchmarks.bench_replay session.mdrc --speed 1
+    python -m benchmarks.bench_replay --synthetic --speed 8
+
+Recognition and end-to-end latency are only comparable with live numbers at ``--speed 1``.
+For the CI suite run ``python -m pytest benchmarks``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+from pathlib import Path
+
+from assistant.core.config import AssistantConfig
+from assistant.replay.driver import ReplayDriver
+from assistant.replay.synthetic import write_synthetic_session
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("recording", nargs="?", type=Path)
+    parser.add_argument("--synthetic", action="store_true", help="generate a session instead of reading one")
+    parser.add_argument("--speed", type=float, default=1.0)
+    parser.add_argument("--config", type=Path, default=Path("config.json"))
+    args = parser.parse_args()
+    if not args.recording and not args.synthetic:
+        parser.error("give a recording or --synthetic")
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = args.recording
+        if args.synthetic:
+            path = write_synthetic_session(
+                Path(directory) / "synthetic.mdrc",
+                commands=["open browser", "play music", "switch window", "type text hello"],
+                gestures=["open_palm", "fist", "point"],
+            )
+        report = ReplayDriver(path, speed=args.speed, config=AssistantConfig.load(args.config)).run()
+
+    print(f"recorded {report.recorded_seconds:.1f}s replayed in {report.wall_seconds:.2f}s ({report.speedup:.1f}x)")
+    print(f"events: published={report.published} handled={report.handled} dropped={report.dropped} coalesced={report.coalesced}")
+    print(f"throughput: {report.throughput:.1f} events/s")
+    print(f"intents: {', '.join(report.intents) or 'none'}")
+    for stage, summary in sorted(report.stages.items()):
+        print(
+            f"  {stage:<28} n={summary['count']:<5.0f} p50={summary['p50'] * 1000:8.2f}ms "
+            f"p95={summary['p95'] * 1000:8.2f}ms p99={summary['p99'] * 1000:8.2f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Wake-word harness: false-accept rate and CPU cost per hour of recorded audio.
+
+Run from the repository root with a Vosk model and two folders of mono 16-bit
+WAV fixtures, one where the wake word is never spoken and one where every file
+contains it once::
+
+    python -m benchmarks.bench_wake_word --model models/vosk-small \\
+        --wake-word assistant --negatives fixtures/background --positives fixtures/wake
+"""
+
+from __future__ import annotations
+
+import argparse
+from dataclasses import dataclass
+from pathlib import Path
+from threading import Event
+from time import process_time
+from typing import Callable, List, Optional
+
+from assistant.input.asr import StreamingRecognizer, StreamingVoicePipeline, VoskRecognizer, WavFileSource
+from assistant.input.wake_word import VoskKeywordSpotter, WakeWordDetector, WakeWordGate
+
+
+@dataclass(slots=True)
+class RunCost:
+    audio_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    recognizer_seconds: float = 0.0
+    activations: int = 0
+    files_with_activation: int = 0
+
+    @property
+    def cpu_per_audio_hour(self) -> float:
+        return self.cpu_seconds / self.audio_seconds * 3600 if self.audio_seconds else 0.0
+
+
+def run(
+    files: List[Path],
+    recognizer_factory: Callable[[int], StreamingRecognizer],
+    detector_factory: Optional[Callable[[int], WakeWordDetector]],
+) -> RunCost:
+    cost = RunCost()
+    for path in files:
+        source = WavFileSource(path)
+        gate = WakeWordGate(detector_factory(source.sample_rate)) if detector_factory else None
+        pipeline = StreamingVoicePipeline(
+            source, recognizer_factory(source.sample_rate), lambda *_: None, lambda *_: None, gate=gate
+        )
+        started = process_time()
+        pipeline.run(Event())
+        cost.cpu_seconds += process_time() - started
+        cost.audio_seconds += pipeline.stats.audio_seconds
+        cost.recognizer_seconds += pipeline.stats.recognizer_seconds
+        cost.activations += pipeline.stats.wake_activations
+        cost.files_with_activation += bool(pipeline.stats.wake_activations)
+        source.close()
+    return cost
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--model", required=True)
+    parser.add_argument("--wake-word", default="assistant")
+    parser.add_argument("--negatives", type=Path, required=True)
+    parser.add_argument("--positives", type=Path)
+    args = parser.parse_args()
+
+    def recognizer(rate: int) -> StreamingRecognizer:
+        return VoskRecognizer(args.model, sample_rate=rate)
+
+    def detector(rate: int) -> WakeWordDetector:
+        return VoskKeywordSpotter(args.model, args.wake_word, sample_rate=rate)
+
+    negatives = sorted(args.negatives.glob("*.wav"))
+    ungated = run(negatives, recognizer, None)
+    gated = run(negatives, recognizer, detector)
+    hours = gated.audio_seconds / 3600 or 1.0
+    print(f"background audio:        {gated.audio_seconds / 60:.1f} min in {len(negatives)} files")
+    print(f"false accepts per hour:  {gated.activations / hours:.2f}")
+    print(f"ASR duty (ungated):      {ungated.recognizer_seconds / max(ungated.audio_seconds, 1e-9):.1%}")
+    print(f"ASR duty (gated):        {gated.recognizer_seconds / max(gated.audio_seconds, 1e-9):.1%}")
+    print(f"CPU s per audio hour:    {ungated.cpu_per_audio_hour:.1f} ungated, {gated.cpu_per_audio_hour:.1f} gated")
+
+    if args.positives:
+        positives = sorted(args.positives.glob("*.wav"))
+        hits = run(positives, recognizer, detector)
+        print(f"detection rate:          {hits.files_with_activation / max(len(positives), 1):.1%}")
+
+
+if __name__ == "__main__":
+    main()
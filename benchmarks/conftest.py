@@ -0,0 +1,47 @@
+"""Reporting for the replay benchmark suite (``python -m pytest benchmarks``)."""
+
+from __future__ import annotations
+
+from typing import Callable, List, Tuple
+
+import pytest
+
+from assistant.replay.driver import ReplayReport
+
+_REPORTS: List[Tuple[str, ReplayReport]] = []
+REPORTED_STAGES = ("recognition", "queue", "parse", "dispatch", "execute", "end_to_end")
+
+
+@pytest.fixture
+def report_replay(request: pytest.FixtureRequest) -> Callable[[ReplayReport], None]:
+    """Attach a replay report to the current benchmark; it is printed in the terminal summary."""
+
+    def report(result: ReplayReport) -> None:
+        _REPORTS.append((request.node.name, result))
+        request.node.user_properties.append(("throughput_eps", result.throughput))
+        request.node.user_properties.append(("dropped", result.dropped))
+        for stage in REPORTED_STAGES:
+            if stage in result.stages:
+                request.node.user_properties.append((f"{stage}_p95_ms", result.stages[stage]["p95"] * 1000))
+
+    return report
+
+
+def pytest_terminal_summary(terminalreporter: pytest.TerminalReporter) -> None:
+    if not _REPORTS:
+        return
+    write = terminalreporter.write_line
+    terminalreporter.section("replay benchmarks")
+    for name, result in _REPORTS:
+        write(
+            f"{name}: {result.handled} events in {result.wall_seconds:.2f}s "
+            f"({result.throughput:.0f} ev/s, {result.speedup:.1f}x real time), "
+            f"dropped={result.dropped} coalesced={result.coalesced}"
+        )
+        for stage in REPORTED_STAGES:
+            summary = result.stages.get(stage)
+            if summary:
+                write(
+                    f"    {stage:<12} n={summary['count']:<4.0f} p50={summary['p50'] * 1000:7.2f}ms "
+                    f"p95={summary['p95'] * 1000:7.2f}ms p99={summary['p99'] * 1000:7.2f}ms"
+                )
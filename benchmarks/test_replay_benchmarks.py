@@ -0,0 +1,33 @@
+"""Headless end-to-end benchmarks: synthetic sessions replayed through ``ServiceManager``."""
+
+from pathlib import Path
+from typing import Callable
+
+import pytest
+
+from assistant.replay.driver import ReplayDriver, ReplayReport
+from assistant.replay.synthetic import write_synthetic_session
+
+COMMANDS = ["open browser", "play music", "switch window", "open file /tmp/notes.txt", "type text hello"]
+GESTURES = ["open_palm", "fist", "point", "open_palm"]
+
+
+def test_voice_session(tmp_path: Path, report_replay: Callable[[ReplayReport], None]) -> None:
+    path = write_synthetic_session(tmp_path / "voice.mdrc", commands=COMMANDS)
+    report = ReplayDriver(path, speed=8.0).run()
+    report_replay(report)
+
+    assert report.intents == ["open_browser", "play_music", "switch_window", "open_file", "type_text"]
+    assert report.dropped == 0
+
+
+def test_mixed_session(tmp_path: Path, report_replay: Callable[[ReplayReport], None]) -> None:
+    pytest.importorskip("numpy")
+    path = write_synthetic_session(tmp_path / "mixed.mdrc", commands=COMMANDS[:3], gestures=GESTURES)
+    report = ReplayDriver(path, speed=8.0).run()
+    report_replay(report)
+
+    assert sorted(report.intents) == sorted(
+        ["open_browser", "play_music", "switch_window", "open_browser", "play_music", "type_text", "open_browser"]
+    )
+    assert report.dropped == 0
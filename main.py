@@ -1,32 +1,77 @@
 from __future__ import annotations
 
+import argparse
+import asyncio
 import signal
-import time
+from threading import Event
+from typing import TYPE_CHECKING, List, Optional
 
-from assistant.core.config import AssistantConfig
 from assistant.core.logging_config import configure_logging
-from assistant.core.service_manager import ServiceManager
+from assistant.core.startup import StartupProfile
 
+if TYPE_CHECKING:
+    from assistant.core.config import AssistantConfig
+
+STOP_SIGNALS = (signal.SIGINT, signal.SIGTERM)
 
-def main() -> None:
-    configure_logging()
-    config = AssistantConfig.load("config.json")
-    manager = ServiceManager(config)
 
-    running = True
+async def serve(config: AssistantConfig, config_path: str, startup: StartupProfile | None = None) -> None:
+    """Run the assistant on an asyncio loop until SIGINT or SIGTERM."""
+    from assistant.core.async_bus import AsyncEventBus
+    from assistant.core.service_manager import ServiceManager
 
-    def _stop_handler(*_: object) -> None:
-        nonlocal running
-        running = False
+    if startup is not None:
+        startup.end("imports")
+    loop = asyncio.get_running_loop()
+    stop = asyncio.Event()
+    for sig in STOP_SIGNALS:
+        try:
+            loop.add_signal_handler(sig, stop.set)
+        except NotImplementedError:  # Windows event loops
+            signal.signal(sig, lambda *_: loop.call_soon_threadsafe(stop.set))
+    manager = ServiceManager(config, config_path=config_path, bus=AsyncEventBus(loop=loop), startup=startup)
+    await manager.run(stop)
 
-    signal.signal(signal.SIGINT, _stop_handler)
-    signal.signal(signal.SIGTERM, _stop_handler)
 
+def serve_threaded(config: AssistantConfig, config_path: str, startup: StartupProfile | None = None) -> None:
+    """The pre-asyncio runtime: a thread per bus lane, stopped from the signal handler."""
+    from assistant.core.service_manager import ServiceManager
+
+    if startup is not None:
+        startup.end("imports")
+    manager = ServiceManager(config, config_path=config_path, startup=startup)
+    stopped = Event()
+    for sig in STOP_SIGNALS:
+        signal.signal(sig, lambda *_: stopped.set())
     manager.start()
-    while running:
-        time.sleep(0.2)
+    stopped.wait()
     manager.stop()
 
 
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Voice and gesture controlled desktop assistant")
+    parser.add_argument("--config", default="config.json", help="config file (default: config.json)")
+    parser.add_argument("--threads", action="store_true", help="use the threaded event bus instead of asyncio")
+    parser.add_argument(
+        "--profile-startup", action="store_true", help="log the time spent per startup stage and per import"
+    )
+    args = parser.parse_args(argv)
+
+    configure_logging()
+    startup: StartupProfile | None = None
+    if args.profile_startup:
+        startup = StartupProfile()
+        startup.time_imports()
+        startup.begin("imports")
+    # The assistant's modules are imported from here on, after the import timer is installed.
+    from assistant.core.config import AssistantConfig
+
+    config = AssistantConfig.load(args.config)
+    if args.threads:
+        serve_threaded(config, args.config, startup)
+    else:
+        asyncio.run(serve(config, args.config, startup))
+
+
 if __name__ == "__main__":
     main()
@@ -1,6 +1,43 @@
+import math
 import sys
+import wave
+from array import array
 from pathlib import Path
+from typing import Callable, Iterator, List, Tuple
+
+import pytest
 
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
+
+from assistant.core import tracing  # noqa: E402
+from assistant.input.asr import SAMPLE_RATE  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def _restore_tracer() -> Iterator[None]:
+    """Put back the process-wide tracer a test's ServiceManager installed, so it does not leak into later tests."""
+    previous = tracing.tracer()
+    yield
+    tracing.use_tracer(previous)
+
+
+@pytest.fixture
+def tone_wav(tmp_path: Path) -> Callable[[str, List[Tuple[float, float]]], Path]:
+    """Writes ``name`` in ``tmp_path`` from (seconds, amplitude) segments of a 440 Hz tone; amplitude 0 is silence."""
+
+    def write(name: str, segments: List[Tuple[float, float]]) -> Path:
+        samples = array("h")
+        for seconds, amplitude in segments:
+            for n in range(int(seconds * SAMPLE_RATE)):
+                samples.append(int(amplitude * math.sin(2 * math.pi * 440 * n / SAMPLE_RATE)))
+        path = tmp_path / name
+        with wave.open(str(path), "wb") as wav:
+            wav.setnchannels(1)
+            wav.setsampwidth(2)
+            wav.setframerate(SAMPLE_RATE)
+            wav.writeframes(samples.tobytes())
+        return path
+
+    return write
@@ -0,0 +1,112 @@
+from pathlib import Path
+from threading import Event
+from typing import Callable, List, Optional
+
+from assistant.core.events import AssistantEvent
+from assistant.input.asr import EnergyVAD, StreamingVoicePipeline, WavFileSource
+from assistant.input.voice_input import VoiceInputService
+
+
+class ScriptedRecognizer:
+    """Emits one scripted word every few chunks, like a streaming decoder."""
+
+    def __init__(self, utterances: List[str], chunks_per_word: int = 3) -> None:
+        self._utterances = list(utterances)
+        self._chunks_per_word = chunks_per_word
+        self._words: List[str] = []
+        self._chunks = 0
+
+    def start_utterance(self) -> None:
+        self._words = self._utterances.pop(0).split() if self._utterances else []
+        self._chunks = 0
+
+    def accept(self, chunk: bytes) -> Optional[str]:
+        self._chunks += 1
+        if self._chunks % self._chunks_per_word:
+            return None
+        count = self._chunks // self._chunks_per_word
+        if count > len(self._words):
+            return None
+        return " ".join(self._words[:count])
+
+    def finish(self) -> str:
+        return " ".join(self._words)
+
+
+class ListBus:
+    def __init__(self) -> None:
+        self.events: List[AssistantEvent] = []
+
+    def publish(self, event: AssistantEvent) -> None:
+        self.events.append(event)
+
+
+def test_vad_segments_utterances_and_streams_partials(tone_wav: Callable[..., Path]) -> None:
+    path = tone_wav("two.wav", [(0.3, 0), (0.6, 8000), (0.8, 0), (0.6, 8000), (0.8, 0)])
+    partials, finals = [], []
+    pipeline = StreamingVoicePipeline(
+        WavFileSource(path),
+        ScriptedRecognizer(["open browser", "play music"]),
+        on_partial=lambda text, utterance, _: partials.append((utterance, text)),
+        on_final=lambda text, utterance, _: finals.append((utterance, text)),
+        vad=EnergyVAD(),
+    )
+    pipeline.run(Event())
+
+    first = finals[0][0]
+    assert finals == [(first, "open browser"), (first + 1, "play music")]
+    assert partials[0] == (first, "open")
+    assert (first, "open browser") in partials
+    assert pipeline.stats.utterances == 2
+    assert pipeline.stats.first_partial_count == 2
+    assert abs(pipeline.stats.audio_seconds - 3.1) < 0.05
+
+
+def test_silence_never_reaches_recognizer(tone_wav: Callable[..., Path]) -> None:
+    path = tone_wav("silence.wav", [(2.0, 0)])
+    recognizer = ScriptedRecognizer(["should not run"])
+    pipeline = StreamingVoicePipeline(WavFileSource(path), recognizer, lambda *_: None, lambda *_: None)
+    pipeline.run(Event())
+    assert pipeline.stats.utterances == 0
+    assert recognizer._utterances == ["should not run"]
+
+
+def test_voice_service_streaming_backend_publishes_partial_then_text(tone_wav: Callable[..., Path]) -> None:
+    path = tone_wav("one.wav", [(0.2, 0), (0.6, 8000), (0.8, 0)])
+    bus = ListBus()
+    service = VoiceInputService(
+        bus,  # type: ignore[arg-type]
+        backend="vosk",
+        source_factory=lambda: WavFileSource(path),
+        recognizer_factory=lambda _: ScriptedRecognizer(["switch window"]),
+    )
+    service._run()
+
+    types = [event.event_type for event in bus.events]
+    assert types == ["voice.partial", "voice.partial", "voice.text"]
+    ids = {event.payload["utterance_id"] for event in bus.events}
+    assert len(ids) == 1
+
+    # A restarted service builds a new pipeline; its utterances must not reuse the old ids.
+    service._run()
+    assert {event.payload["utterance_id"] for event in bus.events[3:]}.isdisjoint(ids)
+    assert service.stats() is not None
+
+
+def test_vad_stride_skips_silence_but_keeps_speech(tone_wav: Callable[..., Path]) -> None:
+    path = tone_wav("two.wav", [(0.6, 0), (0.6, 8000), (0.8, 0), (0.6, 8000), (0.8, 0)])
+    finals, onsets = [], []
+    pipeline = StreamingVoicePipeline(
+        WavFileSource(path),
+        ScriptedRecognizer(["open browser", "play music"]),
+        on_partial=lambda *_: None,
+        on_final=lambda text, utterance, _: finals.append((utterance, text)),
+        vad=EnergyVAD(),
+        on_speech=lambda: onsets.append(pipeline.stats.audio_seconds),
+        vad_stride=4,
+    )
+    pipeline.run(Event())
+
+    assert [text for _, text in finals] == ["open browser", "play music"]
+    assert len(onsets) == 2
+    assert pipeline.stats.vad_skipped > 20
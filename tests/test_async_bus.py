@@ -0,0 +1,68 @@
+import asyncio
+import threading
+import time
+from typing import List
+
+from assistant.core.async_bus import AsyncEventBus
+from assistant.core.config import AssistantConfig
+from assistant.core.events import AssistantEvent, Lane
+from assistant.core.service_manager import ServiceManager
+
+
+def test_async_bus_runs_sync_and_async_handlers_and_closes_cleanly() -> None:
+    async def scenario() -> None:
+        bus = AsyncEventBus(lanes=[Lane("default", workers=3)])
+        seen: List[int] = []
+        threads = set()
+        done = asyncio.Event()
+
+        async def on_async(event: AssistantEvent) -> None:
+            await asyncio.sleep(0)
+            if event.payload["n"] == 9:
+                done.set()
+
+        def on_sync(event: AssistantEvent) -> None:
+            threads.add(threading.current_thread().name)
+            time.sleep(0.001)
+            seen.append(event.payload["n"])
+
+        bus.serialize("job")
+        bus.subscribe("job", on_sync)
+        bus.subscribe("job", on_async)
+        bus.start()
+        publisher = threading.Thread(target=lambda: [bus.publish(AssistantEvent("job", {"n": n})) for n in range(10)])
+        publisher.start()
+        await asyncio.wait_for(done.wait(), 2.0)
+        publisher.join()
+
+        await bus.aclose()
+        assert seen == list(range(10))
+        assert all(name.startswith("event-handler") for name in threads)
+        assert bus.stats()["default"].handled == 10
+        assert not [task for task in asyncio.all_tasks() if task.get_name().startswith("event-bus")]
+
+    asyncio.run(scenario())
+
+
+def test_service_manager_runs_on_the_async_bus_until_stopped(tmp_path) -> None:
+    async def scenario() -> None:
+        config = AssistantConfig(plugin_dir=str(tmp_path), hot_reload=False, power_idle_after=None)
+        manager = ServiceManager(config, bus=AsyncEventBus())
+        manager.feedback.speak_async = lambda text, urgent=False: None  # type: ignore[assignment,method-assign]
+        heard = asyncio.Event()
+
+        async def on_text(event: AssistantEvent) -> None:
+            heard.set()
+
+        manager.bus.subscribe("voice.text", on_text)
+        stop = asyncio.Event()
+        running = asyncio.create_task(manager.run(stop))
+        manager.bus.publish(AssistantEvent("voice.text", {"text": "hello there", "utterance_id": 1}, "voice"))
+        await asyncio.wait_for(heard.wait(), 2.0)
+
+        started = time.perf_counter()
+        stop.set()
+        await asyncio.wait_for(running, 5.0)
+        assert time.perf_counter() - started < 1.0
+
+    asyncio.run(scenario())
@@ -0,0 +1,114 @@
+import threading
+import time
+from typing import Any, List, Optional
+
+from assistant.input.capture import (
+    FULL_FRAME,
+    FrameRef,
+    FrameRing,
+    GesturePipeline,
+    InferenceScheduler,
+    Roi,
+    SyntheticFrameSource,
+)
+
+
+def _frames(count: int) -> List[bytes]:
+    return [bytes([n % 256]) * 16 for n in range(count)]
+
+
+def test_ring_reuses_preallocated_slots_and_counts_drops() -> None:
+    allocations = []
+
+    def allocate(frame: Any) -> bytearray:
+        allocations.append(frame)
+        return bytearray(len(frame))
+
+    def convert(frame: bytes, slot: bytearray) -> bytearray:
+        slot[:] = frame
+        return slot
+
+    ring = FrameRing(allocate=allocate, convert=convert)
+    for frame in _frames(10):
+        ring.write(frame, time.perf_counter())
+
+    ref = ring.acquire(0, timeout=0.1)
+    assert ref is not None
+    assert ref.seq == 10
+    assert bytes(ref.data) == bytes([9]) * 16
+    assert len(allocations) <= 3
+    assert ring.dropped == 9
+
+
+def test_slow_inference_always_takes_latest_frame() -> None:
+    seen: List[int] = []
+
+    def infer(image: Any, roi: Roi) -> int:
+        time.sleep(0.02)
+        return image[0]
+
+    def on_result(result: int, frame: FrameRef, roi: Roi) -> Optional[Roi]:
+        seen.append(result)
+        return FULL_FRAME
+
+    source = SyntheticFrameSource(_frames(200), fps=500)
+    pipeline = GesturePipeline(source, infer, on_result)
+    pipeline.start()
+    deadline = time.monotonic() + 3.0
+    while not source.exhausted and time.monotonic() < deadline:
+        time.sleep(0.01)
+    time.sleep(0.05)
+    pipeline.stop()
+
+    stats = pipeline.stats()
+    assert stats.captured == 200
+    assert stats.dropped > 100
+    assert stats.processed < 50
+    assert seen == sorted(seen)
+    assert stats.latency_max < 0.1
+
+
+def test_frames_are_skipped_while_no_hand_is_visible() -> None:
+    source = SyntheticFrameSource(_frames(30), fps=200)
+    pipeline = GesturePipeline(source, lambda image, roi: None, lambda *_: None, max_skip=2)
+    pipeline.start()
+    time.sleep(0.4)
+    pipeline.stop()
+
+    stats = pipeline.stats()
+    assert stats.skipped > 0
+    assert stats.processed + stats.skipped + stats.dropped <= stats.captured
+    assert stats.processed < stats.captured
+
+
+def test_roi_maps_crop_coordinates_back_to_frame() -> None:
+    roi = Roi.around([0.4, 0.6], [0.5, 0.7], margin=0.1)
+    assert abs(roi.x0 - 0.3) < 1e-9 and abs(roi.y1 - 0.8) < 1e-9
+    x, y = roi.to_frame(0.5, 0.5)
+    assert abs(x - 0.5) < 1e-9
+    assert abs(y - 0.6) < 1e-9
+
+
+def test_scheduler_shares_one_thread_fairly_within_budget() -> None:
+    served: List[tuple] = []
+
+    def pipeline(camera: int) -> GesturePipeline:
+        def infer(image: Any, roi: Roi) -> int:
+            served.append((camera, threading.get_ident()))
+            return camera
+
+        return GesturePipeline(SyntheticFrameSource(_frames(10_000), fps=300), infer, lambda *_: FULL_FRAME)
+
+    pipelines = [pipeline(0), pipeline(1)]
+    stop = threading.Event()
+    worker = threading.Thread(target=InferenceScheduler(pipelines, fps_budget=100).run, args=(stop,))
+    worker.start()
+    time.sleep(0.5)
+    stop.set()
+    worker.join(timeout=2)
+
+    cameras = [camera for camera, _ in served]
+    assert 20 <= len(served) <= 55
+    assert abs(cameras.count(0) - cameras.count(1)) <= 1
+    assert len({thread for _, thread in served}) == 1
+    assert sum(p.stats().captured for p in pipelines) > 2 * len(served)
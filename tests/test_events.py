@@ -0,0 +1,77 @@
+import threading
+import time
+
+from assistant.core.events import AssistantEvent, EventBus, Lane, OverflowPolicy
+
+
+def _wait_for(predicate, timeout: float = 2.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.005)
+    return False
+
+
+def test_slow_voice_handler_does_not_block_gesture_lane() -> None:
+    bus = EventBus()
+    release = threading.Event()
+    gestures = []
+
+    bus.subscribe("voice.text", lambda _: release.wait(2.0))
+    bus.subscribe("gesture.detected", lambda event: gestures.append(event.payload["gesture"]))
+    bus.start()
+    try:
+        bus.publish(AssistantEvent("voice.text", {"text": "slow"}))
+        bus.publish(AssistantEvent("gesture.detected", {"gesture": "fist"}))
+        assert _wait_for(lambda: gestures == ["fist"])
+    finally:
+        release.set()
+        bus.stop()
+
+
+def test_serialized_events_keep_publish_order_across_workers() -> None:
+    bus = EventBus(lanes=[Lane("default", workers=4)])
+    seen = []
+    bus.serialize("job")
+    bus.subscribe("job", lambda event: (time.sleep(0.002), seen.append(event.payload["n"])))
+    bus.start()
+    try:
+        for n in range(20):
+            bus.publish(AssistantEvent("job", {"n": n}))
+        assert _wait_for(lambda: len(seen) == 20)
+        assert seen == list(range(20))
+    finally:
+        bus.stop()
+
+
+def test_drop_oldest_and_coalesce_overflow() -> None:
+    bus = EventBus(
+        lanes=[
+            Lane("default", maxsize=2, overflow=OverflowPolicy.DROP_OLDEST),
+            Lane("gesture", maxsize=2, overflow=OverflowPolicy.COALESCE),
+        ]
+    )
+    for n in range(3):
+        bus.publish(AssistantEvent("misc", {"n": n}))
+    bus.publish(AssistantEvent("gesture.a"))
+    bus.publish(AssistantEvent("gesture.b"))
+    bus.publish(AssistantEvent("gesture.a", {"latest": True}))
+
+    stats = bus.stats()
+    assert stats["default"].depth == 2
+    assert stats["default"].dropped == 1
+    assert stats["gesture"].depth == 2
+    assert stats["gesture"].coalesced == 1
+
+
+def test_lane_stats_record_handler_latency() -> None:
+    bus = EventBus()
+    bus.subscribe("misc", lambda _: time.sleep(0.01))
+    bus.start()
+    try:
+        bus.publish(AssistantEvent("misc"))
+        assert _wait_for(lambda: bus.stats()["default"].handled == 1)
+        assert bus.stats()["default"].latency_max >= 0.01
+    finally:
+        bus.stop()
@@ -0,0 +1,97 @@
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from assistant.automation import launcher
+from assistant.automation.engine import AutomationEngine
+from assistant.automation.executor import ActionExecutor, ActionTimeoutError
+
+
+class SlowAction:
+    def __init__(self, release: threading.Event) -> None:
+        self.release = release
+
+    def execute(self) -> None:
+        self.release.wait(2.0)
+
+
+def test_execute_returns_future_without_blocking() -> None:
+    release = threading.Event()
+    engine = AutomationEngine(ActionExecutor(max_workers=1))
+
+    started = time.perf_counter()
+    future = engine.execute(SlowAction(release))
+    assert time.perf_counter() - started < 0.05
+    assert not future.done()
+
+    release.set()
+    assert future.result(timeout=1.0) is None
+    engine.shutdown()
+
+
+def test_timeout_fails_future() -> None:
+    release = threading.Event()
+    executor = ActionExecutor(max_workers=1, timeouts={"SlowAction": 0.05})
+    future = executor.submit("SlowAction", SlowAction(release).execute)
+    with pytest.raises(ActionTimeoutError):
+        future.result(timeout=1.0)
+    release.set()
+    executor.shutdown()
+
+
+def test_queued_action_can_be_cancelled() -> None:
+    release = threading.Event()
+    ran = []
+    executor = ActionExecutor(max_workers=1)
+    blocker = executor.submit("block", SlowAction(release).execute)
+    queued = executor.submit("queued", lambda: ran.append(True))
+
+    assert queued.cancel()
+    release.set()
+    blocker.result(timeout=1.0)
+    executor.shutdown(wait=True)
+    assert ran == []
+
+
+def test_shutdown_cancels_queued_futures_and_later_submissions() -> None:
+    release = threading.Event()
+    executor = ActionExecutor(max_workers=1)
+    blocker = executor.submit("block", SlowAction(release).execute)
+    queued = executor.submit("queued", lambda: None)
+
+    executor.shutdown()
+    assert queued.cancelled()
+    assert executor.submit("late", lambda: None).cancelled()
+    release.set()
+    blocker.result(timeout=1.0)
+
+
+def test_action_errors_surface_on_future() -> None:
+    executor = ActionExecutor()
+    future = executor.submit("boom", lambda: 1 / 0)
+    with pytest.raises(ZeroDivisionError):
+        future.result(timeout=1.0)
+    executor.shutdown()
+
+
+def test_platform_and_opener_are_resolved_once() -> None:
+    assert launcher.system() is launcher.system()
+    assert launcher.opener() is launcher.opener()
+    assert launcher.system.cache_info().misses == 1
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="helper uses fork")
+def test_helper_process_launcher_spawns_commands(tmp_path: Path) -> None:
+    marker = tmp_path / "spawned"
+    helper = launcher.HelperProcessLauncher()
+    try:
+        helper.spawn([sys.executable, "-c", f"open({str(marker)!r}, 'w').close()"])
+        deadline = time.monotonic() + 5.0
+        while not marker.exists() and time.monotonic() < deadline:
+            time.sleep(0.02)
+        assert marker.exists()
+    finally:
+        helper.close()
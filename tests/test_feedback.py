@@ -0,0 +1,91 @@
+import threading
+import time
+from typing import Any, List
+
+from assistant.feedback.feedback import FeedbackManager
+
+
+class FakeSpeechEngine:
+    """Headless stand-in for pyttsx3 that takes ``duration`` seconds per utterance."""
+
+    def __init__(self, duration: float = 0.05) -> None:
+        self.duration = duration
+        self.spoken: List[str] = []
+        self._text = ""
+        self._stopped = threading.Event()
+
+    def say(self, text: str) -> None:
+        self._text = text
+        self._stopped.clear()
+
+    def runAndWait(self) -> None:
+        if not self._stopped.wait(self.duration):
+            self.spoken.append(self._text)
+
+    def stop(self) -> None:
+        self._stopped.set()
+
+    def setProperty(self, name: str, value: Any) -> None:
+        pass
+
+
+def test_speak_does_not_block_caller() -> None:
+    engine = FakeSpeechEngine(duration=0.2)
+    feedback = FeedbackManager(engine=engine)
+
+    started = time.perf_counter()
+    future = feedback.speak_async("hello")
+    assert time.perf_counter() - started < 0.05
+
+    assert future.result(timeout=2.0) is True
+    assert engine.spoken == ["hello"]
+    feedback.close()
+
+
+def test_duplicate_messages_are_merged() -> None:
+    engine = FakeSpeechEngine(duration=0.05)
+    feedback = FeedbackManager(engine=engine)
+
+    first = feedback.speak_async("Starting")
+    futures = [feedback.speak_async("Done: switch_window") for _ in range(10)]
+
+    assert first.result(timeout=2.0)
+    assert all(future.result(timeout=2.0) for future in futures)
+    assert engine.spoken.count("Done: switch_window") == 1
+    feedback.close()
+
+
+def test_urgent_message_preempts_current_utterance() -> None:
+    engine = FakeSpeechEngine(duration=0.5)
+    feedback = FeedbackManager(engine=engine)
+
+    long = feedback.speak_async("a very long sentence")
+    queued = feedback.speak_async("queued")
+    time.sleep(0.05)
+    urgent = feedback.speak_async("stop now", urgent=True)
+
+    assert long.result(timeout=2.0) is False
+    assert urgent.result(timeout=2.0) is True
+    assert queued.result(timeout=2.0) is True
+    assert engine.spoken == ["stop now", "queued"]
+    feedback.close()
+
+
+def test_speech_rate_changes_on_speech_thread() -> None:
+    class RateEngine(FakeSpeechEngine):
+        def __init__(self) -> None:
+            super().__init__(duration=0.01)
+            self.rates: List[Any] = []
+
+        def setProperty(self, name: str, value: Any) -> None:
+            self.rates.append((name, value, threading.current_thread().name))
+
+    engine = RateEngine()
+    feedback = FeedbackManager(engine=engine)
+    assert feedback.speak_async("before").result(timeout=1.0)
+    feedback.set_speech_rate(140)
+    assert feedback.speak_async("after").result(timeout=1.0)
+
+    assert engine.rates == [("rate", 140, "feedback-speech")]
+    assert engine.spoken == ["before", "after"]
+    feedback.close()
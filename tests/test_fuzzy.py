@@ -0,0 +1,36 @@
+from assistant.commands.fuzzy import FuzzyMatcher, levenshtein, metaphone
+from assistant.commands.matcher import PhraseRule
+from assistant.commands.parser import BUILTIN_PHRASES, CommandIntent, RuleBasedCommandParser
+
+
+def test_edit_distance_and_phonetic_keys() -> None:
+    assert levenshtein("swich", "switch") == 1
+    assert levenshtein("browsers", "browser") == 1
+    assert levenshtein("kitten", "sitting", limit=1) > 1
+    assert metaphone("music") == metaphone("musik") == "MSK"
+    assert metaphone("phone") == metaphone("fone")
+    assert metaphone("knight") == "NT"
+
+
+def test_top_k_ranks_intents_by_score() -> None:
+    matcher = FuzzyMatcher(
+        list(BUILTIN_PHRASES) + [PhraseRule("play movie", "play_movie"), PhraseRule("play musical", "play_musical")]
+    )
+    matches = matcher.top("play musics", k=2)
+
+    assert [match.rule.intent for match in matches] == ["play_music", "play_musical"]
+    assert matches[0].score > matches[1].score
+    assert matcher.top("what is the weather") == []
+
+
+def test_parser_falls_back_to_fuzzy_match_above_threshold() -> None:
+    parser = RuleBasedCommandParser(fuzzy_threshold=0.8)
+
+    assert parser.parse("swich window") == CommandIntent("switch_window", confidence=0.95)
+    intent = parser.parse("opn file /tmp/notes.txt")
+    assert intent is not None
+    assert (intent.name, intent.argument) == ("open_file", "/tmp/notes.txt")
+    # Exact matches keep full confidence; prefix rules stay anchored at the start.
+    assert parser.parse("open browser") == CommandIntent("open_browser")
+    assert parser.parse("please opn file notes.txt") is None
+    assert RuleBasedCommandParser().parse("swich window") is None
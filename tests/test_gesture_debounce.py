@@ -0,0 +1,62 @@
+import random
+from typing import List, Optional, Tuple
+
+from assistant.input.gesture_debounce import GestureDebouncer, GesturePhase
+
+FPS = 30
+
+
+def _session() -> List[Tuple[float, Optional[str], float]]:
+    """Recorded-style classifier output: (timestamp, gesture, confidence) per frame."""
+    rng = random.Random(7)
+    frames: List[Tuple[Optional[str], float]] = []
+    frames += [("fist", rng.uniform(0.55, 0.95)) for _ in range(FPS)]
+    frames[10] = (None, 0.0)  # one-frame tracking dropout
+    frames += [(None, 0.0)] * (FPS // 2)
+    frames += [("open_palm", rng.uniform(0.75, 0.95)) for _ in range(FPS)]
+    frames += [("swipe_right", 1.0)] * 5
+    frames += [(None, 0.0)] * 5
+    return [(index / FPS, gesture, confidence) for index, (gesture, confidence) in enumerate(frames)]
+
+
+def test_replay_emits_only_edges() -> None:
+    session = _session()
+    debouncer = GestureDebouncer()
+    raw = sum(1 for _, gesture, _ in session if gesture)
+    transitions = [t for ts, gesture, confidence in session for t in debouncer.update(gesture, confidence, ts)]
+    enters = [t.gesture for t in transitions if t.phase is GesturePhase.ENTER]
+    releases = [t.gesture for t in transitions if t.phase is GesturePhase.RELEASE]
+
+    duration = session[-1][0]
+    before, after = raw / duration, len(enters) / duration
+    assert enters == ["fist", "open_palm", "swipe_right"]
+    assert releases == ["fist", "open_palm"]
+    assert before / after > 15
+
+
+def test_min_dwell_filters_flicker() -> None:
+    debouncer = GestureDebouncer(min_dwell=0.1)
+    events = []
+    for frame in range(20):
+        gesture = "point" if frame % 2 else "fist"
+        events += debouncer.update(gesture, 0.9, frame / FPS)
+    assert events == []
+
+
+def test_hysteresis_and_cooldown() -> None:
+    debouncer = GestureDebouncer(min_dwell=0.0, cooldown=1.0, enter_confidence=0.8, exit_confidence=0.4, release_after=0.0)
+    assert debouncer.update("fist", 0.6, 0.0) == []
+    assert [t.phase for t in debouncer.update("fist", 0.85, 0.1)] == [GesturePhase.ENTER]
+    assert debouncer.update("fist", 0.5, 0.2) == []
+    assert [t.phase for t in debouncer.update(None, 0.0, 0.3)] == [GesturePhase.RELEASE]
+    # Re-entering inside the cooldown window is suppressed, including its release.
+    assert debouncer.update("fist", 0.9, 0.4) == []
+    assert debouncer.update(None, 0.0, 0.5) == []
+    assert [t.phase for t in debouncer.update("fist", 0.9, 1.5)] == [GesturePhase.ENTER]
+
+
+def test_hold_ticks() -> None:
+    debouncer = GestureDebouncer(min_dwell=0.0, hold_interval=0.25)
+    phases = [t.phase for frame in range(FPS) for t in debouncer.update("fist", 0.9, frame / FPS)]
+    assert phases[0] is GesturePhase.ENTER
+    assert phases.count(GesturePhase.HOLD) == 3
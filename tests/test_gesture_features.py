@@ -0,0 +1,71 @@
+import json
+from types import SimpleNamespace
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from assistant.input.gesture_classifier import CentroidGestureClassifier, RuleGestureClassifier  # noqa: E402
+from assistant.input.gesture_features import (  # noqa: E402
+    NUM_FEATURES,
+    LandmarkHistory,
+    extract_features,
+    finger_extension,
+    landmarks_to_array,
+    sequence_features,
+)
+from assistant.replay.synthetic import POSES, hand  # noqa: E402
+
+
+def _hand(extended: tuple, x_shift: float = 0.0) -> np.ndarray:
+    return np.array(hand(extended, x_shift), dtype=np.float32)
+
+
+OPEN = _hand(POSES["open_palm"])
+FIST = _hand(POSES["fist"])
+POINT = _hand(POSES["point"])
+
+
+def test_landmarks_to_array_reuses_buffer() -> None:
+    landmarks = [SimpleNamespace(x=float(n), y=0.5, z=0.0) for n in range(21)]
+    out = np.empty((21, 3), dtype=np.float32)
+    points = landmarks_to_array(landmarks, out=out)
+    assert points is out
+    assert points[20, 0] == 20.0
+
+
+def test_rule_classifier_matches_finger_rules() -> None:
+    assert finger_extension(OPEN).all()
+    predictions = RuleGestureClassifier().predict(extract_features(np.stack([OPEN, FIST, POINT])))
+    assert [label for label, _ in predictions] == ["open_palm", "fist", "point"]
+
+
+def test_history_velocity_detects_swipe() -> None:
+    history = LandmarkHistory()
+    classifier = RuleGestureClassifier()
+    label = None
+    for step in range(6):
+        points = _hand((True, True, True, True, True), x_shift=0.06 * step)
+        history.append(points)
+        label, _ = classifier.predict(extract_features(points, history.velocity()))[0]
+    assert label == "swipe_right"
+
+
+def test_batch_scoring_of_recorded_sequence() -> None:
+    sequence = np.stack([_hand((True,) * 5, x_shift=-0.06 * step) for step in range(10)])
+    features = sequence_features(sequence)
+    assert features.shape == (10, NUM_FEATURES)
+    labels = [label for label, _ in RuleGestureClassifier().predict(features)]
+    assert labels[:4] == ["open_palm"] * 4
+    assert labels[-1] == "swipe_left"
+
+
+def test_centroid_classifier_from_calibration_file(tmp_path) -> None:
+    samples = extract_features(np.stack([OPEN, FIST, POINT]))
+    path = tmp_path / "calibration.json"
+    path.write_text(json.dumps({"samples": samples.tolist(), "labels": ["open_palm", "fist", "point"]}))
+
+    classifier = CentroidGestureClassifier.load(path, max_distance=2.0)
+    predictions = classifier.predict(extract_features(np.stack([FIST, POINT])))
+    assert [label for label, _ in predictions] == ["fist", "point"]
+    assert all(score > 0.9 for _, score in predictions)
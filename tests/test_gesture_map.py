@@ -0,0 +1,107 @@
+import time
+from threading import Event
+from typing import Callable, List
+
+import pytest
+
+from assistant.commands.gesture_map import GestureMap, GestureRule
+from assistant.commands.parser import CommandIntent
+from assistant.core.config import AssistantConfig
+from assistant.core.events import AssistantEvent
+from assistant.core.service_manager import ServiceManager
+from assistant.input.foreground import ForegroundApp
+
+
+def test_rules_are_ranked_by_mode_and_app() -> None:
+    gesture_map = GestureMap.from_config(
+        [
+            {"gesture": "fist", "intent": "pause_video", "app": "VLC"},
+            {"gesture": "fist", "intent": "mute", "mode": "presentation"},
+            {"gesture": "fist", "intent": "next_slide", "mode": "presentation", "app": "vlc"},
+            {"gesture": "point", "intent": None, "mode": "presentation"},
+        ]
+    )
+    assert gesture_map.uses_apps
+    assert gesture_map.table()["fist"] == CommandIntent("play_music")
+    assert gesture_map.table("default", "vlc")["fist"] == CommandIntent("pause_video")
+    assert gesture_map.table("presentation", "firefox")["fist"] == CommandIntent("mute")
+    assert gesture_map.table("presentation", "vlc")["fist"] == CommandIntent("next_slide")
+    assert "point" not in gesture_map.table("presentation")
+    assert gesture_map.table()["point"] == CommandIntent("type_text", "gesture triggered text")
+    # Unknown modes and apps share the generic table instead of compiling new ones.
+    assert gesture_map.table("gaming", "steam") is gesture_map.table()
+    with pytest.raises(ValueError):
+        GestureRule.from_entry({"gesture": "fist", "intnet": "mute"})
+
+
+def inline(refresh: Callable[[], None]) -> None:
+    refresh()
+
+
+def test_foreground_app_is_cached_for_ttl() -> None:
+    now = [0.0]
+    apps = iter(["firefox", "vlc"])
+    foreground = ForegroundApp(probe=lambda: next(apps), ttl=1.0, clock=lambda: now[0], spawn=inline)
+    assert foreground.current() == "firefox"
+    now[0] = 0.9
+    assert foreground.current() == "firefox"
+    now[0] = 1.0
+    assert foreground.current() == "vlc"
+    assert foreground.probes == 2
+    assert ForegroundApp(probe=lambda: 1 / 0, spawn=inline).current() is None
+
+
+def test_slow_foreground_probe_does_not_block_the_caller() -> None:
+    release = Event()
+    probed = Event()
+
+    def slow_probe() -> str:
+        probed.set()
+        release.wait(2.0)
+        return "vlc"
+
+    foreground = ForegroundApp(probe=slow_probe, ttl=0.0)
+    started = time.monotonic()
+    assert foreground.current() is None
+    assert probed.wait(1.0)
+    # While the probe runs, callers get the cached value and no second probe starts.
+    assert foreground.current() is None
+    assert time.monotonic() - started < 0.5
+    assert foreground.probes == 1
+    release.set()
+    deadline = time.monotonic() + 2.0
+    while foreground.current() != "vlc" and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert foreground.current() == "vlc"
+
+
+def test_gestures_follow_foreground_app_and_mode() -> None:
+    config = AssistantConfig(
+        power_idle_after=None,
+        gesture_map=[
+            {"gesture": "fist", "intent": "switch_window", "app": "vlc"},
+            {"gesture": "fist", "intent": "open_browser", "mode": "browse"},
+        ],
+    )
+    manager = ServiceManager(config)
+    app = ["firefox"]
+    manager.foreground = ForegroundApp(probe=lambda: app[0], ttl=0.0, spawn=inline)
+    dispatched: List[str] = []
+    for name in ("play_music", "switch_window", "open_browser"):
+        manager.router.register(name, lambda intent: dispatched.append(intent.name))
+
+    def fist() -> None:
+        manager._on_gesture(AssistantEvent("gesture.detected", {"gesture": "fist", "confidence": 0.9}, "gesture"))
+
+    fist()
+    commands = manager.gesture_commands()
+    fist()
+    assert manager.gesture_commands() is commands
+    app[0] = "vlc"
+    fist()
+    app[0] = "firefox"
+    manager.set_mode("browse")
+    fist()
+    manager._on_gesture(AssistantEvent("gesture.detected", {"gesture": "wave"}, "gesture"))
+    assert dispatched == ["play_music", "play_music", "switch_window", "open_browser"]
+    manager.automation.shutdown()
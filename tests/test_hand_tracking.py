@@ -0,0 +1,61 @@
+from types import SimpleNamespace
+from typing import List
+
+import pytest
+
+from assistant.core.events import AssistantEvent
+from assistant.input.capture import FULL_FRAME, FrameRef
+from assistant.input.gesture_input import GestureInputService
+from assistant.input.hand_tracking import HandTracker
+from assistant.replay.synthetic import POSES, hand
+
+
+def test_tracks_keep_ids_when_hands_move_and_reorder() -> None:
+    tracker = HandTracker(new_state=dict)
+    left, right = tracker.update([(0.2, 0.5), (0.8, 0.5)], now=0.0)
+    # Detection order flips and both hands move a little.
+    moved = tracker.update([(0.75, 0.55), (0.25, 0.45)], now=0.1)
+
+    assert [track.id for track in moved] == [right.id, left.id]
+    assert tracker.update([(0.8, 0.5)], now=0.2)[0].id == right.id
+    assert [track.id for track in tracker.missing(0.2)] == [left.id]
+    tracker.missing(1.0)
+    assert list(tracker.tracks) == []
+
+
+class _Bus:
+    def __init__(self) -> None:
+        self.events: List[AssistantEvent] = []
+
+    def publish(self, event: AssistantEvent) -> None:
+        self.events.append(event)
+
+
+def _frame(*hands: List[tuple]) -> SimpleNamespace:
+    landmarks = [SimpleNamespace(landmark=[SimpleNamespace(x=x, y=y, z=z) for x, y, z in points]) for points in hands]
+    return SimpleNamespace(multi_hand_landmarks=landmarks)
+
+
+def _shifted(pose: str, dx: float) -> List[tuple]:
+    return [(x + dx, y, z) for x, y, z in hand(POSES[pose])]
+
+
+def test_two_open_palms_fire_one_two_hand_gesture() -> None:
+    pytest.importorskip("numpy")
+    bus = _Bus()
+    service = GestureInputService(bus)  # type: ignore[arg-type]
+    service._prepare(1)
+    camera = service._cameras[0]
+    for seq in range(12):
+        result = _frame(_shifted("open_palm", -0.25), _shifted("open_palm", 0.25))
+        service._on_result(camera, result, FrameRef(0, seq, seq / 30, None), FULL_FRAME)
+
+    detected = [event.payload for event in bus.events if event.event_type == "gesture.detected"]
+    assert [(payload["gesture"], payload["hand"]) for payload in detected] == [("both_palms", "both")]
+
+    # A fist on one hand breaks the pair; that hand's own gesture fires with its track ID.
+    for seq in range(12, 24):
+        result = _frame(_shifted("fist", -0.25), _shifted("open_palm", 0.25))
+        service._on_result(camera, result, FrameRef(0, seq, seq / 30, None), FULL_FRAME)
+    detected = [event.payload for event in bus.events if event.event_type == "gesture.detected"]
+    assert {(payload["gesture"], payload["hand"]) for payload in detected[1:]} == {("fist", 1), ("open_palm", 2)}
@@ -0,0 +1,84 @@
+import math
+from pathlib import Path
+from typing import List
+
+from assistant.core.config import AssistantConfig
+from assistant.core.events import AssistantEvent
+from assistant.core.history import HistoryEntry, HistoryLog, Outcome
+from assistant.core.service_manager import ServiceManager
+
+
+def test_log_round_trips_rotates_and_ranks(tmp_path: Path) -> None:
+    log = HistoryLog(tmp_path, segment_records=4, max_segments=2)
+    for index in range(10):
+        outcome = Outcome.FAILED if index == 9 else Outcome.OK
+        name = "open_browser" if index % 3 else "play_music"
+        log.record(HistoryEntry(1000.0 + index, "voice", name, f"arg {index}", outcome, 0.001, 0.002, 0.25))
+    log.flush()
+
+    # Ten records in segments of four: only the newest two segments (records 5-10) are kept.
+    assert [path.name for path in log.segments()] == ["000002.log", "000003.log"]
+    entries = list(log.entries(newest_first=False))
+    assert [entry.argument for entry in entries] == [f"arg {index}" for index in range(4, 10)]
+    assert math.isclose(entries[0].total, 0.25, rel_tol=1e-6)
+
+    assert log.last().argument == "arg 8"  # type: ignore[union-attr]
+    assert log.last(outcome=None).outcome is Outcome.FAILED  # type: ignore[union-attr]
+    usage = log.usage()
+    assert (usage["play_music"].count, usage["play_music"].failures) == (2, 1)
+    assert [name for name, _ in log.ranking(half_life=None)] == ["open_browser", "play_music"]
+    log.close()
+
+    # A new process resumes the newest segment instead of starting another one.
+    reopened = HistoryLog(tmp_path, segment_records=4, max_segments=2)
+    reopened.record(HistoryEntry(2000.0, "gesture", "switch_window"))
+    assert reopened.last(source="gesture").intent == "switch_window"  # type: ignore[union-attr]
+    assert len(reopened.segments()) == 2
+    reopened.close()
+
+
+def test_manager_records_commands_and_repeats_the_last(tmp_path: Path) -> None:
+    manager = ServiceManager(AssistantConfig(history_dir=str(tmp_path), power_idle_after=None))
+    manager.configure()
+    typed = []
+    manager.router.register("type_text", lambda intent: typed.append(intent.argument))
+
+    def say(text: str) -> None:
+        manager._on_voice_text(AssistantEvent("voice.text", {"text": text}, "voice"))
+
+    # With nothing to repeat the command fails rather than confirming "Done".
+    say("do that again")
+    say("type text hello")
+    say("repeat last command")
+    assert typed == ["hello", "hello"]
+    assert manager.history is not None
+    history = list(manager.history.entries(newest_first=False))
+    assert [(entry.source, entry.intent, entry.outcome) for entry in history] == [
+        ("voice", "repeat_last", Outcome.FAILED),
+        ("voice", "type_text", Outcome.OK),
+        ("voice", "repeat_last", Outcome.OK),
+    ]
+    assert history[1].argument == "hello"
+    manager.automation.shutdown()
+    manager.history.close()
+
+
+def test_repeat_after_a_compound_command_runs_the_whole_batch(tmp_path: Path) -> None:
+    manager = ServiceManager(AssistantConfig(history_dir=str(tmp_path), power_idle_after=None))
+    manager.configure()
+    ran: List[str] = []
+    for name in ("open_browser", "play_music"):
+        manager.router.register(name, lambda intent: ran.append(intent.name))
+
+    def say(text: str) -> None:
+        manager._on_voice_text(AssistantEvent("voice.text", {"text": text}, "voice"))
+
+    say("play music")
+    say("open browser and then play music")
+    say("repeat last command")
+    assert ran == ["play_music", "open_browser", "play_music", "open_browser", "play_music"]
+    assert manager.history is not None
+    last = manager.history.last(outcome=None)
+    assert last is not None and (last.intent, last.outcome) == ("repeat_last", Outcome.OK)
+    manager.automation.shutdown()
+    manager.history.close()
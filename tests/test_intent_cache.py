@@ -0,0 +1,83 @@
+from typing import List
+
+from assistant.commands.cache import IntentCache
+from assistant.commands.parser import CommandIntent
+from assistant.commands.router import ActionRoute, CommandRouter, ResolvedCommand
+from assistant.core import tracing
+from assistant.core.config import AssistantConfig
+from assistant.core.service_manager import ServiceManager
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_hits_reuse_prebuilt_action_until_ttl_expires() -> None:
+    router = CommandRouter()
+    built: List[str] = []
+    ran: List[object] = []
+
+    def build(intent: CommandIntent) -> object:
+        built.append(intent.name)
+        return object()
+
+    router.register("open_browser", ActionRoute(build, ran.append))
+    clock = FakeClock()
+    cache = IntentCache(ttl=10.0, clock=clock)
+
+    def compute(text: str) -> ResolvedCommand:
+        return router.resolve(CommandIntent(name=text.replace(" ", "_")))
+
+    first = cache.resolve("  Open Browser", compute)
+    second = cache.resolve("open browser ", compute)
+    router.run(first)
+    router.run(second)
+    assert first is second
+    assert built == ["open_browser"]
+    assert ran == [first.action, first.action]
+
+    clock.now = 11.0
+    assert cache.resolve("open browser", compute) is not first
+    assert (cache.stats.hits, cache.stats.misses) == (1, 2)
+
+
+def test_lru_eviction_and_negative_entries() -> None:
+    cache = IntentCache(maxsize=2)
+    calls: List[str] = []
+
+    def compute(text: str) -> None:
+        calls.append(text)
+        return None
+
+    for text in ("open", "open bro", "open", "hello", "open bro"):
+        assert cache.resolve(text, compute) is None
+    # "open" stayed fresh, so "open bro" was the one evicted by "hello".
+    assert calls == ["open", "open bro", "hello", "open bro"]
+    assert len(cache) == 2
+
+
+def test_manager_invalidates_on_router_change_and_reports_counters() -> None:
+    previous = tracing.tracer()
+    manager = ServiceManager(AssistantConfig(tracing=True))
+    try:
+        manager.configure()
+        first = manager.resolve("open browser")
+        assert first is not None and first.action is not None
+        assert manager.resolve("OPEN BROWSER") is first
+
+        manager.router.register("open_browser", lambda _: None)
+        second = manager.resolve("open browser")
+        assert second is not None and second is not first and second.action is None
+
+        counters = tracing.tracer().counters()
+        assert counters["intent_cache.hits"] == 1
+        assert counters["intent_cache.misses"] == 2
+        assert counters["intent_cache.invalidations"] >= 1
+        assert "assistant_intent_cache_hits 1" in manager.tracer.prometheus_text()
+    finally:
+        manager.automation.shutdown()
+        tracing.use_tracer(previous)
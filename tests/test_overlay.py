@@ -0,0 +1,44 @@
+import time
+
+from assistant.core.config import AssistantConfig
+from assistant.core.events import AssistantEvent, EventBus
+from assistant.core.service_manager import ServiceManager
+from assistant.ui.overlay import Overlay
+
+
+def test_overlay_coalesces_bursts_into_one_render() -> None:
+    bus = EventBus()
+    overlay = Overlay(bus, headless=True)
+    for n in range(500):
+        overlay.on_event(AssistantEvent("gesture.detected", {"gesture": f"g{n}", "confidence": 0.9}))
+    overlay.on_event(AssistantEvent("command.dispatched", {"intent": "play_music", "confidence": 0.9}))
+    overlay.on_event(AssistantEvent("command.completed", {"intent": "play_music", "latency": 0.042}))
+    bus.publish(AssistantEvent("voice.text", {"text": "queued"}))
+
+    changes = overlay.render()
+    assert changes["heard"] == "gesture g499"
+    assert overlay.updates.coalesced == 499
+    assert overlay.text().splitlines()[1:] == ["heard: gesture g499", "intent: play_music (90%)", "queue 1, last action 42 ms"]
+    assert overlay.render() == {}
+
+
+def test_manager_feeds_overlay_after_dispatch() -> None:
+    manager = ServiceManager(AssistantConfig(overlay=True, power_idle_after=None))
+    assert manager.overlay is not None
+    manager.overlay.headless = True
+    order = []
+    manager.router.register("open_browser", lambda intent: order.append("dispatch"))
+    manager.bus.subscribe("command.dispatched", lambda event: order.append("announced"))
+    manager.bus.subscribe("*", manager.overlay.on_event)
+
+    manager._on_voice_text(AssistantEvent("voice.text", {"text": "open browser", "utterance_id": 1}, "voice"))
+    manager.bus.start()
+    try:
+        for _ in range(200):
+            if manager.overlay.render().get("intent"):
+                break
+            time.sleep(0.005)
+    finally:
+        manager.bus.stop()
+    assert order == ["dispatch", "announced"]
+    assert manager.overlay.state["intent"] == "open_browser"
@@ -14,3 +14,75 @@ def test_open_file_argument() -> None:
     assert intent is not None
     assert intent.name == "open_file"
     assert intent.argument == "/tmp/a.txt"
+
+
+def test_type_text_argument() -> None:
+    parser = RuleBasedCommandParser()
+    intent = parser.parse("Type text Hello World")
+    assert intent is not None
+    assert intent.name == "type_text"
+    assert intent.argument == "hello world"
+
+
+def test_table_order_decides_between_overlapping_phrases() -> None:
+    parser = RuleBasedCommandParser()
+    intent = parser.parse("open file power off.txt")
+    assert intent is not None
+    assert intent.name == "open_file"
+    assert intent.argument == "power off.txt"
+
+    intent = parser.parse("please power off and open browser")
+    assert intent is not None
+    assert intent.name == "open_browser"
+
+
+def test_prefix_phrase_only_matches_at_start() -> None:
+    parser = RuleBasedCommandParser()
+    assert parser.parse("please type text hi") is None
+
+
+def test_config_phrases_with_argument_capture() -> None:
+    parser = RuleBasedCommandParser()
+    parser.add_phrases({"lights on": "lights_on", "search for *": "web_search"})
+
+    intent = parser.parse("turn the lights on")
+    assert intent is not None
+    assert intent.name == "lights_on"
+
+    intent = parser.parse("search for cheap flights")
+    assert intent is not None
+    assert intent.name == "web_search"
+    assert intent.argument == "cheap flights"
+
+
+def test_large_vocabulary() -> None:
+    parser = RuleBasedCommandParser()
+    parser.add_phrases({f"custom command {n} zz": f"custom_{n}" for n in range(2000)})
+    intent = parser.parse("run custom command 1234 zz now")
+    assert intent is not None
+    assert intent.name == "custom_1234"
+    assert parser.parse("nothing to see here") is None
+
+
+def test_compound_utterance_splits_into_ordered_steps() -> None:
+    parser = RuleBasedCommandParser()
+    steps = parser.parse_all("open browser and then switch window, type text hello and also play music")
+
+    assert [(step.intent.name, step.intent.argument, step.after_previous) for step in steps] == [
+        ("open_browser", None, False),
+        ("switch_window", None, True),
+        ("type_text", "hello", True),
+        ("play_music", None, False),
+    ]
+
+
+def test_compound_argument_keeps_conjunctions_that_are_not_commands() -> None:
+    parser = RuleBasedCommandParser()
+    steps = parser.parse_all("type text salt and pepper, then open file /tmp/a and b.txt and power off")
+
+    assert [(step.intent.name, step.intent.argument) for step in steps] == [
+        ("type_text", "salt and pepper"),
+        ("open_file", "/tmp/a and b.txt"),
+        ("shutdown_pc", None),
+    ]
+    assert [step.intent.name for step in parser.parse_all("um, open browser and uh")] == ["open_browser"]
@@ -0,0 +1,95 @@
+import threading
+
+import pytest
+
+from assistant.automation.engine import AutomationEngine
+from assistant.automation.executor import ActionExecutor, ActionTimeoutError
+from assistant.automation.pipeline import Pipeline, PipelineError, PipelineStep, StepStatus
+
+
+def test_independent_steps_run_concurrently_and_pass_outputs() -> None:
+    barrier = threading.Barrier(2, timeout=1.0)
+
+    def branch(value: int):
+        def run(_):
+            barrier.wait()  # only passes if both branches are running at once
+            return value
+
+        return run
+
+    pipeline = Pipeline(
+        "sum",
+        [
+            PipelineStep("a", branch(2)),
+            PipelineStep("b", branch(3)),
+            PipelineStep("total", lambda inputs: inputs["a"] + inputs["b"], depends_on=("a", "b")),
+        ],
+    )
+    engine = AutomationEngine(ActionExecutor(max_workers=2))
+    engine.register_pipeline("sum", pipeline)
+
+    result = engine.start_pipeline("sum").result(timeout=2.0)
+    assert result.succeeded
+    assert result.steps["total"].output == 5
+    assert all(step.duration >= 0 for step in result.steps.values())
+    engine.shutdown()
+
+
+def test_retry_and_partial_failure() -> None:
+    attempts = []
+
+    def flaky(_):
+        attempts.append(1)
+        if len(attempts) < 2:
+            raise OSError("busy")
+        return "ok"
+
+    def broken(_):
+        raise RuntimeError("boom")
+
+    pipeline = Pipeline(
+        "mixed",
+        [
+            PipelineStep("flaky", flaky, retries=1),
+            PipelineStep("optional", broken, required=False),
+            PipelineStep("after_optional", lambda _: "never", depends_on=("optional",), required=False),
+            PipelineStep("slow", lambda _: threading.Event().wait(1.0), timeout=0.05, required=False),
+        ],
+    )
+    engine = AutomationEngine(ActionExecutor(max_workers=3))
+    engine.register_pipeline("mixed", pipeline)
+
+    result = engine.start_pipeline("mixed").result(timeout=2.0)
+    assert result.succeeded
+    assert result.steps["flaky"].attempts == 2
+    assert result.steps["optional"].status is StepStatus.FAILED
+    assert result.steps["after_optional"].status is StepStatus.SKIPPED
+    assert isinstance(result.steps["slow"].error, ActionTimeoutError)
+    engine.shutdown()
+
+
+def test_config_pipeline_and_validation() -> None:
+    typed = []
+
+    class TypeText:
+        def __init__(self, text: str) -> None:
+            self.text = text
+
+        def execute(self) -> None:
+            typed.append(self.text)
+
+    factories = {"read": lambda: "notes body", "type_text": TypeText}
+    spec = [
+        {"name": "read", "action": "read"},
+        {"name": "type", "action": "type_text", "args": {"text": "$read"}, "depends_on": ["read"]},
+    ]
+    engine = AutomationEngine(ActionExecutor(max_workers=2))
+    engine.register_pipeline("flow", Pipeline.from_config("flow", spec, factories))
+    assert engine.start_pipeline("flow").result(timeout=2.0).succeeded
+    assert typed == ["notes body"]
+    engine.shutdown()
+
+    with pytest.raises(PipelineError):
+        Pipeline("loop", [PipelineStep("a", print, depends_on=("b",)), PipelineStep("b", print, depends_on=("a",))])
+    with pytest.raises(PipelineError):
+        Pipeline.from_config("bad", [{"name": "x", "action": "missing"}], factories)
@@ -0,0 +1,69 @@
+import os
+from pathlib import Path
+
+from assistant.automation.engine import AutomationEngine
+from assistant.automation.plugins import LazyHook, PluginCatalog
+
+PLUGIN = """
+from pathlib import Path
+
+Path(__file__).with_suffix(".imported").touch()
+
+
+def {name}():
+    return "{result}"
+
+
+PLUGIN_HOOKS = {{"{name}": {name}}}
+PLUGIN_PHRASES = {{"run {name}": "{name}"}}
+"""
+
+
+def write_plugin(root: Path, name: str, result: str = "ok") -> Path:
+    path = root / f"{name}.py"
+    path.write_text(PLUGIN.format(name=name, result=result), encoding="utf-8")
+    return path
+
+
+def test_hooks_import_plugin_on_first_call(tmp_path: Path) -> None:
+    path = write_plugin(tmp_path, "alpha")
+    engine = AutomationEngine()
+
+    hooks = engine.load_plugins(str(tmp_path))
+    assert isinstance(hooks["alpha"], LazyHook)
+    assert engine.plugin_phrases == {"run alpha": "alpha"}
+    assert not path.with_suffix(".imported").exists()
+
+    assert hooks["alpha"]() == "ok"
+    assert path.with_suffix(".imported").exists()
+    engine.shutdown()
+
+
+def test_manifest_reuses_unchanged_entries(tmp_path: Path) -> None:
+    write_plugin(tmp_path, "alpha")
+    beta = write_plugin(tmp_path, "beta")
+    first = PluginCatalog(tmp_path)
+    first.refresh()
+    assert first.scanned == 2
+
+    warm = PluginCatalog(tmp_path)
+    assert warm.refresh() == []
+    assert warm.scanned == 0
+
+    write_plugin(tmp_path, "beta", result="changed!")
+    stat = beta.stat()
+    os.utime(beta, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert warm.refresh() == [str(beta)]
+    assert warm.scanned == 1
+    assert warm.hooks()["beta"]() == "changed!"
+
+
+def test_dynamic_plugin_falls_back_to_import(tmp_path: Path) -> None:
+    (tmp_path / "dynamic.py").write_text(
+        "PLUGIN_HOOKS = {name: (lambda name=name: name) for name in ['x', 'y']}\n", encoding="utf-8"
+    )
+    catalog = PluginCatalog(tmp_path)
+    catalog.refresh()
+    hooks = catalog.hooks()
+    assert sorted(hooks) == ["x", "y"]
+    assert hooks["y"]() == "y"
@@ -0,0 +1,96 @@
+import time
+from typing import List, Tuple
+
+import pytest
+
+from assistant.core.events import AssistantEvent
+from assistant.core.power import DEFAULT_PROFILES, ActivityGovernor, PowerTier, TierProfile
+from assistant.input.voice_input import VoiceInputService
+
+
+class ListBus:
+    def __init__(self) -> None:
+        self.events: List[AssistantEvent] = []
+
+    def publish(self, event: AssistantEvent) -> None:
+        self.events.append(event)
+
+
+class RecordingService:
+    def __init__(self) -> None:
+        self.tiers: List[Tuple[PowerTier, TierProfile]] = []
+
+    def set_tier(self, tier: PowerTier, profile: TierProfile) -> None:
+        self.tiers.append((tier, profile))
+
+
+def test_governor_steps_down_on_inactivity_and_wakes_on_activity() -> None:
+    now = [0.0]
+    cpu = [0.0]
+    bus = ListBus()
+    governor = ActivityGovernor(
+        bus, idle_after=30, sleep_after=300, clock=lambda: now[0], cpu_clock=lambda: cpu[0]  # type: ignore[arg-type]
+    )
+    service = RecordingService()
+    governor.register(service)
+
+    now[0], cpu[0] = 29.0, 2.9
+    assert governor.tick() is PowerTier.ACTIVE
+    now[0], cpu[0] = 30.0, 3.0
+    assert governor.tick() is PowerTier.IDLE
+    now[0], cpu[0] = 300.0, 5.7
+    assert governor.tick() is PowerTier.SLEEP
+    now[0], cpu[0] = 400.0, 6.7
+    governor.activity("motion")
+    governor.activity("gesture")
+
+    assert [tier for tier, _ in service.tiers] == [PowerTier.ACTIVE, PowerTier.IDLE, PowerTier.SLEEP, PowerTier.ACTIVE]
+    assert service.tiers[2][1].motion_only
+    assert [(e.payload["tier"], e.payload["reason"]) for e in bus.events] == [
+        ("idle", "inactivity"),
+        ("sleep", "inactivity"),
+        ("active", "motion"),
+    ]
+    usage = governor.usage()
+    assert usage[PowerTier.ACTIVE].cpu_percent == pytest.approx(10.0)
+    assert usage[PowerTier.IDLE].cpu_percent == pytest.approx(1.0)
+    assert usage[PowerTier.SLEEP].wall_seconds == pytest.approx(100.0)
+
+
+def test_motion_detector_ignores_noise_and_fires_on_movement() -> None:
+    np = pytest.importorskip("numpy")
+    from assistant.input.motion import MotionDetector
+
+    rng = np.random.default_rng(0)
+    background = rng.integers(0, 200, size=(480, 640, 3), dtype=np.uint8)
+    detector = MotionDetector()
+
+    assert not detector.update(background)
+    noisy = np.clip(background.astype(np.int16) + rng.integers(-8, 9, size=background.shape), 0, 255).astype(np.uint8)
+    assert not detector.update(noisy)
+    moved = noisy.copy()
+    moved[200:320, 260:380] = 255
+    assert detector.update(moved)
+    assert detector.score > 0.01
+
+
+def test_google_voice_loop_pauses_between_silent_listens_in_lower_tiers() -> None:
+    service = VoiceInputService(ListBus())  # type: ignore[arg-type]
+
+    def listen_times(tier: PowerTier, profile: TierProfile) -> List[float]:
+        service.set_tier(tier, profile)
+        service._stop.clear()
+        listens: List[float] = []
+
+        def listen() -> None:
+            listens.append(time.monotonic())
+            if len(listens) == 4:
+                service._stop.set()
+            raise TimeoutError("nothing heard")
+
+        service._phrase_loop(listen, str, bytes, (TimeoutError,))
+        return [later - earlier for earlier, later in zip(listens, listens[1:])]
+
+    assert min(listen_times(PowerTier.IDLE, TierProfile(listen_pause=0.1))) >= 0.09
+    assert max(listen_times(PowerTier.ACTIVE, DEFAULT_PROFILES[PowerTier.ACTIVE])) < 0.05
+    assert DEFAULT_PROFILES[PowerTier.SLEEP].listen_pause > DEFAULT_PROFILES[PowerTier.IDLE].listen_pause > 0
@@ -0,0 +1,62 @@
+from pathlib import Path
+
+import pytest
+
+from assistant.core.config import AssistantConfig
+from assistant.core.events import AssistantEvent
+from assistant.core.service_manager import ServiceManager
+from assistant.input.asr import SAMPLE_RATE
+from assistant.input.gesture_debounce import GestureDebouncer
+from assistant.replay.driver import Pacer, ReplayAudioSource
+from assistant.replay.recording import Recorder, RecordKind, read_recording
+
+
+def test_recording_round_trip_and_truncated_tail(tmp_path: Path) -> None:
+    path = tmp_path / "session.mdrc"
+    recorder = Recorder(path, sample_rate=16000)
+    recorder.event(AssistantEvent("voice.text", {"text": "open browser", "utterance_id": 1}, "voice"))
+    recorder.audio(b"\x01\x00" * 480)
+    hand = [(0.1 * n, 0.5, 0.0) for n in range(21)]
+    recorder.landmarks(hand)
+    recorder.landmarks(None)
+    recorder.close()
+
+    records = list(read_recording(path))
+    assert [record.kind for record in records] == [
+        RecordKind.META,
+        RecordKind.EVENT,
+        RecordKind.AUDIO,
+        RecordKind.LANDMARKS,
+        RecordKind.LANDMARKS,
+    ]
+    assert records[0].json() == {"sample_rate": 16000}
+    assert records[1].json()["payload"]["text"] == "open browser"
+    decoded = records[3].landmarks()
+    assert [value for point in decoded for value in point] == pytest.approx([value for point in hand for value in point])
+    assert len(records[3].body) == 21 * 3 * 4
+    assert records[4].landmarks() is None
+    assert records == sorted(records, key=lambda record: record.t)
+
+    path.write_bytes(path.read_bytes()[:-100])
+    assert len(list(read_recording(path))) == 3
+
+
+def test_replay_audio_source_reframes_recorded_chunks() -> None:
+    chunks = [(0.0, b"\x01\x00" * 300), (0.01, b"\x02\x00" * 300)]
+    source = ReplayAudioSource(chunks, 16000, Pacer(speed=100.0))
+    assert source.read(480) == b"\x01\x00" * 300 + b"\x02\x00" * 180
+    assert source.read(480) == b"\x02\x00" * 120
+    assert source.read(480) == b""
+
+
+def test_replay_factories_reach_the_supervised_and_tiered_services() -> None:
+    source = ReplayAudioSource([], SAMPLE_RATE, Pacer(1.0))
+    manager = ServiceManager(
+        AssistantConfig(hot_reload=False), audio_source_factory=lambda: source, debouncer_factory=GestureDebouncer
+    )
+    assert manager.voice._source_factory() is source  # type: ignore[misc]
+    assert manager.supervisor is not None and manager.power is not None
+    assert manager.supervisor._services["voice"].service is manager.voice
+    assert manager.supervisor._services["gesture"].service is manager.gesture
+    assert manager.voice in manager.power._services and manager.gesture in manager.power._services
+    manager.automation.shutdown()
@@ -0,0 +1,202 @@
+import json
+from concurrent.futures import Future
+from pathlib import Path
+from typing import List
+
+from assistant.automation.pipeline import StepStatus
+from assistant.commands.parser import CommandIntent
+from assistant.core.config import AssistantConfig
+from assistant.core.events import AssistantEvent
+from assistant.core.service_manager import ServiceManager
+
+
+class RecordingFeedback:
+    def __init__(self) -> None:
+        self.spoken: List[str] = []
+
+    def speak(self, text: str, urgent: bool = False) -> None:
+        self.spoken.append(text)
+
+    def speak_async(self, text: str, urgent: bool = False) -> "Future[bool]":
+        self.speak(text, urgent)
+        future: "Future[bool]" = Future()
+        future.set_result(True)
+        return future
+
+    def notify(self, msg: object) -> None:
+        pass
+
+
+def _manager() -> tuple[ServiceManager, List[CommandIntent]]:
+    manager = ServiceManager(AssistantConfig())
+    manager.feedback = RecordingFeedback()  # type: ignore[assignment]
+    dispatched: List[CommandIntent] = []
+    for name in ("open_browser", "open_file"):
+        manager.router.register(name, dispatched.append)
+    return manager, dispatched
+
+
+def _voice(event_type: str, text: str, utterance_id: int) -> AssistantEvent:
+    return AssistantEvent(event_type, {"text": text, "utterance_id": utterance_id, "speech_started": 0.0}, "voice")
+
+
+def test_partial_transcript_dispatches_before_phrase_ends() -> None:
+    manager, dispatched = _manager()
+    manager._on_voice_partial(_voice("voice.partial", "open", 1))
+    manager._on_voice_partial(_voice("voice.partial", "open browser", 1))
+    manager._on_voice_partial(_voice("voice.partial", "open browser please", 1))
+    manager._on_voice_text(_voice("voice.text", "open browser please", 1))
+
+    assert [intent.name for intent in dispatched] == ["open_browser"]
+    assert manager.feedback.spoken == ["Done: open_browser"]  # type: ignore[attr-defined]
+
+
+def test_argument_intents_wait_for_final_transcript() -> None:
+    manager, dispatched = _manager()
+    manager._on_voice_partial(_voice("voice.partial", "open file /tmp", 2))
+    manager._on_voice_text(_voice("voice.text", "open file /tmp/notes.txt", 2))
+
+    assert dispatched == [CommandIntent(name="open_file", argument="/tmp/notes.txt")]
+
+
+def test_reload_applies_config_and_swaps_plugins(tmp_path: Path) -> None:
+    plugins = tmp_path / "plugins"
+    plugins.mkdir()
+    (plugins / "greet.py").write_text(
+        "def hello():\n    return 'v1'\n\nPLUGIN_HOOKS = {'hello': hello}\nPLUGIN_PHRASES = {'say hello': 'hello'}\n",
+        encoding="utf-8",
+    )
+    config_path = tmp_path / "config.json"
+    config_path.write_text(json.dumps({"plugin_dir": str(plugins)}), encoding="utf-8")
+    manager = ServiceManager(AssistantConfig.load(config_path), config_path=config_path)
+    rates: List[int] = []
+    manager.feedback.set_speech_rate = rates.append  # type: ignore[method-assign]
+    manager.configure()
+    assert manager.router.submit(manager.parser.parse("say hello")).result(timeout=1.0) == "v1"
+
+    config_path.write_text(
+        json.dumps({"plugin_dir": str(plugins), "speech_rate": 150, "command_map": {"greet me": "hello"}}),
+        encoding="utf-8",
+    )
+    applied = manager.reload_config()
+    assert sorted(applied) == ["command_map", "speech_rate"]
+    assert rates == [150]
+    assert manager.parser.parse("greet me") == CommandIntent(name="hello")
+
+    (plugins / "greet.py").write_text(
+        "def hi():\n    return 'v2'\n\nPLUGIN_HOOKS = {'hi': hi}\nPLUGIN_PHRASES = {'say hi': 'hi'}\n", encoding="utf-8"
+    )
+    assert manager.reload_plugins()
+    assert "hello" not in manager.router.names()
+    assert manager.router.submit(manager.parser.parse("say hi")).result(timeout=1.0) == "v2"
+    manager.automation.shutdown()
+
+
+def test_failed_reload_changes_nothing(tmp_path: Path) -> None:
+    config_path = tmp_path / "config.json"
+    config_path.write_text(json.dumps({"plugin_dir": str(tmp_path)}), encoding="utf-8")
+    manager = ServiceManager(AssistantConfig.load(config_path), config_path=config_path)
+    rates: List[int] = []
+    events: List[AssistantEvent] = []
+    manager.feedback.set_speech_rate = rates.append  # type: ignore[method-assign]
+    manager.bus.publish = events.append  # type: ignore[method-assign]
+    manager.configure()
+
+    # An invalid pipeline is caught before the valid speech_rate change is applied.
+    bad_pipeline = {"broken": [{"name": "a", "action": "no_such_action"}]}
+    config_path.write_text(
+        json.dumps({"plugin_dir": str(tmp_path), "speech_rate": 150, "pipelines": bad_pipeline}), encoding="utf-8"
+    )
+    assert manager.reload_config() == {}
+    assert rates == []
+    assert manager.config.speech_rate == 180
+
+    # A failure while applying rolls back the fields applied before it.
+    def reject(_: float) -> None:
+        raise RuntimeError("camera busy")
+
+    manager.gesture.set_min_confidence = reject  # type: ignore[method-assign]
+    config_path.write_text(
+        json.dumps({"plugin_dir": str(tmp_path), "speech_rate": 150, "gesture_confidence": 0.9}), encoding="utf-8"
+    )
+    assert manager.reload_config() == {}
+    assert rates == [150, 180]
+    assert (manager.config.speech_rate, manager.config.gesture_confidence) == (180, 0.6)
+    errors = [event.payload["error"] for event in events if event.event_type == "config.error"]
+    assert len(errors) == 2 and errors[1] == "camera busy"
+    manager.automation.shutdown()
+
+
+def test_voice_command_is_traced_end_to_end() -> None:
+    manager, _ = _manager()
+    manager._on_voice_text(_voice("voice.text", "open browser", 3))
+
+    summary = manager.tracer.summary()
+    for stage in ("parse", "dispatch/open_browser", "execute/open_browser", "end_to_end/open_browser", "feedback"):
+        assert summary[stage]["count"] == 1, stage
+
+
+def test_fuzzy_match_waits_for_final_transcript() -> None:
+    manager, dispatched = _manager()
+    manager._on_voice_partial(_voice("voice.partial", "opun browser", 3))
+    assert dispatched == []
+
+    manager._on_voice_text(_voice("voice.text", "opun browser", 3))
+    assert [(intent.name, intent.confidence < 1.0) for intent in dispatched] == [("open_browser", True)]
+
+
+def test_compound_command_runs_as_batch_with_one_confirmation() -> None:
+    manager, dispatched = _manager()
+    manager.router.register("play_music", dispatched.append)
+    # The first command already ran from a partial transcript; the rest follow as one batch.
+    manager._on_voice_partial(_voice("voice.partial", "open browser and", 4))
+    manager._on_voice_text(_voice("voice.text", "open browser and then play music and open file a.txt", 4))
+
+    assert [intent.name for intent in dispatched] == ["open_browser", "play_music", "open_file"]
+    assert manager.feedback.spoken == [  # type: ignore[attr-defined]
+        "Done: open_browser",
+        "Done: play_music and open_file",
+    ]
+
+
+def test_compound_command_runs_the_rest_when_a_later_step_already_ran() -> None:
+    manager, dispatched = _manager()
+    manager.router.register("play_music", dispatched.append)
+    # The partial heard only "play music"; the final transcript puts it second.
+    manager._on_voice_partial(_voice("voice.partial", "play music", 5))
+    manager._on_voice_text(_voice("voice.text", "open browser and then play music and open file a.txt", 5))
+
+    assert [intent.name for intent in dispatched] == ["play_music", "open_browser", "open_file"]
+    assert manager.feedback.spoken == [  # type: ignore[attr-defined]
+        "Done: play_music",
+        "Done: open_browser and open_file",
+    ]
+
+
+def test_batch_orders_steps_and_skips_after_failure() -> None:
+    manager = ServiceManager(AssistantConfig(power_idle_after=None, hot_reload=False))
+    router = manager.router
+    ran: List[str] = []
+
+    def fail(_: CommandIntent) -> None:
+        raise RuntimeError("no window")
+
+    router.register("open_browser", lambda intent: ran.append(intent.name))
+    router.register("play_music", lambda intent: ran.append(intent.name))
+    router.register("switch_window", fail)
+    batch = [
+        (router.resolve(CommandIntent("open_browser")), False),
+        (router.resolve(CommandIntent("play_music")), False),
+        (router.resolve(CommandIntent("switch_window")), True),
+        (router.resolve(CommandIntent("type_text", "hi")), True),
+    ]
+    result = manager.submit_batch(batch).result(timeout=1)
+
+    assert ran == ["open_browser", "play_music"]
+    assert {name: step.status for name, step in result.steps.items()} == {
+        "1:open_browser": StepStatus.SUCCEEDED,
+        "2:play_music": StepStatus.SUCCEEDED,
+        "3:switch_window": StepStatus.FAILED,
+        "4:type_text": StepStatus.SKIPPED,
+    }
+    manager.automation.shutdown()
@@ -0,0 +1,89 @@
+import importlib
+import sys
+import time
+from pathlib import Path
+from threading import Event
+from typing import Any, List
+
+from assistant.core.config import AssistantConfig
+from assistant.core.events import AssistantEvent
+from assistant.core.service_manager import ServiceManager
+from assistant.core.startup import StartupProfile
+from assistant.feedback.feedback import FeedbackManager
+
+
+class SilentEngine:
+    def say(self, text: str) -> None:
+        pass
+
+    def runAndWait(self) -> None:  # noqa: N802
+        pass
+
+    def stop(self) -> None:
+        pass
+
+    def setProperty(self, name: str, value: Any) -> None:  # noqa: N802
+        pass
+
+
+def test_profile_times_stages_and_imports(tmp_path: Path, monkeypatch: Any) -> None:
+    (tmp_path / "slow_startup_module.py").write_text("import time\ntime.sleep(0.02)\n", encoding="utf-8")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    profile = StartupProfile()
+    profile.time_imports()
+    try:
+        with profile.stage("imports"):
+            module = importlib.import_module("slow_startup_module")
+    finally:
+        profile.stop_timing_imports()
+        sys.modules.pop("slow_startup_module", None)
+
+    assert type(module.__loader__).__name__ == "SourceFileLoader"
+    name, seconds = profile.imports(top=1)[0]
+    assert name == "slow_startup_module" and seconds >= 0.02
+    assert [stage for stage, _, _ in profile.stages()] == ["imports"]
+    assert "slow_startup_module" in profile.report()
+
+
+def test_commands_arriving_during_startup_are_replayed() -> None:
+    manager = ServiceManager(AssistantConfig(power_idle_after=None))
+    dispatched: List[str] = []
+    manager._configure_core()
+    manager.router.register("open_browser", lambda intent: dispatched.append(intent.name))
+    manager.bus.start()
+    try:
+        manager.bus.publish(AssistantEvent("voice.text", {"text": "open browser"}, "voice"))
+        for _ in range(200):
+            if manager._gate._held:
+                break
+            time.sleep(0.005)
+        assert dispatched == []
+        manager._load_extensions()
+        assert dispatched == ["open_browser"]
+    finally:
+        manager.bus.stop()
+        manager.automation.shutdown()
+
+
+def test_services_report_readiness_before_the_announcement() -> None:
+    manager = ServiceManager(AssistantConfig(power_idle_after=None, hot_reload=False))
+    manager.feedback = FeedbackManager(engine=SilentEngine(), desktop_notifications=False)
+    # Stand-ins for the camera and microphone threads.
+    manager.voice.start = lambda: manager._service_ready("voice")  # type: ignore[method-assign]
+    manager.gesture.start = lambda: manager._service_ready("gesture", False)  # type: ignore[method-assign]
+    events: List[AssistantEvent] = []
+    ready = Event()
+    manager.bus.subscribe("service.ready", events.append)
+    manager.bus.subscribe("assistant.ready", lambda _: ready.set())
+    manager.start()
+    try:
+        assert ready.wait(timeout=5.0)
+    finally:
+        manager.stop()
+    assert sorted((event.payload["service"], event.payload["ok"]) for event in events) == [
+        ("commands", True),
+        ("feedback", True),
+        ("gesture", False),
+        ("voice", True),
+    ]
+    assert [stage for stage, _, _ in manager.startup.stages()][:2] == ["init", "core"]
@@ -0,0 +1,133 @@
+import threading
+import time
+from typing import Any, List, Tuple
+
+import pytest
+
+from assistant.core.events import AssistantEvent
+from assistant.core.supervisor import Backoff, ServiceState, Supervisor
+from assistant.input.capture import GesturePipeline, InferenceScheduler
+from assistant.input.voice_input import VoiceInputService
+
+
+class ListBus:
+    def __init__(self) -> None:
+        self.events: List[AssistantEvent] = []
+
+    def publish(self, event: AssistantEvent) -> None:
+        self.events.append(event)
+
+
+class Idle:
+    def start(self) -> None:
+        pass
+
+    def stop(self) -> None:
+        pass
+
+
+class DeadCamera:
+    """A camera that opened but never delivers a frame, like an unplugged USB device."""
+
+    def __init__(self) -> None:
+        self.reads = 0
+
+    def read(self) -> Tuple[bool, Any]:
+        self.reads += 1
+        return False, None
+
+    def release(self) -> None:
+        pass
+
+
+def _wait_for(condition: Any, timeout: float = 3.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return condition()
+
+
+def test_stalled_camera_backs_off_and_fails_the_scheduler() -> None:
+    camera = DeadCamera()
+    pipeline = GesturePipeline(camera, lambda image, roi: None, lambda *_: None, stall_timeout=0.5)
+
+    started = time.monotonic()
+    with pytest.raises(TimeoutError):
+        InferenceScheduler([pipeline]).run(threading.Event())
+
+    assert 0.5 <= time.monotonic() - started < 2.0
+    # Backed off between reads instead of spinning on the dead device.
+    assert camera.reads < 30
+    assert isinstance(pipeline.error, TimeoutError)
+
+
+def test_failing_service_restarts_with_backoff_then_opens_the_circuit() -> None:
+    starts: List[float] = []
+    bus = ListBus()
+    supervisor = Supervisor(
+        bus,  # type: ignore[arg-type]
+        backoff=Backoff(initial=0.05, maximum=0.2, jitter=0.0),
+        failure_threshold=4,
+        cooldown=60.0,
+    )
+
+    class Broken:
+        def start(self) -> None:
+            starts.append(time.monotonic())
+            threading.Thread(target=supervisor.exited, args=("camera", OSError("device gone"))).start()
+
+        def stop(self) -> None:
+            pass
+
+    supervisor.add("camera", Broken())
+    supervisor.start()
+    try:
+        Broken().start()
+        assert _wait_for(lambda: supervisor.health()["camera"].state is ServiceState.OPEN)
+        time.sleep(0.2)
+    finally:
+        supervisor.stop()
+
+    health = supervisor.health()["camera"]
+    assert (health.failures, health.restarts, health.circuit_opens) == (4, 3, 1)
+    assert health.last_error == "OSError: device gone"
+    gaps = [later - earlier for earlier, later in zip(starts, starts[1:])]
+    assert len(gaps) == 3
+    assert gaps[0] >= 0.045 and gaps[1] >= 0.095 and gaps[2] >= 0.19
+    assert bus.events[-1].payload["state"] == "open"
+
+
+def test_missing_backend_opens_the_circuit_at_once() -> None:
+    supervisor = Supervisor(backoff=Backoff(initial=0.01), cooldown=60.0)
+    supervisor.add("voice", Idle())
+    supervisor.exited("voice", ImportError("No module named 'vosk'"))
+    assert supervisor.health()["voice"].state is ServiceState.OPEN
+
+
+def test_supervised_voice_service_with_failing_microphone_does_not_spin() -> None:
+    opens: List[float] = []
+
+    def microphone() -> Any:
+        opens.append(time.monotonic())
+        raise OSError("no input device")
+
+    supervisor = Supervisor(backoff=Backoff(initial=0.05, jitter=0.0), failure_threshold=3, cooldown=60.0)
+    service = VoiceInputService(
+        ListBus(),  # type: ignore[arg-type]
+        backend="vosk",
+        source_factory=microphone,
+        recognizer_factory=lambda _: object(),
+        on_exit=lambda error: supervisor.exited("voice", error),
+    )
+    supervisor.add("voice", service)
+    supervisor.start()
+    try:
+        service.start()
+        assert _wait_for(lambda: supervisor.health()["voice"].state is ServiceState.OPEN)
+        time.sleep(0.3)
+    finally:
+        supervisor.stop()
+        service.stop()
+
+    assert len(opens) == 3
+    assert supervisor.health()["voice"].restarts == 2
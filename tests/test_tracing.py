@@ -0,0 +1,66 @@
+import json
+import random
+import threading
+import urllib.request
+from pathlib import Path
+
+from assistant.core import tracing
+from assistant.core.config import AssistantConfig
+from assistant.core.events import AssistantEvent, EventBus
+from assistant.core.service_manager import ServiceManager
+from assistant.core.tracing import Histogram, Tracer
+
+
+def test_histogram_quantiles_within_bucket_error() -> None:
+    rng = random.Random(7)
+    samples = sorted(rng.uniform(0.001, 0.2) for _ in range(5000))
+    histogram = Histogram()
+    for sample in samples:
+        histogram.record(sample)
+
+    for q in (0.5, 0.95, 0.99):
+        exact = samples[int(q * len(samples)) - 1]
+        assert abs(histogram.quantile(q) - exact) / exact < 0.2
+    assert histogram.count == 5000
+    assert histogram.max == samples[-1]
+
+
+def test_bus_records_queue_wait_per_trace(tmp_path: Path) -> None:
+    sink = tmp_path / "spans.jsonl"
+    previous = tracing.use_tracer(Tracer(jsonl_path=str(sink)))
+    try:
+        bus = EventBus()
+        handled = threading.Event()
+        bus.subscribe("voice.text", lambda _: handled.set())
+        event = AssistantEvent("voice.text", {"text": "open browser"}, "voice")
+        bus.start()
+        bus.publish(event)
+        assert handled.wait(1.0)
+        bus.stop()
+        assert tracing.tracer().summary()["queue"]["count"] == 1
+    finally:
+        tracing.use_tracer(previous).close()
+
+    spans = [json.loads(line) for line in sink.read_text(encoding="utf-8").splitlines()]
+    assert [(span["trace_id"], span["stage"]) for span in spans] == [(event.trace_id, "queue")]
+
+
+def test_prometheus_endpoint_reports_stages_and_counters() -> None:
+    tracer = Tracer()
+    tracer.record(1, "execute", 0.020, intent="open_browser")
+    tracer.increment("intent_cache.hits", 3)
+    port = tracer.serve(0)
+    try:
+        body = urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics", timeout=2.0).read().decode("utf-8")
+    finally:
+        tracer.close()
+    assert 'assistant_stage_seconds{stage="execute",intent="open_browser",quantile="0.95"}' in body
+    assert "assistant_intent_cache_hits 3" in body
+
+
+def test_manager_restores_the_previous_tracer_on_shutdown() -> None:
+    previous = tracing.tracer()
+    manager = ServiceManager(AssistantConfig(power_idle_after=None, hot_reload=False))
+    assert tracing.tracer() is manager.tracer
+    manager._shutdown()
+    assert tracing.tracer() is previous
@@ -0,0 +1,134 @@
+from array import array
+from pathlib import Path
+from threading import Event
+from typing import Any, Callable, List, Optional, Tuple
+
+from assistant.core.events import AssistantEvent
+from assistant.input.asr import SAMPLE_RATE, StreamingVoicePipeline, WavFileSource, rms
+from assistant.input.voice_input import VoiceInputService
+from assistant.input.wake_word import WakeWordGate
+
+
+class LoudBurstDetector:
+    """Stand-in keyword spotter: a very loud frame plays the role of the wake word."""
+
+    def __init__(self) -> None:
+        self.frames = 0
+
+    def process(self, chunk: bytes) -> bool:
+        self.frames += 1
+        return rms(chunk) > 12000
+
+    def reset(self) -> None:
+        pass
+
+
+class CountingRecognizer:
+    def __init__(self) -> None:
+        self.utterances = 0
+        self.chunks = 0
+
+    def start_utterance(self) -> None:
+        self.utterances += 1
+
+    def accept(self, chunk: bytes) -> Optional[str]:
+        self.chunks += 1
+        return None
+
+    def finish(self) -> str:
+        return f"utterance {self.utterances}"
+
+
+def _run(path: Path, follow_up: float = 2.0) -> Tuple[StreamingVoicePipeline, CountingRecognizer, LoudBurstDetector]:
+    recognizer, detector = CountingRecognizer(), LoudBurstDetector()
+    pipeline = StreamingVoicePipeline(
+        WavFileSource(path),
+        recognizer,
+        lambda *_: None,
+        lambda *_: None,
+        gate=WakeWordGate(detector, follow_up=follow_up),
+    )
+    pipeline.run(Event())
+    return pipeline, recognizer, detector
+
+
+def test_background_speech_never_reaches_recognizer(tone_wav: Callable[..., Path]) -> None:
+    segments = [(0.5, 0), (0.6, 6000)] * 6
+    pipeline, recognizer, detector = _run(tone_wav("background.wav", segments))
+
+    assert recognizer.utterances == 0
+    assert pipeline.stats.recognizer_seconds == 0
+    assert pipeline.stats.wake_activations == 0
+    # Only voiced frames are offered to the detector.
+    assert detector.frames < pipeline.stats.audio_seconds / 0.03 * 0.6
+
+
+def test_wake_word_opens_follow_up_window(tone_wav: Callable[..., Path]) -> None:
+    segments = [(0.5, 0), (0.3, 20000), (0.6, 6000), (0.8, 0), (0.6, 6000), (3.0, 0), (0.6, 6000), (0.8, 0)]
+    pipeline, recognizer, _ = _run(tone_wav("wake.wav", segments), follow_up=2.0)
+
+    assert pipeline.stats.wake_activations == 1
+    # The command following the wake word and the follow-up inside the window are transcribed;
+    # speech after the window has expired is not.
+    assert recognizer.utterances == 2
+    assert pipeline.stats.utterances == 2
+
+
+class ListBus:
+    def __init__(self) -> None:
+        self.events: List[AssistantEvent] = []
+
+    def publish(self, event: AssistantEvent) -> None:
+        self.events.append(event)
+
+
+def _phrase(amplitude: int, text: str) -> Tuple[bytes, str]:
+    """A captured phrase for the whole-phrase loop: half a second of samples and what Google would make of it."""
+    return array("h", [amplitude, -amplitude] * (SAMPLE_RATE // 4)).tobytes(), text
+
+
+def _run_phrases(
+    service: VoiceInputService, phrases: List[Tuple[bytes, str]], spotter: Any = None
+) -> Tuple[List[str], List[str]]:
+    transcribed: List[str] = []
+    pending = list(phrases)
+
+    def listen() -> Tuple[bytes, str]:
+        if len(pending) == 1:
+            service._stop.set()
+        return pending.pop(0)
+
+    def transcribe(audio: Tuple[bytes, str]) -> str:
+        transcribed.append(audio[1])
+        return audio[1]
+
+    service._phrase_loop(listen, transcribe, lambda audio: audio[0], (TimeoutError,), spotter)
+    published = [event.payload["text"] for event in service._bus.events if event.event_type == "voice.text"]
+    return transcribed, published
+
+
+def test_google_backend_only_transcribes_phrases_the_local_spotter_accepts() -> None:
+    bus = ListBus()
+    service = VoiceInputService(bus, wake_word="assistant", wake_follow_up=60.0)  # type: ignore[arg-type]
+    phrases = [
+        _phrase(6000, "what a day"),
+        _phrase(20000, "assistant open browser"),
+        _phrase(6000, "scroll down"),
+    ]
+
+    transcribed, published = _run_phrases(service, phrases, LoudBurstDetector())
+
+    # Background speech is never sent for transcription; the follow-up inside the window is.
+    assert transcribed == ["assistant open browser", "scroll down"]
+    assert published == ["open browser", "scroll down"]
+    assert [event.event_type for event in bus.events].count("voice.wake") == 1
+
+
+def test_wake_word_matches_whole_words_only() -> None:
+    service = VoiceInputService(ListBus(), wake_word="assistant")  # type: ignore[arg-type]
+    phrases = [_phrase(6000, "assistants are great"), _phrase(6000, "Assistant, open browser")]
+
+    transcribed, published = _run_phrases(service, phrases)
+
+    assert transcribed == ["assistants are great", "Assistant, open browser"]
+    assert published == ["open browser"]
@@ -0,0 +1,29 @@
+from pathlib import Path
+from typing import List
+
+from assistant.core.watcher import FileWatcher
+
+
+def test_poll_reports_added_modified_and_removed_files(tmp_path: Path) -> None:
+    plugin = tmp_path / "alpha.py"
+    plugin.write_text("A = 1\n", encoding="utf-8")
+    config = tmp_path / "config.json"
+    config.write_text("{}", encoding="utf-8")
+
+    plugin_changes: List[List[Path]] = []
+    config_changes: List[List[Path]] = []
+    watcher = FileWatcher()
+    watcher.watch(tmp_path, plugin_changes.append)
+    watcher.watch(config, config_changes.append)
+    assert watcher.poll() == 0
+
+    plugin.write_text("A = 22\n", encoding="utf-8")
+    (tmp_path / "beta.py").write_text("B = 2\n", encoding="utf-8")
+    config.write_text('{"speech_rate": 150}', encoding="utf-8")
+    assert watcher.poll() == 3
+    assert plugin_changes == [[plugin, tmp_path / "beta.py"]]
+    assert config_changes == [[config]]
+
+    plugin.unlink()
+    watcher.poll()
+    assert plugin_changes[-1] == [plugin]